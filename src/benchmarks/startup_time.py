@@ -0,0 +1,107 @@
+##
+# @file startup_time.py
+# @brief Measures how long the application takes to show its main window.
+#
+# @section file_author Author
+# - Created on 10/19/2026
+#
+# Each run starts a new Python process, so the imports are measured as
+# the user pays for them. The process reports when the modules are
+# imported, when the window is built and when the event loop first runs
+# after show(), which is when the window is first painted.
+#
+# Run from the src folder:
+#   python benchmarks/startup_time.py --runs 10
+#
+# The window reads its personas after it is shown, so the database is
+# not part of the measurement. STORAGE_BACKEND defaults to a throwaway
+# SQLite database so a missing MySQL server does not slow the runs.
+##
+
+##
+# Standard Imports
+##
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+import tempfile
+
+## Folder holding main.py and the modules package
+SRC_FOLDER = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Ran in the measured process. Times are seconds since the process was
+# created, so interpreter start up is included.
+_CHILD_SCRIPT = '''
+import os, sys, json, time
+start = time.perf_counter() - (time.time() - float(os.environ["STARTUP_BENCHMARK_EPOCH"]))
+sys.path.insert(0, os.getcwd())
+
+from PyQt5.QtCore import QTimer
+from PyQt5.QtWidgets import QApplication
+from modules.core.window import Window
+imported = time.perf_counter()
+
+app = QApplication(sys.argv)
+window = Window()
+built = time.perf_counter()
+window.show()
+
+def first_frame():
+    shown = time.perf_counter()
+    print(json.dumps({
+        "import": imported - start,
+        "build": built - start,
+        "first_window": shown - start,
+        "modules": len(sys.modules),
+    }), flush=True)
+    window.close()
+    app.quit()
+
+QTimer.singleShot(0, first_frame)
+app.exec_()
+'''
+
+def measure_once() -> dict:
+    '''! Starts the application in a new process and reads its timings.
+
+    @return Seconds until the modules were imported ("import"), the
+            window was built ("build") and first shown ("first_window"),
+            and the number of imported modules ("modules")
+    '''
+    env = dict(os.environ)
+    env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    env.setdefault('STORAGE_BACKEND', 'sqlite')
+    env.setdefault('SQLITE_PATH', os.path.join(tempfile.gettempdir(), 'startup_benchmark.sqlite3'))
+    env['STARTUP_BENCHMARK_EPOCH'] = repr(time.time())
+
+    result = subprocess.run(
+        [sys.executable, '-c', _CHILD_SCRIPT],
+        cwd=SRC_FOLDER, env=env, capture_output=True, text=True, timeout=120
+    )
+
+    for line in result.stdout.splitlines():
+        if line.startswith('{'):
+            return json.loads(line)
+
+    raise Exception(f'The application did not start:\n{result.stderr}')
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--runs', type=int, default=5, help='number of processes started')
+    args = parser.parse_args()
+
+    runs = [measure_once() for _ in range(args.runs)]
+
+    print(f'{"":>14}{"median":>10}{"min":>10}{"max":>10}')
+    for key in ('import', 'build', 'first_window'):
+        values = [run[key] * 1000 for run in runs]
+        print(f'{key:>14}{statistics.median(values):>8.0f}ms{min(values):>8.0f}ms{max(values):>8.0f}ms')
+
+    print(f'{"modules":>14}{runs[-1]["modules"]:>10}')
+
+if __name__ == '__main__':
+    main()
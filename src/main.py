@@ -14,6 +14,7 @@
 # - Modified on 10/19/2021
 # - Modified on 10/21/2021 by Connor DeCamp
 # - Modified on 10/24/2021 by Connor DeCamp
+# - Modified on 10/19/2026
 ##
 
 ##
@@ -27,10 +28,12 @@ import logging
 # Third Party Library Imports
 ##
 from PyQt5.QtWidgets import QApplication
+from dotenv import load_dotenv
 
 ##
 # User defined imports
 ##
+from modules.core.debug_log import start_logging
 from modules.core.window import Window
 
 APPLICATION_NAME = "CloudPlug Control"
@@ -39,8 +42,13 @@ APPLICATION_VERSION = "0.01"
 
 def main():
 
-    fmt = '[%(asctime)s | %(levelname)s]: %(message)s'
-    logging.basicConfig(level=logging.DEBUG, format=fmt, datefmt='%I:%M:%S')
+    # Settings such as CLOUDPLUG_INTERFACES and LOG_FILE can be given
+    # in the .env file
+    load_dotenv(dotenv_path='../.env')
+
+    # Log records are written to the console and the log file by a
+    # background thread
+    log_listener = start_logging(logging.DEBUG)
     logging.debug('Application started')
 
     # Create the Qt Application and an instance of the window class
@@ -54,7 +62,9 @@ def main():
     main_window.show()
 
 
-    sys.exit(app.exec_())
+    exit_code = app.exec_()
+    log_listener.stop()
+    sys.exit(exit_code)
 
     
 
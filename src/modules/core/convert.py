@@ -9,6 +9,7 @@
 # - Modified on 09/13/2021 by Connor DeCamp
 # - Modified on 10/14/2021 by Connor DeCamp
 # - Modified on 11/04/2021 by Connor DeCamp 
+# - Modified on 10/19/2026
 #
 # See SFF-8472 for tables that determine what each
 # value means in the memory map.
@@ -16,7 +17,6 @@
 
 from decimal import *
 from typing import List
-import binary_fractions
 
 def ieee754_to_decimal(b3: int, b2: int, b1: int, b0: int) -> Decimal:
     '''! Takes 4 bytes in IEEE 754 floating point format and converts it into a floating point
@@ -175,6 +175,9 @@ def unsigned_decimal_to_bytes(number: Decimal) -> List[int]:
     if number < 0 or number > 255.9961:
         raise ValueError("Invalid number received")
 
+    # Imported on first use, it is slow to import
+    import binary_fractions
+
     b = str(binary_fractions.Binary(number))
     b = b.strip("0b")
     b = b.split('.')
@@ -199,6 +202,8 @@ def float_to_signed_twos_complement_bytes(number: float) -> List[int]:
     if number < MIN or number > MAX:
         raise ValueError(f"Number must be in range [{MIN}, {MAX}]")
 
+    import binary_fractions
+
     bin_str = str(binary_fractions.TwosComplement(number))
     bin_str = bin_str.split('.')
 
@@ -18,7 +18,8 @@ from PyQt5.QtWidgets import QDialog, QErrorMessage
 from modules.core.convert import float_to_unsigned_decimal_bytes, temperature_bytes_to_signed_twos_complement_decimal
 
 from modules.core.create_stress_scenario_dialog_autogen import Ui_Dialog
-from modules.network.sql_connection import SQLConnection
+from modules.core.database_worker import get_database_worker
+from modules.database.repository import get_repository
 
 from modules.core.convert import float_to_signed_twos_complement_bytes
 
@@ -29,6 +30,42 @@ class SupportedParameters(Enum):
     RX_PWR = 3
     TX_PWR = 4
 
+## Names of the parameters, as listed in the parameter combobox
+PARAMETER_NAMES = {
+    SupportedParameters.TEMPERATURE: 'Temperature',
+    SupportedParameters.VCC: 'VCC',
+    SupportedParameters.TX_BIAS: 'TX Bias Current',
+    SupportedParameters.RX_PWR: 'RX Power',
+    SupportedParameters.TX_PWR: 'TX Power',
+}
+
+def parameter_value_bytes(parameter: SupportedParameters, value: float) -> List[int]:
+    '''! Converts a value entered by the user into the two bytes of the
+    diagnostic register of a parameter.
+
+    @param parameter The parameter the value is for
+    @param value The value in the units shown to the user
+    @return The [MSB, LSB] of the register
+    @exception ValueError If the value is out of range for the parameter
+    '''
+    if parameter == SupportedParameters.TEMPERATURE:
+        return float_to_signed_twos_complement_bytes(value)
+    elif parameter == SupportedParameters.VCC:
+        # User is entering values in Volts, so we have to
+        # convert to units of 100 uV, which is resolution
+        # stored in memory map. Essentially their value
+        # must be between [0, 6.5535] or it will not be
+        # submitted
+        return float_to_unsigned_decimal_bytes(value * 10000.0)
+    elif parameter == SupportedParameters.TX_BIAS:
+        # Entered value is mA, so we have to convert back to
+        # LSB of 2 uA. Divide by 2*10^-3 to convert back
+        return float_to_unsigned_decimal_bytes(value / float(2 * 10**-3))
+    elif parameter == SupportedParameters.RX_PWR or parameter == SupportedParameters.TX_PWR:
+        return float_to_unsigned_decimal_bytes(value / float(0.1 * 10**-3))
+
+    raise ValueError(f'{parameter} is not a supported parameter')
+
 class CreateStressScenarioDialog(QDialog, Ui_Dialog):
 
     refresh_stress_signal = pyqtSignal(int)
@@ -98,7 +135,6 @@ class CreateStressScenarioDialog(QDialog, Ui_Dialog):
         # Process the entries in the values line-edit
 
         MAX_SCENARIO_NAME_LEN = 255
-        NUM_VALUES_NEEDED = 10
 
         scenario_name = self.nameLineEdit.text()
 
@@ -113,95 +149,56 @@ class CreateStressScenarioDialog(QDialog, Ui_Dialog):
         value_str = self.valuesLineEdit.text()
         value_str_list = value_str.split(',')
 
-        if len(value_str_list) != NUM_VALUES_NEEDED:
-            e = QErrorMessage()
-            e.showMessage(
-                f"Expected {NUM_VALUES_NEEDED} values but got \
-                {len(value_str_list)} instead. Check for extra commas \
-                in your input!"
-            )
-            e.exec()
-            return
-
         try:
             float_values = [float(val) for val in value_str_list]
         except ValueError as ve:
             e = QErrorMessage()
-            e.showMessage(f"Check your formatting on the input! {ve}")
+            e.showMessage(f"Check your formatting on the input! Check for extra commas \
+                in your input! {ve}")
             e.exec()
             return
 
-        byte_list = []
-
         selected_index = self.parameterComboBox.currentIndex()
-        selected_index = SupportedParameters(selected_index)        
-
-        b1 = 0
-        b0 = 0
-
-        # Try to convert values:
-        try:
-            if selected_index == SupportedParameters.TEMPERATURE:
-                for val in float_values:
-                    b1, b0 = float_to_signed_twos_complement_bytes(val)
-            elif selected_index == SupportedParameters.VCC:
-                for val in float_values:
-                    # User is entering values in Volts, so we have to
-                    # convert to units of 100 uV, which is resolution
-                    # stored in memory map. Essentially their value
-                    # must be between [0, 6.5535] or it will not be 
-                    # submitted
-                        b1, b0 = float_to_unsigned_decimal_bytes(val * 10000.0)
-            elif selected_index == SupportedParameters.TX_BIAS:
-                for val in float_values:
-                    # Entered value is mA, so we have to convert back to
-                    # LSB of 2 uA. Divide by 2*10^-3 to convert back
-                    b1, b0 = float_to_unsigned_decimal_bytes(val / float(2 * 10**-3))
-            elif selected_index == SupportedParameters.RX_PWR or selected_index == SupportedParameters.TX_PWR:
-                for val in float_values:
-                    b1, b0 = float_to_unsigned_decimal_bytes(val / float(0.1 * 10**-3))
-        except ValueError:
-
-            # Conversion methods will raise ValueError if the input is
-            # invalid. Catch it and show the user an error message
-
-            error_msg = QErrorMessage()
-            error_msg.showMessage(f'{val} is not in the range [{self.low_bound:.04f},{self.high_bound:.04f}]')
-            error_msg.exec()
-            return
-
-        byte_list.append(b1)
-        byte_list.append(b0)
-
-        #print(byte_list)
-
-        # Now we need to convert each value into byte format
-        # This depends on the type of stress scenario the user
-        # is doing. It also depends on the calibration type!
-        #
-        # Temperature has to go to signed twos complement int
-
-        sql_connection = SQLConnection()
-        cursor = sql_connection.get_cursor()
-
-        query = 'INSERT INTO stress_scenarios (stress_id, sfp_id, scenario_name, `0`, `1`, `2`, `3`, `4`, `5`, `6`, `7`, `8`, `9`, `10`, `11`, `12`, `13`, `14`, `15`, `16`, `17`, `18`, `19`) VALUES (%s, %s, %s, '
-        
-        # We are inserting byte values
-        NUM_BYTES = NUM_VALUES_NEEDED * 2
-
-        for i in range(NUM_BYTES - 1):
-            query += "%s, "
-
-        query += "%s)"
-
-        values = (0, self.selected_sfp_id, str(self.nameLineEdit.text())) + tuple(byte_list)
-
-
-        #print(query, values)
-
-        cursor.execute(query, values)
-        sql_connection.close()
+        selected_index = SupportedParameters(selected_index)
+
+        # Each value is stored as the two bytes written to the
+        # diagnostic register of the parameter, so the scenario
+        # can hold any number of values.
+        waveform = bytearray()
+
+        for val in float_values:
+            try:
+                waveform += bytes(parameter_value_bytes(selected_index, val))
+            except ValueError:
+
+                # Conversion methods will raise ValueError if the input is
+                # invalid. Catch it and show the user an error message
+
+                error_msg = QErrorMessage()
+                error_msg.showMessage(f'{val} is not in the range [{self.low_bound:.04f},{self.high_bound:.04f}]')
+                error_msg.exec()
+                return
+
+        sfp_id = self.selected_sfp_id
+        scenario_name = str(self.nameLineEdit.text())
+        sample_period = self.samplePeriodSpinBox.value()
+
+        # The dialog closes once the scenario is stored
+        self.submitButton.setEnabled(False)
+        get_database_worker().submit(
+            lambda: get_repository().add_stress_scenario(
+                sfp_id, scenario_name, selected_index.value, sample_period, bytes(waveform)
+            ),
+            on_result=self._handle_scenario_stored,
+            on_error=self._handle_scenario_error
+        )
 
+    def _handle_scenario_stored(self, stress_id: int):
         self.refresh_stress_signal.emit(self.selected_sfp_id)
         self.close()
 
+    def _handle_scenario_error(self, error: Exception):
+        self.submitButton.setEnabled(True)
+
+        error_msg = QErrorMessage(self)
+        error_msg.showMessage(f'The stress scenario could not be stored! {error}')
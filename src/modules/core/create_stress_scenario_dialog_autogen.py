@@ -14,7 +14,7 @@ from PyQt5 import QtCore, QtGui, QtWidgets
 class Ui_Dialog(object):
     def setupUi(self, Dialog):
         Dialog.setObjectName("Dialog")
-        Dialog.resize(521, 175)
+        Dialog.resize(521, 205)
         self.gridLayout_3 = QtWidgets.QGridLayout(Dialog)
         self.gridLayout_3.setObjectName("gridLayout_3")
         self.label = QtWidgets.QLabel(Dialog)
@@ -57,7 +57,7 @@ class Ui_Dialog(object):
         self.gridLayout_3.addWidget(self.valuesLineEdit, 2, 1, 1, 1)
         self.submitButton = QtWidgets.QPushButton(Dialog)
         self.submitButton.setObjectName("submitButton")
-        self.gridLayout_3.addWidget(self.submitButton, 5, 0, 1, 2)
+        self.gridLayout_3.addWidget(self.submitButton, 6, 0, 1, 2)
         self.parameterComboBox = QtWidgets.QComboBox(Dialog)
         self.parameterComboBox.setObjectName("parameterComboBox")
         self.parameterComboBox.addItem("")
@@ -77,6 +77,19 @@ class Ui_Dialog(object):
         self.valueRangeLabel = QtWidgets.QLabel(Dialog)
         self.valueRangeLabel.setObjectName("valueRangeLabel")
         self.gridLayout_3.addWidget(self.valueRangeLabel, 4, 1, 1, 1)
+        self.label_6 = QtWidgets.QLabel(Dialog)
+        font = QtGui.QFont()
+        font.setBold(True)
+        font.setWeight(75)
+        self.label_6.setFont(font)
+        self.label_6.setObjectName("label_6")
+        self.gridLayout_3.addWidget(self.label_6, 5, 0, 1, 1)
+        self.samplePeriodSpinBox = QtWidgets.QSpinBox(Dialog)
+        self.samplePeriodSpinBox.setMinimum(1)
+        self.samplePeriodSpinBox.setMaximum(3600000)
+        self.samplePeriodSpinBox.setProperty("value", 1000)
+        self.samplePeriodSpinBox.setObjectName("samplePeriodSpinBox")
+        self.gridLayout_3.addWidget(self.samplePeriodSpinBox, 5, 1, 1, 1)
 
         self.retranslateUi(Dialog)
         QtCore.QMetaObject.connectSlotsByName(Dialog)
@@ -86,7 +99,7 @@ class Ui_Dialog(object):
         Dialog.setWindowTitle(_translate("Dialog", "Dialog"))
         self.label.setText(_translate("Dialog", "Parameter to Modify"))
         self.label_2.setText(_translate("Dialog", "Scenario Name"))
-        self.label_3.setText(_translate("Dialog", "10 Values, separated by a comma"))
+        self.label_3.setText(_translate("Dialog", "Values, separated by a comma"))
         self.label_4.setText(_translate("Dialog", "Values in units of:"))
         self.unitLabel.setText(_translate("Dialog", "C"))
         self.submitButton.setText(_translate("Dialog", "Submit"))
@@ -97,3 +110,4 @@ class Ui_Dialog(object):
         self.parameterComboBox.setItemText(4, _translate("Dialog", "TX Power"))
         self.label_5.setText(_translate("Dialog", "Value range:"))
         self.valueRangeLabel.setText(_translate("Dialog", "[-127.996, 127.996]"))
+        self.label_6.setText(_translate("Dialog", "Sample Period (ms)"))
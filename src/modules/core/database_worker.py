@@ -0,0 +1,140 @@
+##
+# @file database_worker.py
+# @brief Runs database queries off the GUI thread.
+#
+# @section file_author Author
+# - Created on 10/19/2026
+#
+# Widgets hand their queries to the DatabaseWorker as jobs. Each job runs
+# on one of the worker's threads and returns a future. When a job is done
+# its result is handed back to the GUI thread through a queued Qt signal,
+# so the callbacks can update widgets while the event loop never waits
+# on the database.
+##
+
+##
+# Standard Imports
+##
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional
+
+##
+# Third Party Library Imports
+##
+from PyQt5.QtCore import QObject, Qt, pyqtSignal
+
+class DatabaseWorker(QObject):
+    '''! Pool of threads that run database jobs.
+
+    @brief Usage:
+        worker.submit(repository.get_persona, persona_id,
+                      on_result=show_persona, on_error=show_error)
+
+    on_result and on_error are always called on the thread the worker was
+    created on, after submit() has returned. Errors of jobs without an
+    on_error callback are emitted with job_failed.
+    '''
+
+    ## Number of threads jobs are run on. Both repositories give each
+    # thread its own connection.
+    DEFAULT_THREADS = 2
+
+    ## Emitted with the error message of a job that had no on_error callback
+    job_failed = pyqtSignal(str)
+
+    ## Emitted from a worker thread with (future, on_result, on_error)
+    _job_done = pyqtSignal(object, object, object)
+
+    def __init__(self, threads: int = DEFAULT_THREADS, parent=None):
+        '''! Starts the worker threads.
+
+        @param threads The number of threads jobs are run on
+        @param parent The parent QObject
+        '''
+        super().__init__(parent)
+
+        self._executor = ThreadPoolExecutor(threads, thread_name_prefix='database')
+
+        # Jobs that are not done, so shutdown() can cancel the ones that
+        # have not started
+        self._futures = set()
+        self._futures_lock = threading.Lock()
+
+        # Queued even when a job finishes before submit() returns, so
+        # callbacks never run inside the caller
+        self._job_done.connect(self._deliver, Qt.QueuedConnection)
+
+    def submit(self, job: Callable, *args, on_result: Optional[Callable] = None,
+               on_error: Optional[Callable] = None) -> Future:
+        '''! Runs a job on a worker thread.
+
+        @param job The function to run
+        @param args The arguments of the function
+        @param on_result Called on the GUI thread with the return value of the job
+        @param on_error Called on the GUI thread with the exception the job raised
+        @return The Future of the job. Never wait on it from the GUI thread.
+        '''
+        future = self._executor.submit(job, *args)
+
+        with self._futures_lock:
+            self._futures.add(future)
+
+        future.add_done_callback(lambda done: self._job_finished(done, on_result, on_error))
+        return future
+
+    def _job_finished(self, future: Future, on_result: Optional[Callable], on_error: Optional[Callable]) -> None:
+        with self._futures_lock:
+            self._futures.discard(future)
+
+        self._job_done.emit(future, on_result, on_error)
+
+    def _deliver(self, future: Future, on_result: Optional[Callable], on_error: Optional[Callable]) -> None:
+        if future.cancelled():
+            return
+
+        # Widgets may have been closed while the job ran, so a failing
+        # callback is logged instead of taking down the event loop
+        try:
+            error = future.exception()
+            if error is None:
+                if on_result is not None:
+                    on_result(future.result())
+            elif on_error is not None:
+                on_error(error)
+            else:
+                logging.error(f'Database job failed: {error}')
+                self.job_failed.emit(f'Database error: {error}')
+        except Exception:
+            logging.exception('Handling the result of a database job failed')
+
+    def shutdown(self) -> None:
+        '''! Drops the jobs that have not started and stops the threads
+        once the running jobs are done.
+        '''
+        # shutdown(cancel_futures=True) needs Python 3.9, so the jobs are
+        # cancelled here. Running jobs can not be cancelled and finish.
+        with self._futures_lock:
+            futures = list(self._futures)
+
+        for future in futures:
+            future.cancel()
+
+        self._executor.shutdown(wait=False)
+
+## The process-wide worker
+_database_worker = None
+_database_worker_lock = threading.Lock()
+
+def get_database_worker() -> DatabaseWorker:
+    '''! Gets the process-wide database worker, starting it on first use.
+    It must first be used from the GUI thread.
+    '''
+    global _database_worker
+
+    with _database_worker_lock:
+        if _database_worker is None:
+            _database_worker = DatabaseWorker()
+
+    return _database_worker
@@ -0,0 +1,144 @@
+##
+# @file debug_log.py
+# @brief Batched debug log tab and the background log file.
+#
+# @section file_author Author
+# - Created on 10/19/2026
+#
+# Messages for the debug log tab are queued with their time and appended
+# to the text edit in one batch per timer tick, so a burst of network
+# events costs one append instead of one per message. The text edit keeps
+# only the latest MAX_BLOCKS lines.
+#
+# Log records are handed to a QueueListener, which writes them to the
+# console and the log file on its own thread.
+##
+
+##
+# Standard Imports
+##
+import os
+import sys
+import time
+import queue
+import logging
+import logging.handlers
+from collections import deque
+
+##
+# Third Party Library Imports
+##
+from PyQt5.QtCore import QObject, QTimer
+from PyQt5.QtWidgets import QPlainTextEdit
+
+## Format of log records on the console and in the log file
+LOG_FORMAT = '[%(asctime)s | %(levelname)s]: %(message)s'
+
+## Environment variable holding the path of the log file
+LOG_FILE_ENV_VAR = 'LOG_FILE'
+
+## Log file used when LOG_FILE_ENV_VAR is not set
+DEFAULT_LOG_FILE = 'cloudplug_control.log'
+
+## Size in bytes at which the log file is rotated
+MAX_LOG_FILE_BYTES = 5 * 1024 * 1024
+
+## Number of rotated log files kept
+LOG_FILE_BACKUPS = 3
+
+def start_logging(level: int = logging.DEBUG) -> logging.handlers.QueueListener:
+    '''! Sends the log records of the application to the console and the
+    log file. The records are only queued by the thread that logs them
+    and written by a background thread.
+
+    @param level The lowest level that is logged
+    @return The started QueueListener. Stop it before exiting so every
+            queued record is written.
+    '''
+    formatter = logging.Formatter(LOG_FORMAT, datefmt='%I:%M:%S')
+
+    handlers = [logging.StreamHandler(sys.stderr)]
+    log_file = os.getenv(LOG_FILE_ENV_VAR, DEFAULT_LOG_FILE)
+    if log_file:
+        handlers.append(logging.handlers.RotatingFileHandler(
+            log_file, maxBytes=MAX_LOG_FILE_BYTES, backupCount=LOG_FILE_BACKUPS, encoding='utf-8'
+        ))
+
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    records = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(records, *handlers, respect_handler_level=True)
+
+    root = logging.getLogger()
+    root.setLevel(level)
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(logging.handlers.QueueHandler(records))
+
+    listener.start()
+    return listener
+
+class DebugLog(QObject):
+    '''! Appends timestamped messages to a text edit in batches.
+
+    @brief Usage:
+        debug_log = DebugLog(self.plainTextEdit, parent=self)
+        debug_log.append('Client connected')
+    '''
+
+    ## Milliseconds between appends to the text edit
+    FLUSH_INTERVAL_MSEC = 250
+
+    ## Most lines kept in the text edit, the oldest are removed first
+    MAX_BLOCKS = 5000
+
+    def __init__(self, text_edit: QPlainTextEdit, parent=None):
+        '''! Initializes the log of a text edit.
+
+        @param text_edit The QPlainTextEdit the messages are shown in
+        @param parent The parent QObject
+        '''
+        super().__init__(parent)
+
+        self.text_edit = text_edit
+        self.text_edit.setMaximumBlockCount(self.MAX_BLOCKS)
+
+        # (time, message) not shown yet. More than MAX_BLOCKS would only
+        # be removed again by the text edit.
+        self._pending = deque(maxlen=self.MAX_BLOCKS)
+
+        # Messages logged within the same second share the formatted time
+        self._last_second = None
+        self._last_time_str = ''
+
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.timeout.connect(self.flush)
+
+    def append(self, text) -> None:
+        '''! Queues a message. It is shown within FLUSH_INTERVAL_MSEC.
+
+        @param text The message, converted with str() when it is shown
+        '''
+        self._pending.append((time.time(), text))
+
+        if not self.flush_timer.isActive():
+            self.flush_timer.start(self.FLUSH_INTERVAL_MSEC)
+
+    def flush(self) -> None:
+        '''! Appends every queued message to the text edit at once.'''
+        if not self._pending:
+            return
+
+        lines = [f'[{self._format_time(timestamp)}]: {text}' for timestamp, text in self._pending]
+        self._pending.clear()
+
+        self.text_edit.appendPlainText('\n'.join(lines))
+
+    def _format_time(self, timestamp: float) -> str:
+        second = int(timestamp)
+        if second != self._last_second:
+            self._last_second = second
+            self._last_time_str = time.strftime('%H:%M:%S', time.localtime(second))
+        return self._last_time_str
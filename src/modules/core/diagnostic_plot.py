@@ -7,12 +7,24 @@
 # @section mod_history Modification History
 # - Modified on 11/15/2021 by Connor DeCamp
 # - Modified on 11/23/2021 by Connor DeCamp
+# - Modified on 10/19/2026
+#
+# Samples are kept in a fixed-capacity ring buffer, so a plot costs the
+# same per sample no matter how long the monitor window stays open. The
+# time axis scrolls to show the latest window of samples.
+#
+# Longer histories are kept as minimums and maximums of ever larger
+# buckets of samples. Zooming out draws the finest of these levels that
+# has about one bucket per pixel, so drawing costs the same for a day of
+# samples as for a minute.
 ##
 
 ##
 # Standard imports
 ##
+import time
 from collections import namedtuple
+from typing import Optional, Tuple
 
 ##
 # Third party library imports
@@ -29,12 +41,191 @@ import pyqtgraph as pg
 DiagnosticData = namedtuple(
     "DiagnosticData",
     "temperature, vcc, tx_bias, tx_power, \
-    rx_power, laser_temperature, tec_current"
+    rx_power, laser_temperature, tec_current",
+    defaults=(None, None)
 )
 
+## Fields of DiagnosticData that are plotted, in plot order
+PLOTTED_FIELDS = ('temperature', 'vcc', 'tx_bias', 'tx_power', 'rx_power')
+
+class RingBuffer:
+    '''! Fixed-capacity buffer of the latest samples of several channels.
+
+    @brief Every sample is written twice, at its slot and at its slot plus
+    the capacity. The latest samples are then always contiguous, so view()
+    returns them without copying.
+    '''
+
+    def __init__(self, capacity: int, channels: int):
+        '''! Allocates the buffer.
+
+        @param capacity The number of samples kept
+        @param channels The number of values in a sample
+        '''
+        if capacity < 1:
+            raise ValueError('The capacity of a ring buffer must be at least 1')
+
+        self.capacity = capacity
+        self._data = np.zeros((channels, 2 * capacity))
+        self._next = 0
+        self._count = 0
+
+    def append(self, values) -> None:
+        '''! Adds a sample, dropping the oldest one when the buffer is full.
+
+        @param values One value per channel
+        '''
+        self._data[:, self._next] = values
+        self._data[:, self._next + self.capacity] = values
+
+        self._next = (self._next + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    def view(self) -> np.ndarray:
+        '''! Gets the kept samples, oldest first, as a (channels, samples)
+        view into the buffer. It is only valid until the next append().
+        '''
+        end = self._next + self.capacity if self._count == self.capacity else self._next
+        return self._data[:, end - self._count:end]
+
+    def clear(self) -> None:
+        self._next = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+class DecimationPyramid:
+    '''! Samples kept at several resolutions.
+
+    @brief Level 0 holds the samples themselves. Each bucket of factor
+    entries of a level is summarized in the next level by two entries, its
+    minimum and its maximum, both at the time the bucket starts. Levels
+    are updated as samples arrive, in constant time per sample on average.
+    '''
+
+    ## Entries of a level summarized by one bucket of the next level
+    DEFAULT_FACTOR = 4
+
+    ## Number of levels, including the samples
+    DEFAULT_LEVELS = 6
+
+    def __init__(self, capacity: int, channels: int, levels: int = DEFAULT_LEVELS,
+                 factor: int = DEFAULT_FACTOR):
+        '''! Allocates every level.
+
+        @param capacity The number of samples or buckets kept per level
+        @param channels The number of values in a sample. The first value
+                        is the time of the sample.
+        @param levels The number of levels, including the samples
+        @param factor The entries of a level summarized by one bucket
+        '''
+        self.factor = factor
+        self.levels = [RingBuffer(capacity, channels)] + \
+                      [RingBuffer(2 * capacity, channels) for _ in range(1, levels)]
+
+        # (entries, start time, minimums, maximums) of the unfinished
+        # bucket of each level
+        self._buckets = [None] * levels
+
+    def append(self, values) -> None:
+        '''! Adds a sample.
+
+        @param values The time of the sample followed by its values
+        '''
+        values = np.asarray(values, dtype=float)
+        self.levels[0].append(values)
+
+        level, start, minimum, maximum = 1, values[0], values[1:], values[1:]
+        while level < len(self.levels):
+            bucket = self._buckets[level]
+            if bucket is None:
+                self._buckets[level] = [1, start, minimum.copy(), maximum.copy()]
+                return
+
+            bucket[0] += 1
+            np.minimum(bucket[2], minimum, out=bucket[2])
+            np.maximum(bucket[3], maximum, out=bucket[3])
+            if bucket[0] < self.factor:
+                return
+
+            # The bucket is full, so it is added to this level and to the
+            # bucket of the next one
+            self._buckets[level] = None
+            _, start, minimum, maximum = bucket
+            self.levels[level].append(np.concatenate(([start], minimum)))
+            self.levels[level].append(np.concatenate(([start], maximum)))
+            level += 1
+
+    def select(self, start: float, end: float, max_points: int) -> Tuple[int, np.ndarray]:
+        '''! Gets the finest level that still holds the start of a time
+        range and has at most max_points entries in it.
+
+        @param start The first time of the range
+        @param end The last time of the range
+        @param max_points Most entries wanted, for example twice the
+                          pixel width of a plot
+        @return (level, its entries in the range). One entry on each side
+                of the range is included so that lines run to the edges.
+                The entries of the samples are a view into the buffer.
+        '''
+        for level, buffer in enumerate(self.levels):
+            entries = buffer.view()
+            times = entries[0]
+
+            first = int(np.searchsorted(times, start, 'left'))
+            last = int(np.searchsorted(times, end, 'right'))
+
+            # Once a level is full its oldest entries are dropped
+            holds_start = len(buffer) < buffer.capacity or (len(times) > 0 and times[0] <= start)
+
+            if (holds_start and last - first <= max_points) or level == len(self.levels) - 1:
+                entries = entries[:, max(first - 1, 0):last + 1]
+                if level == 0:
+                    return level, entries
+                return level, self._add_unfinished(level, entries)
+
+    def _add_unfinished(self, level: int, entries: np.ndarray) -> np.ndarray:
+        '''! Adds the samples that are not in a finished bucket of a level
+        yet to its entries, as one more minimum and maximum.
+        '''
+        unfinished = [bucket for bucket in self._buckets[1:level + 1] if bucket is not None]
+        if not unfinished:
+            return entries
+
+        # Higher levels hold older samples
+        start = unfinished[-1][1]
+        minimum = np.min([bucket[2] for bucket in unfinished], axis=0)
+        maximum = np.max([bucket[3] for bucket in unfinished], axis=0)
+
+        tail = np.column_stack((np.concatenate(([start], minimum)), np.concatenate(([start], maximum))))
+        return np.concatenate((entries, tail), axis=1)
+
+    def clear(self) -> None:
+        for buffer in self.levels:
+            buffer.clear()
+        self._buckets = [None] * len(self.levels)
+
 class DiagnosticPlotWidget(QWidget):
 
-    def __init__(self, parent=None):
+    ## Seconds of samples shown by default
+    DEFAULT_WINDOW_SECONDS = 30
+
+    ## Samples kept by default, an hour at one sample a second. Each
+    # coarser level keeps as many buckets.
+    DEFAULT_CAPACITY = 3600
+
+    ## Entries drawn per pixel of plot width
+    POINTS_PER_PIXEL = 2
+
+    def __init__(self, parent=None, window_seconds: float = DEFAULT_WINDOW_SECONDS,
+                 capacity: int = DEFAULT_CAPACITY):
+        '''! Creates the plots.
+
+        @param parent The parent widget
+        @param window_seconds Width of the time axis in seconds
+        @param capacity Number of samples kept
+        '''
         super().__init__(parent)
 
         self.main_layout = QGridLayout()
@@ -43,7 +234,6 @@ class DiagnosticPlotWidget(QWidget):
         pg.setConfigOption("foreground", "k")
 
         self.setWindowTitle("Diagnostic Plots")
-        self.setWindowModality(Qt.WindowModality.ApplicationModal)
 
         self.temperature_plot, self.temperature_plot_data = self._create_plot(
             "Module Temperature",
@@ -97,18 +287,28 @@ class DiagnosticPlotWidget(QWidget):
         self.main_layout.addWidget(self.vline2, 0, 3, 3, 1)
         self.setLayout(self.main_layout)
 
-        self.temperature_values = []
-        self.vcc_values = []
-        self.tx_bias_values = []
-        self.rx_power_values = []
-        self.tx_power_values= []
-
-        self.domain_limit = 30
-        self.temperature_plot.setXRange(0, self.domain_limit)
-        self.vcc_plot.setXRange(0, self.domain_limit)
-        self.tx_bias_plot.setXRange(0, self.domain_limit)
-        self.rx_power_plot.setXRange(0, self.domain_limit)
-        self.tx_power_plot.setXRange(0, self.domain_limit)
+        # Plots and their data in the order of PLOTTED_FIELDS
+        self._plots = [self.temperature_plot, self.vcc_plot, self.tx_bias_plot,
+                       self.tx_power_plot, self.rx_power_plot]
+        self._plot_data = [self.temperature_plot_data, self.vcc_plot_data, self.tx_bias_plot_data,
+                           self.tx_power_plot_data, self.rx_power_plot_data]
+
+        # Every plot shows the time range of the temperature plot. Only
+        # the time axis can be zoomed.
+        for plot in self._plots:
+            plot.setMouseEnabled(x=True, y=False)
+            if plot is not self.temperature_plot:
+                plot.setXLink(self.temperature_plot)
+        self.temperature_plot.sigXRangeChanged.connect(self._handle_x_range_changed)
+
+        # The first channel holds the time of each sample
+        self.history = DecimationPyramid(capacity, 1 + len(PLOTTED_FIELDS))
+        self.samples = self.history.levels[0]
+        self._start_time = None
+        self._level = 0
+        self._scrolling = False
+
+        self.set_window(window_seconds)
 
         ##
         # Plot ranges change
@@ -160,45 +360,92 @@ class DiagnosticPlotWidget(QWidget):
 
         return plot, plot_data
 
-    def handle_new_data(self, data: DiagnosticData):
-
-        self.temperature_values.append(data.temperature)
-        self.vcc_values.append(data.vcc)
-        self.tx_bias_values.append(data.tx_bias)
-        self.rx_power_values.append(data.rx_power)
-        self.tx_power_values.append(data.tx_power)
+    def set_window(self, window_seconds: float) -> None:
+        '''! Sets the width of the time axis. Zooming the time axis sets
+        it too.
 
-        num_vals = len(self.temperature_values)
+        @param window_seconds Seconds of samples shown
+        '''
+        self.window_seconds = window_seconds
 
-        if num_vals > self.domain_limit:
-            self.domain_limit += 30
-            self.temperature_plot.setXRange(0, self.domain_limit, padding=0)
-            self.vcc_plot.setXRange(0, self.domain_limit, padding=0)
-            self.tx_bias_plot.setXRange(0, self.domain_limit, padding=0)
-            self.rx_power_plot.setXRange(0, self.domain_limit, padding=0)
-            self.tx_power_plot.setXRange(0, self.domain_limit, padding=0)
+        if self.isVisible():
+            self._update_plots()
+        else:
+            self._scroll_time_axis(*self._time_range())
 
-        formatted_data = np.array([range(num_vals), self.temperature_values])
-        formatted_data = formatted_data.transpose()
-        self.temperature_plot_data.setData(formatted_data)
+    def handle_new_data(self, data: DiagnosticData, timestamp: Optional[float] = None):
+        '''! Adds a sample to the plots and draws them.
 
-        formatted_data = np.array([range(num_vals), self.vcc_values])
-        formatted_data = formatted_data.transpose()
-        self.vcc_plot_data.setData(formatted_data)
+        @param data The diagnostic values
+        @param timestamp Time of the sample in seconds, now by default
+        '''
+        self.add_sample(data, timestamp)
+        self.refresh()
 
-        formatted_data = np.array([range(num_vals), self.tx_bias_values])
-        formatted_data = formatted_data.transpose()
-        self.tx_bias_plot_data.setData(formatted_data)
+    def add_sample(self, data: DiagnosticData, timestamp: Optional[float] = None):
+        '''! Adds a sample without drawing it, see refresh().
 
-        formatted_data = np.array([range(num_vals), self.rx_power_values])
-        formatted_data = formatted_data.transpose()
-        self.rx_power_plot_data.setData(formatted_data)
+        @param data The diagnostic values
+        @param timestamp Time of the sample in seconds, now by default
+        '''
+        if timestamp is None:
+            timestamp = time.monotonic()
+        if self._start_time is None:
+            self._start_time = timestamp
 
-        formatted_data = np.array([range(num_vals), self.tx_power_values])
-        formatted_data = formatted_data.transpose()
-        self.tx_power_plot_data.setData(formatted_data)
+        self.history.append([timestamp - self._start_time] + [getattr(data, field) for field in PLOTTED_FIELDS])
 
-        self.timer.start(1000)
+    def refresh(self):
+        '''! Draws the samples added so far. Samples are kept while the
+        window is hidden, but only drawn while it is shown.
+        '''
+        if self.isVisible():
+            self._update_plots()
+
+    def _time_range(self) -> Tuple[float, float]:
+        '''! Gets the latest window of time.'''
+        latest = self.samples.view()[0, -1] if len(self.samples) else 0.0
+        start = max(0.0, latest - self.window_seconds)
+        return start, start + self.window_seconds
+
+    def _update_plots(self):
+        start, end = self._time_range()
+
+        width = int(self.temperature_plot.getViewBox().width())
+        level, entries = self.history.select(start, end, max(1, width) * self.POINTS_PER_PIXEL)
+
+        # Only samples are marked, buckets are drawn as plain lines
+        if level != self._level:
+            self._level = level
+            for plot_data in self._plot_data:
+                plot_data.setSymbol('o' if level == 0 else None)
+
+        for plot_data, values in zip(self._plot_data, entries[1:]):
+            plot_data.setData(entries[0], values)
+
+        self._scroll_time_axis(start, end)
+
+    def _scroll_time_axis(self, start: float, end: float):
+        '''! Shows a range of time on every plot.'''
+        self._scrolling = True
+        try:
+            self.temperature_plot.setXRange(start, end, padding=0)
+        finally:
+            self._scrolling = False
+
+    def _handle_x_range_changed(self, view_box, x_range):
+        # Zooming keeps following the latest samples with the new width
+        if self._scrolling:
+            return
+
+        self.set_window(x_range[1] - x_range[0])
+
+    ##
+    # PyQT overloaded function
+    ##
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._update_plots()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,107 @@
+##
+# @file eeprom_dump.py
+# @brief Reads and validates files holding the EEPROM memory map of an
+#        SFP module.
+#
+# @section file_author Author
+# - Created on 10/19/2026
+#
+# A dump is either binary or text:
+# - Binary dumps hold page 0xA0, optionally followed by page 0xA2. Dumps
+#   shorter than a page hold the start of page 0xA0, at least the base ID
+#   fields (bytes 0-63).
+# - Text dumps hold the same bytes written as comma separated hex values,
+#   like "0x03, 0x04, 0x07".
+#
+# Missing bytes are stored as 0.
+##
+
+##
+# Standard Imports
+##
+import re
+import mmap
+from collections import namedtuple
+from typing import Tuple
+
+##
+# Local Library Imports
+##
+from modules.database.repository import PAGE_SIZE, pack_page, persona_content_hash
+
+## Fewest bytes in a dump, the base ID fields covered by CC_BASE
+MIN_DUMP_SIZE = 64
+
+## Most bytes in a dump, page 0xA0 followed by page 0xA2
+MAX_DUMP_SIZE = 2 * PAGE_SIZE
+
+## Largest file that is read. A text dump takes about 6 characters per byte.
+MAX_FILE_SIZE = 8 * MAX_DUMP_SIZE
+
+##
+# Named tuple for a read dump. Either error is None or the pages and
+# content hash are None.
+##
+EepromDump = namedtuple("EepromDump", "path, page_a0, page_a2, content_hash, error")
+
+_HEX_VALUE = re.compile(rb'0[xX]([0-9a-fA-F]{1,2})')
+
+def _decode_text_dump(data: bytes) -> bytes:
+    '''! Converts a text dump of hex values into the bytes it describes.'''
+    return bytes(int(value, 16) for value in _HEX_VALUE.findall(data))
+
+def parse_dump(data: bytes) -> Tuple[bytes, bytes]:
+    '''! Parses and validates the contents of a dump.
+
+    @param data The contents of a dump file
+    @return Page 0xA0 and page 0xA2, PAGE_SIZE bytes each
+    @exception ValueError If the dump is not a valid SFP memory map
+    '''
+    if data.lstrip()[:2] in (b'0x', b'0X'):
+        data = _decode_text_dump(data)
+
+    if len(data) < MIN_DUMP_SIZE:
+        raise ValueError(f'{len(data)} bytes is shorter than the {MIN_DUMP_SIZE} byte base ID fields')
+
+    if len(data) > MAX_DUMP_SIZE:
+        raise ValueError(f'{len(data)} bytes is longer than two memory pages')
+
+    # An unprogrammed EEPROM reads as all zeros or all ones
+    if data[0] in (0x00, 0xFF):
+        raise ValueError(f'Identifier 0x{data[0]:02X} is not a module type')
+
+    # CC_BASE is the low 8 bits of the sum of bytes 0-62
+    if sum(data[0:63]) & 0xFF != data[63]:
+        raise ValueError('CC_BASE checksum does not match')
+
+    # CC_EXT is the low 8 bits of the sum of bytes 64-94
+    if len(data) >= 96 and sum(data[64:95]) & 0xFF != data[95]:
+        raise ValueError('CC_EXT checksum does not match')
+
+    return pack_page(data[:PAGE_SIZE]), pack_page(data[PAGE_SIZE:])
+
+def read_dump(path: str) -> EepromDump:
+    '''! Reads and validates a dump file. Errors are returned instead of
+    raised, so many files can be read in a process pool.
+
+    @param path The path of the dump file
+    @return The EepromDump of the file
+    '''
+    try:
+        with open(path, 'rb') as dump_file:
+            file_size = dump_file.seek(0, 2)
+
+            # mmap can not map an empty file
+            if file_size == 0:
+                raise ValueError('The file is empty')
+
+            if file_size > MAX_FILE_SIZE:
+                raise ValueError(f'{file_size} bytes is too large for a memory map dump')
+
+            with mmap.mmap(dump_file.fileno(), 0, access=mmap.ACCESS_READ) as memory:
+                page_a0, page_a2 = parse_dump(memory[:])
+
+    except (OSError, ValueError) as ex:
+        return EepromDump(path, None, None, None, str(ex))
+
+    return EepromDump(path, page_a0, page_a2, persona_content_hash(page_a0, page_a2), None)
@@ -10,7 +10,6 @@
 # - Modified on 11/04/2021 by Connor DeCamp
 ##
 
-from enum import Enum
 from typing import List
 
 from PyQt5.QtWidgets import QHeaderView, QListWidget, QTableWidgetItem, QDialog
@@ -18,24 +17,25 @@ from PyQt5.QtCore import *
 from PyQt5.QtGui import *
 
 from modules.core.memory_map_dialog_autogen import Ui_Dialog
-from modules.core.create_stress_scenario_dialog import CreateStressScenarioDialog
+from modules.core.create_stress_scenario_dialog import PARAMETER_NAMES, CreateStressScenarioDialog, \
+                                                     SupportedParameters
+from modules.core.memory_page_model import MemoryPageModel
 from modules.core.sfp import SFP
 
-from modules.network.sql_connection import SQLConnection
+from modules.core.database_worker import get_database_worker
+from modules.database.repository import StressScenario, get_repository
 
 
 class MemoryMapDialog(QDialog, Ui_Dialog):
 
-    class DisplayType(Enum):
-        HEX = 0,
-        DECIMAL = 1,
-        ASCII = 2
+    DisplayType = MemoryPageModel.DisplayType
 
-    # selected_display_mode is the one the user wants to switch to
-    selected_display_mode : DisplayType = DisplayType.HEX
-
-    # Current display mode is the type that is being currently displayed
-    current_display_mode : DisplayType = DisplayType.HEX
+    # Display mode selected in the combo box, keyed by its text
+    DISPLAY_TYPES = {
+        'Hex': DisplayType.HEX,
+        'Decimal': DisplayType.DECIMAL,
+        'ASCII': DisplayType.ASCII,
+    }
 
     associated_sfp: SFP
     selected_memory_page: int
@@ -49,12 +49,13 @@ class MemoryMapDialog(QDialog, Ui_Dialog):
         # self.setWindowModality(Qt.WindowModality.ApplicationModal)
         self.setWindowTitle("Memory Map Information")
 
-        # Get header of table widget and resize each column
-        # to fit its contents
-        header = self.tableWidget.horizontalHeader()
+        # The hex grid reads the values straight from the SFP pages
+        self.memory_model = MemoryPageModel(self)
+        self.memoryTableView.setModel(self.memory_model)
 
-        for i in range(16):
-            header.setSectionResizeMode(i, QHeaderView.ResizeMode.ResizeToContents)
+        # Resize each column to fit its contents
+        header = self.memoryTableView.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
 
         self.comboBox.activated[str].connect(self.change_table_display_mode)
         self.comboBox_2.activated[str].connect(self.change_memory_page)
@@ -90,101 +91,65 @@ class MemoryMapDialog(QDialog, Ui_Dialog):
             " " + self.associated_sfp.get_vendor_serial_number()
         )
 
-        # Loop from [0, 255] and display memory map
-        # values in hex by default
-        for i in range(256):
-            row = i // 16
-            col = i % 16
-
-            val_to_show = sfp_to_show.page_a0[i]
-            
-            item_to_add = QTableWidgetItem(format(val_to_show, '02X'))
-            item_to_add.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            item_to_add.setFont(QFont('Ubuntu', 8))
+        # Display page 0xA0 by default
+        self.selected_memory_page = 0xA0
+        self.memory_model.set_page(sfp_to_show.page_a0)
 
-            self.tableWidget.setItem(row, col, item_to_add)
-        
         # Fill in the values on the characteristics page
         self.generate_characteristics_table()
 
     def refresh_stress_scenario_table(self, sfp_id: int):
-        '''!Given a list of stress scenario tuples from the
-        database, fills out the table in this dialog.
-        
+        '''!Reads the stress scenarios of an SFP from the
+        database and fills out the table in this dialog.
+
+        @param sfp_id The ID of the SFP in the database
         '''
         self.selected_sfp_id = sfp_id
 
-        sql_conn = SQLConnection()
-        cursor = sql_conn.get_cursor()
-
-        cursor.execute(f'SELECT * FROM stress_scenarios where sfp_id={self.selected_sfp_id}')
-
-        stress_scenarios_list = []
-        for res in cursor:
-            stress_scenarios_list.append(res)
-
-        sql_conn.close()
+        # The table is filled in when the query is done
+        get_database_worker().submit(
+            lambda: get_repository().list_stress_scenarios(sfp_id),
+            on_result=self._fill_stress_scenario_table
+        )
 
-        ##
-        # Database is formatted as
-        #
-        # Name         Column Number
-        # --------------------------
-        # stress_id         0
-        # sfp_id            1
-        # scenario_name     2
-        # values           3-22
-        ##
+    def _fill_stress_scenario_table(self, stress_scenarios_list: List[StressScenario]):
         self.tableWidget_3.setRowCount(0)
-        for data in stress_scenarios_list:
-            scenario_name = data[2]
-            list_of_values = [val for val in data[3::]]
+        for scenario in stress_scenarios_list:
+            scenario_name = scenario.scenario_name
+
+            # Waveforms can hold thousands of samples, so only
+            # describe them here
+            if scenario.parameter is None:
+                description = f'{scenario.sample_count} samples'
+            else:
+                parameter_name = PARAMETER_NAMES[SupportedParameters(scenario.parameter)]
+                description = f'{parameter_name}, {scenario.sample_count} samples ' \
+                              f'every {scenario.sample_period} ms'
 
             row_count = self.tableWidget_3.rowCount()
             self.tableWidget_3.insertRow(row_count)
             self.tableWidget_3.setItem(row_count, 0, QTableWidgetItem(str(scenario_name)))
-            self.tableWidget_3.setItem(row_count, 1, QTableWidgetItem(repr(list_of_values)))
+            self.tableWidget_3.setItem(row_count, 1, QTableWidgetItem(description))
 
         self.tableWidget_3.resizeColumnsToContents()
 
     def change_table_display_mode(self, selection: str):
-
-        if selection == 'Hex' and self.selected_display_mode != self.DisplayType.HEX:
-            self.selected_display_mode = self.DisplayType.HEX
-        elif selection == 'Decimal' and self.selected_display_mode != self.DisplayType.DECIMAL:
-            self.selected_display_mode = self.DisplayType.DECIMAL
-        elif selection == 'ASCII' and self.selected_display_mode != self.DisplayType.ASCII:
-            self.selected_display_mode = self.DisplayType.ASCII
-        else:
-            return
-
-
-        self.tableWidget.setUpdatesEnabled(False)
-        self.update_table()
-        self.tableWidget.setUpdatesEnabled(True)
+        self.memory_model.set_display_type(self.DISPLAY_TYPES[selection])
 
     def update_table(self):
+        self.memory_model.set_page(self.associated_sfp.memory_pages[self.selected_memory_page])
 
-        memory_to_display = self.associated_sfp.memory_pages[self.selected_memory_page]
-
-        for i in range(256):
-            row = i // 16
-            col = i % 16
-
-            if self.selected_display_mode == self.DisplayType.HEX:
-                self.tableWidget.item(row, col).setText(
-                    format(memory_to_display[i], '02X')
-                )
-            elif self.selected_display_mode == self.DisplayType.DECIMAL:
-                self.tableWidget.item(row, col).setText(
-                    f'{memory_to_display[i]}'
-                )
-            elif self.selected_display_mode == self.DisplayType.ASCII:
-                self.tableWidget.item(row, col).setText(
-                    chr(memory_to_display[i])
-                )
-            else:
-                raise Exception("ERROR:memory_map_dialog.py::Unknown display type for memory table.")
+    def update_memory_page(self, page_number: int, values: List[int]):
+        '''! Updates the values of a memory page, for example with live
+        readings of page 0xA2. Only the changed cells are repainted.
+
+        @param page_number 0xA0 or 0xA2
+        @param values The new values of the page
+        '''
+        if page_number == self.selected_memory_page:
+            self.memory_model.update_values(values)
+        else:
+            self.associated_sfp.memory_pages[page_number][:] = values
 
     def change_memory_page(self, selection: str):
         self.selected_memory_page = int(selection, base=16)
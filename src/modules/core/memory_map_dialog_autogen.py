@@ -29,181 +29,10 @@ class Ui_Dialog(object):
         self.tab.setObjectName("tab")
         self.gridLayout = QtWidgets.QGridLayout(self.tab)
         self.gridLayout.setObjectName("gridLayout")
-        self.tableWidget = QtWidgets.QTableWidget(self.tab)
-        self.tableWidget.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
-        self.tableWidget.setObjectName("tableWidget")
-        self.tableWidget.setColumnCount(16)
-        self.tableWidget.setRowCount(16)
-        item = QtWidgets.QTableWidgetItem()
-        font = QtGui.QFont()
-        font.setPointSize(8)
-        item.setFont(font)
-        self.tableWidget.setVerticalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        font = QtGui.QFont()
-        font.setPointSize(8)
-        item.setFont(font)
-        self.tableWidget.setVerticalHeaderItem(1, item)
-        item = QtWidgets.QTableWidgetItem()
-        font = QtGui.QFont()
-        font.setPointSize(8)
-        item.setFont(font)
-        self.tableWidget.setVerticalHeaderItem(2, item)
-        item = QtWidgets.QTableWidgetItem()
-        font = QtGui.QFont()
-        font.setPointSize(8)
-        item.setFont(font)
-        self.tableWidget.setVerticalHeaderItem(3, item)
-        item = QtWidgets.QTableWidgetItem()
-        font = QtGui.QFont()
-        font.setPointSize(8)
-        item.setFont(font)
-        self.tableWidget.setVerticalHeaderItem(4, item)
-        item = QtWidgets.QTableWidgetItem()
-        font = QtGui.QFont()
-        font.setPointSize(8)
-        item.setFont(font)
-        self.tableWidget.setVerticalHeaderItem(5, item)
-        item = QtWidgets.QTableWidgetItem()
-        font = QtGui.QFont()
-        font.setPointSize(8)
-        item.setFont(font)
-        self.tableWidget.setVerticalHeaderItem(6, item)
-        item = QtWidgets.QTableWidgetItem()
-        font = QtGui.QFont()
-        font.setPointSize(8)
-        item.setFont(font)
-        self.tableWidget.setVerticalHeaderItem(7, item)
-        item = QtWidgets.QTableWidgetItem()
-        font = QtGui.QFont()
-        font.setPointSize(8)
-        item.setFont(font)
-        self.tableWidget.setVerticalHeaderItem(8, item)
-        item = QtWidgets.QTableWidgetItem()
-        font = QtGui.QFont()
-        font.setPointSize(8)
-        item.setFont(font)
-        self.tableWidget.setVerticalHeaderItem(9, item)
-        item = QtWidgets.QTableWidgetItem()
-        font = QtGui.QFont()
-        font.setPointSize(8)
-        item.setFont(font)
-        self.tableWidget.setVerticalHeaderItem(10, item)
-        item = QtWidgets.QTableWidgetItem()
-        font = QtGui.QFont()
-        font.setPointSize(8)
-        item.setFont(font)
-        self.tableWidget.setVerticalHeaderItem(11, item)
-        item = QtWidgets.QTableWidgetItem()
-        font = QtGui.QFont()
-        font.setPointSize(8)
-        item.setFont(font)
-        self.tableWidget.setVerticalHeaderItem(12, item)
-        item = QtWidgets.QTableWidgetItem()
-        font = QtGui.QFont()
-        font.setPointSize(8)
-        item.setFont(font)
-        self.tableWidget.setVerticalHeaderItem(13, item)
-        item = QtWidgets.QTableWidgetItem()
-        font = QtGui.QFont()
-        font.setPointSize(8)
-        item.setFont(font)
-        self.tableWidget.setVerticalHeaderItem(14, item)
-        item = QtWidgets.QTableWidgetItem()
-        font = QtGui.QFont()
-        font.setPointSize(8)
-        item.setFont(font)
-        self.tableWidget.setVerticalHeaderItem(15, item)
-        item = QtWidgets.QTableWidgetItem()
-        font = QtGui.QFont()
-        font.setPointSize(8)
-        font.setBold(False)
-        font.setWeight(50)
-        item.setFont(font)
-        self.tableWidget.setHorizontalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        font = QtGui.QFont()
-        font.setPointSize(8)
-        item.setFont(font)
-        self.tableWidget.setHorizontalHeaderItem(1, item)
-        item = QtWidgets.QTableWidgetItem()
-        font = QtGui.QFont()
-        font.setPointSize(8)
-        item.setFont(font)
-        self.tableWidget.setHorizontalHeaderItem(2, item)
-        item = QtWidgets.QTableWidgetItem()
-        font = QtGui.QFont()
-        font.setPointSize(8)
-        item.setFont(font)
-        self.tableWidget.setHorizontalHeaderItem(3, item)
-        item = QtWidgets.QTableWidgetItem()
-        font = QtGui.QFont()
-        font.setPointSize(8)
-        item.setFont(font)
-        self.tableWidget.setHorizontalHeaderItem(4, item)
-        item = QtWidgets.QTableWidgetItem()
-        font = QtGui.QFont()
-        font.setPointSize(8)
-        item.setFont(font)
-        self.tableWidget.setHorizontalHeaderItem(5, item)
-        item = QtWidgets.QTableWidgetItem()
-        font = QtGui.QFont()
-        font.setPointSize(8)
-        item.setFont(font)
-        self.tableWidget.setHorizontalHeaderItem(6, item)
-        item = QtWidgets.QTableWidgetItem()
-        font = QtGui.QFont()
-        font.setPointSize(8)
-        item.setFont(font)
-        self.tableWidget.setHorizontalHeaderItem(7, item)
-        item = QtWidgets.QTableWidgetItem()
-        font = QtGui.QFont()
-        font.setPointSize(8)
-        item.setFont(font)
-        self.tableWidget.setHorizontalHeaderItem(8, item)
-        item = QtWidgets.QTableWidgetItem()
-        font = QtGui.QFont()
-        font.setPointSize(8)
-        item.setFont(font)
-        self.tableWidget.setHorizontalHeaderItem(9, item)
-        item = QtWidgets.QTableWidgetItem()
-        font = QtGui.QFont()
-        font.setPointSize(8)
-        item.setFont(font)
-        self.tableWidget.setHorizontalHeaderItem(10, item)
-        item = QtWidgets.QTableWidgetItem()
-        font = QtGui.QFont()
-        font.setPointSize(8)
-        item.setFont(font)
-        self.tableWidget.setHorizontalHeaderItem(11, item)
-        item = QtWidgets.QTableWidgetItem()
-        font = QtGui.QFont()
-        font.setPointSize(8)
-        item.setFont(font)
-        self.tableWidget.setHorizontalHeaderItem(12, item)
-        item = QtWidgets.QTableWidgetItem()
-        font = QtGui.QFont()
-        font.setPointSize(8)
-        item.setFont(font)
-        self.tableWidget.setHorizontalHeaderItem(13, item)
-        item = QtWidgets.QTableWidgetItem()
-        font = QtGui.QFont()
-        font.setPointSize(8)
-        item.setFont(font)
-        self.tableWidget.setHorizontalHeaderItem(14, item)
-        item = QtWidgets.QTableWidgetItem()
-        font = QtGui.QFont()
-        font.setPointSize(8)
-        item.setFont(font)
-        self.tableWidget.setHorizontalHeaderItem(15, item)
-        item = QtWidgets.QTableWidgetItem()
-        item.setTextAlignment(QtCore.Qt.AlignCenter)
-        font = QtGui.QFont()
-        font.setPointSize(8)
-        item.setFont(font)
-        item.setFlags(QtCore.Qt.ItemIsSelectable|QtCore.Qt.ItemIsUserCheckable|QtCore.Qt.ItemIsEnabled)
-        self.tableWidget.setItem(0, 0, item)
-        self.gridLayout.addWidget(self.tableWidget, 4, 1, 1, 1)
+        self.memoryTableView = QtWidgets.QTableView(self.tab)
+        self.memoryTableView.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.memoryTableView.setObjectName("memoryTableView")
+        self.gridLayout.addWidget(self.memoryTableView, 4, 1, 1, 1)
         self.gridLayout_3 = QtWidgets.QGridLayout()
         self.gridLayout_3.setObjectName("gridLayout_3")
         spacerItem = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
@@ -708,73 +537,6 @@ class Ui_Dialog(object):
     def retranslateUi(self, Dialog):
         _translate = QtCore.QCoreApplication.translate
         Dialog.setWindowTitle(_translate("Dialog", "Dialog"))
-        item = self.tableWidget.verticalHeaderItem(0)
-        item.setText(_translate("Dialog", "00000000"))
-        item = self.tableWidget.verticalHeaderItem(1)
-        item.setText(_translate("Dialog", "00000010"))
-        item = self.tableWidget.verticalHeaderItem(2)
-        item.setText(_translate("Dialog", "00000020"))
-        item = self.tableWidget.verticalHeaderItem(3)
-        item.setText(_translate("Dialog", "00000030"))
-        item = self.tableWidget.verticalHeaderItem(4)
-        item.setText(_translate("Dialog", "00000040"))
-        item = self.tableWidget.verticalHeaderItem(5)
-        item.setText(_translate("Dialog", "00000050"))
-        item = self.tableWidget.verticalHeaderItem(6)
-        item.setText(_translate("Dialog", "00000060"))
-        item = self.tableWidget.verticalHeaderItem(7)
-        item.setText(_translate("Dialog", "00000070"))
-        item = self.tableWidget.verticalHeaderItem(8)
-        item.setText(_translate("Dialog", "00000080"))
-        item = self.tableWidget.verticalHeaderItem(9)
-        item.setText(_translate("Dialog", "00000090"))
-        item = self.tableWidget.verticalHeaderItem(10)
-        item.setText(_translate("Dialog", "000000A0"))
-        item = self.tableWidget.verticalHeaderItem(11)
-        item.setText(_translate("Dialog", "000000B0"))
-        item = self.tableWidget.verticalHeaderItem(12)
-        item.setText(_translate("Dialog", "000000C0"))
-        item = self.tableWidget.verticalHeaderItem(13)
-        item.setText(_translate("Dialog", "000000D0"))
-        item = self.tableWidget.verticalHeaderItem(14)
-        item.setText(_translate("Dialog", "000000E0"))
-        item = self.tableWidget.verticalHeaderItem(15)
-        item.setText(_translate("Dialog", "000000F0"))
-        item = self.tableWidget.horizontalHeaderItem(0)
-        item.setText(_translate("Dialog", "00"))
-        item = self.tableWidget.horizontalHeaderItem(1)
-        item.setText(_translate("Dialog", "01"))
-        item = self.tableWidget.horizontalHeaderItem(2)
-        item.setText(_translate("Dialog", "02"))
-        item = self.tableWidget.horizontalHeaderItem(3)
-        item.setText(_translate("Dialog", "03"))
-        item = self.tableWidget.horizontalHeaderItem(4)
-        item.setText(_translate("Dialog", "04"))
-        item = self.tableWidget.horizontalHeaderItem(5)
-        item.setText(_translate("Dialog", "05"))
-        item = self.tableWidget.horizontalHeaderItem(6)
-        item.setText(_translate("Dialog", "06"))
-        item = self.tableWidget.horizontalHeaderItem(7)
-        item.setText(_translate("Dialog", "07"))
-        item = self.tableWidget.horizontalHeaderItem(8)
-        item.setText(_translate("Dialog", "08"))
-        item = self.tableWidget.horizontalHeaderItem(9)
-        item.setText(_translate("Dialog", "09"))
-        item = self.tableWidget.horizontalHeaderItem(10)
-        item.setText(_translate("Dialog", "0A"))
-        item = self.tableWidget.horizontalHeaderItem(11)
-        item.setText(_translate("Dialog", "0B"))
-        item = self.tableWidget.horizontalHeaderItem(12)
-        item.setText(_translate("Dialog", "0C"))
-        item = self.tableWidget.horizontalHeaderItem(13)
-        item.setText(_translate("Dialog", "0D"))
-        item = self.tableWidget.horizontalHeaderItem(14)
-        item.setText(_translate("Dialog", "0E"))
-        item = self.tableWidget.horizontalHeaderItem(15)
-        item.setText(_translate("Dialog", "0F"))
-        __sortingEnabled = self.tableWidget.isSortingEnabled()
-        self.tableWidget.setSortingEnabled(False)
-        self.tableWidget.setSortingEnabled(__sortingEnabled)
         self.comboBox_2.setItemText(0, _translate("Dialog", "A0"))
         self.comboBox_2.setItemText(1, _translate("Dialog", "A2"))
         self.label.setText(_translate("Dialog", "Display Mode"))
@@ -0,0 +1,156 @@
+##
+# @file memory_page_model.py
+# @brief Table model of a memory page shown as a 16 x 16 hex grid.
+#
+# @section file_author Author
+# - Created on 10/19/2026
+#
+# The model reads the page values straight from the list it is given, the
+# SFP page buffer, and formats a cell only when the view paints it. The
+# display mode only changes how data() formats a value, so switching the
+# mode or the page is a single dataChanged over the grid.
+##
+
+##
+# Standard Imports
+##
+from enum import Enum
+from typing import List, Optional
+
+##
+# Third Party Library Imports
+##
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PyQt5.QtGui import QFont
+
+## Bytes per row of the grid
+ROW_SIZE = 16
+
+## Text of every byte value in each display mode
+_HEX_TEXT = [format(value, '02X') for value in range(256)]
+_DECIMAL_TEXT = [str(value) for value in range(256)]
+_ASCII_TEXT = [chr(value) for value in range(256)]
+
+def _value_at(values: List[Optional[int]], offset: int) -> Optional[int]:
+    return values[offset] if offset < len(values) else None
+
+class MemoryPageModel(QAbstractTableModel):
+    '''! Read-only hex grid of the values of a memory page.
+
+    @brief Usage:
+        model = MemoryPageModel()
+        table_view.setModel(model)
+        model.set_page(sfp.page_a0)
+        model.set_display_type(MemoryPageModel.DisplayType.DECIMAL)
+    '''
+
+    class DisplayType(Enum):
+        HEX = 0
+        DECIMAL = 1
+        ASCII = 2
+
+    ## Number of values in a page
+    PAGE_SIZE = 256
+
+    def __init__(self, parent=None):
+        '''! Initializes the model with an empty page.
+
+        @param parent The parent QObject
+        '''
+        super().__init__(parent)
+
+        self._values: List[Optional[int]] = []
+        self._display_type = self.DisplayType.HEX
+        self._texts = _HEX_TEXT
+
+        self._font = QFont('Ubuntu', 8)
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return self.PAGE_SIZE // ROW_SIZE
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return ROW_SIZE
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        if role == Qt.DisplayRole:
+            offset = index.row() * ROW_SIZE + index.column()
+            if offset >= len(self._values) or self._values[offset] is None:
+                return ''
+            return self._texts[self._values[offset] & 0xFF]
+
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+
+        if role == Qt.FontRole:
+            return self._font
+
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.FontRole:
+            return self._font
+
+        if role != Qt.DisplayRole:
+            return None
+
+        if orientation == Qt.Horizontal:
+            return format(section, '02X')
+
+        return format(section * ROW_SIZE, '08X')
+
+    def display_type(self) -> 'MemoryPageModel.DisplayType':
+        return self._display_type
+
+    def set_display_type(self, display_type: 'MemoryPageModel.DisplayType') -> None:
+        '''! Shows the values as hex, decimal or ASCII.'''
+        if display_type == self._display_type:
+            return
+
+        if display_type == self.DisplayType.HEX:
+            self._texts = _HEX_TEXT
+        elif display_type == self.DisplayType.DECIMAL:
+            self._texts = _DECIMAL_TEXT
+        elif display_type == self.DisplayType.ASCII:
+            self._texts = _ASCII_TEXT
+        else:
+            raise Exception("ERROR:memory_page_model.py::Unknown display type for memory table.")
+
+        self._display_type = display_type
+        self._emit_changed(0, self.rowCount() - 1)
+
+    def set_page(self, values: List[int]) -> None:
+        '''! Shows another page.
+
+        @param values The values of the page. The list is read, not
+                      copied, and update_values() writes into it.
+        '''
+        self._values = values
+        self._emit_changed(0, self.rowCount() - 1)
+
+    def update_values(self, values: List[int]) -> None:
+        '''! Copies new values, for example live readings, into the page
+        that is shown. Only the rows holding changed values are repainted.
+
+        @param values The new values of the page, in a list of their own
+        '''
+        changed = [
+            offset for offset in range(self.PAGE_SIZE)
+            if _value_at(values, offset) != _value_at(self._values, offset)
+        ]
+
+        self._values[:] = values
+
+        if changed:
+            self._emit_changed(changed[0] // ROW_SIZE, changed[-1] // ROW_SIZE)
+
+    def _emit_changed(self, first_row: int, last_row: int) -> None:
+        self.dataChanged.emit(
+            self.index(first_row, 0), self.index(last_row, ROW_SIZE - 1), [Qt.DisplayRole]
+        )
@@ -0,0 +1,259 @@
+##
+# @file monitor_dashboard.py
+# @brief Monitors the diagnostics of several docking stations at once.
+#
+# @section file_author Author
+# - Created on 10/19/2026
+#
+# Every monitored docking station has its own MonitorSession, with its
+# own monitor window, SFP and plot history. A reply from a docking station
+# only updates its session: the registers are copied into the SFP and the
+# sample is added to the plot history and the telemetry store.
+#
+# The windows are repainted by one timer at a fixed frame rate, and only
+# the sessions that changed since the last frame are repainted. Drawing
+# then costs the same however many replies arrive between two frames.
+##
+
+##
+# Standard Imports
+##
+import time
+from typing import Dict, Optional
+
+##
+# Third Party Library Imports
+##
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+##
+# Local Library Imports
+##
+from modules.core.monitor_dialog import DiagnosticMonitorDialog
+from modules.core.sfp import SFP
+from modules.database.repository import TelemetrySample
+from modules.database.telemetry_store import TelemetryStore
+from modules.network.message import Message, MessageCode, ReadRegisterMessage
+
+## Page 0xA0 registers read when monitoring starts: the vendor name, the
+# part number and the diagnostic monitoring type
+INIT_A0_REGISTERS = list(range(20, 36)) + list(range(40, 56)) + [92]
+
+## Page 0xA2 registers read when monitoring starts: the alarm and warning
+# thresholds, the calibration constants and the real-time diagnostics
+INIT_A2_REGISTERS = list(range(0, 92)) + list(range(96, 110))
+
+## Page 0xA2 registers holding the real-time diagnostics
+REAL_TIME_REGISTERS = list(range(96, 110))
+
+class MonitorSession:
+    '''! Diagnostic monitoring of the SFP in one docking station.'''
+
+    def __init__(self, dock_ip: str, telemetry_store: Optional[TelemetryStore] = None, parent=None):
+        '''! Creates the monitor window of the session.
+
+        @param dock_ip IP address of the docking station
+        @param telemetry_store Where every real-time sample is stored, or None
+        @param parent The parent widget of the monitor window
+        '''
+        self.dock_ip = dock_ip
+        self.telemetry_store = telemetry_store
+        self.dialog = DiagnosticMonitorDialog(parent, dock_ip)
+
+        ## Whether the session changed since it was last repainted
+        self.dirty = False
+
+        # The real-time tab compares values with the thresholds, so it is
+        # only repainted once they were read
+        self._has_thresholds = False
+        self._thresholds_changed = False
+
+    @property
+    def sfp(self) -> SFP:
+        return self.dialog.associated_sfp
+
+    def handle_init_a0(self, cmd: ReadRegisterMessage):
+        '''! Shows which SFP is being monitored.
+
+        @param cmd The reply to the INIT_A0_REGISTERS read
+        '''
+        sfp = self.sfp
+
+        sfp.page_a0[20:36] = cmd.register_numbers[0:16]
+        sfp.page_a0[40:56] = cmd.register_numbers[16:32]
+        sfp.page_a0[92] = cmd.register_numbers[len(cmd.register_numbers) - 1]
+        sfp.force_calibration_check()
+
+        calibration_str = ""
+        if sfp.calibration_type == SFP.CalibrationType.INTERNAL:
+            calibration_str = "Internally Calibrated"
+        elif sfp.calibration_type == SFP.CalibrationType.EXTERNAL:
+            calibration_str = "Externally Calibrated"
+
+        self.dialog.lineEdit.setText(sfp.get_vendor_name())
+        self.dialog.lineEdit_2.setText(sfp.get_vendor_part_number())
+        self.dialog.lineEdit_3.setText(calibration_str)
+
+    def handle_init_a2(self, cmd: ReadRegisterMessage):
+        '''! Stores the thresholds, calibration constants and the first
+        real-time values.
+
+        @param cmd The reply to the INIT_A2_REGISTERS read
+        '''
+        sfp = self.sfp
+
+        for i in range(91 + 1):
+            sfp.page_a2[i] = cmd.register_numbers[i]
+
+        for i in range(96, 109 + 1):
+            sfp.page_a2[i] = cmd.register_numbers[i - 4]
+
+        self._has_thresholds = True
+        self._thresholds_changed = True
+        self._add_sample()
+
+    def handle_real_time_refresh(self, cmd: ReadRegisterMessage):
+        '''! Stores new real-time values.
+
+        @param cmd The reply to the REAL_TIME_REGISTERS read
+        '''
+        sfp = self.sfp
+        sfp.force_calibration_check()
+
+        for i in range(96, 109 + 1):
+            sfp.page_a2[i] = cmd.register_numbers[i - 96]
+
+        self._add_sample()
+
+    def _add_sample(self):
+        values = self.dialog.record_real_time_sample()
+
+        if self.telemetry_store is not None:
+            self.telemetry_store.record(TelemetrySample(self.dock_ip, time.time(), *values))
+
+        self.dirty = True
+
+    def repaint(self):
+        '''! Shows the values received since the last repaint.'''
+        self.dirty = False
+
+        if not self._has_thresholds:
+            return
+
+        if self._thresholds_changed:
+            self._thresholds_changed = False
+            self.dialog.update_alarm_warning_tab()
+
+        self.dialog.update_real_time_tab()
+
+class MonitorDashboard(QObject):
+    '''! Monitors any number of docking stations, one MonitorSession each.
+
+    @brief Usage:
+        dashboard = MonitorDashboard(telemetry_store, parent_widget=window)
+        dashboard.send_command.connect(tcp_server.handle_send_command_signal)
+        tcp_server.real_time_refresh_signal.connect(dashboard.handle_real_time_refresh)
+        ...
+        dashboard.open_session(dock_ip)
+    '''
+
+    ## Milliseconds between repaints, 10 frames a second
+    FRAME_INTERVAL_MSEC = 100
+
+    ## Emitted with (IP address, message) to send a message to a docking station
+    send_command = pyqtSignal(object)
+
+    def __init__(self, telemetry_store: Optional[TelemetryStore] = None, parent_widget=None, parent=None):
+        '''! Initializes the dashboard without any sessions.
+
+        @param telemetry_store Where every real-time sample is stored, or None
+        @param parent_widget The parent widget of the monitor windows
+        @param parent The parent QObject
+        '''
+        super().__init__(parent)
+
+        self.telemetry_store = telemetry_store
+        self.parent_widget = parent_widget
+
+        ## Sessions keyed by the IP address of their docking station
+        self.sessions: Dict[str, MonitorSession] = {}
+
+        self.frame_timer = QTimer(self)
+        self.frame_timer.timeout.connect(self.repaint)
+
+    def open_session(self, dock_ip: str) -> MonitorSession:
+        '''! Starts monitoring a docking station and shows its monitor
+        window. An open session is shown again with its history.
+
+        @param dock_ip IP address of the docking station
+        @return The session of the docking station
+        '''
+        session = self.sessions.get(dock_ip)
+        if session is None:
+            session = MonitorSession(dock_ip, self.telemetry_store, self.parent_widget)
+            session.dialog.timed_command.connect(lambda: self._request_real_time_values(dock_ip))
+            self.sessions[dock_ip] = session
+
+        # The identifying fields and thresholds are read first, then the
+        # real-time values once a second
+        self.send_command.emit((dock_ip, ReadRegisterMessage(
+            MessageCode.DIAGNOSTIC_INIT_A0, "", 0x50, INIT_A0_REGISTERS
+        )))
+        self.send_command.emit((dock_ip, ReadRegisterMessage(
+            MessageCode.DIAGNOSTIC_INIT_A2, "", 0x51, INIT_A2_REGISTERS
+        )))
+
+        session.dialog.start_timer()
+        session.dialog.show()
+        session.dialog.raise_()
+
+        if not self.frame_timer.isActive():
+            self.frame_timer.start(self.FRAME_INTERVAL_MSEC)
+
+        return session
+
+    def close_session(self, dock_ip: str):
+        '''! Stops monitoring a docking station and closes its windows.'''
+        session = self.sessions.pop(dock_ip, None)
+        if session is not None:
+            session.dialog.close()
+
+        if not self.sessions:
+            self.frame_timer.stop()
+
+    def close_all(self):
+        for dock_ip in list(self.sessions):
+            self.close_session(dock_ip)
+
+    def _request_real_time_values(self, dock_ip: str):
+        self.send_command.emit((dock_ip, ReadRegisterMessage(
+            MessageCode.REAL_TIME_REFRESH, "", 0x51, REAL_TIME_REGISTERS
+        )))
+
+    ##
+    # TCP server slots. Replies of docking stations without a session
+    # are dropped.
+    ##
+    def handle_init_diagnostic_a0(self, dock_ip: str, cmd: ReadRegisterMessage):
+        session = self.sessions.get(dock_ip)
+        if session is not None:
+            session.handle_init_a0(cmd)
+
+    def handle_init_diagnostic_a2(self, dock_ip: str, cmd: ReadRegisterMessage):
+        session = self.sessions.get(dock_ip)
+        if session is not None:
+            session.handle_init_a2(cmd)
+
+    def handle_real_time_refresh(self, dock_ip: str, cmd: ReadRegisterMessage):
+        session = self.sessions.get(dock_ip)
+        if session is not None:
+            session.handle_real_time_refresh(cmd)
+
+    def handle_remote_io_error(self, dock_ip: str, cmd: Message):
+        self.close_session(dock_ip)
+
+    def repaint(self):
+        '''! Repaints every shown session that changed since the last frame.'''
+        for session in self.sessions.values():
+            if session.dirty and session.dialog.isVisible():
+                session.repaint()
@@ -8,6 +8,7 @@
 # - Modified on 10/19/2021 by Connor DeCamp
 # - Modified on 10/20/2021 by Connor DeCamp
 # - Modified on 10/21/2021 by Connor DeCamp
+# - Modified on 10/19/2026
 ##
 
 import logging
@@ -15,8 +16,9 @@ import logging
 ##
 # Third Party Library Imports
 ##
-from typing import Union
-from PyQt5.QtWidgets import QDialog, QLineEdit
+from typing import Tuple
+import numpy as np
+from PyQt5.QtWidgets import QDialog
 from PyQt5.QtCore import QTimer, Qt, pyqtSignal
 
 ##
@@ -27,6 +29,43 @@ from modules.core.sfp import *
 
 from modules.core.diagnostic_plot import DiagnosticData, DiagnosticPlotWidget
 
+# Colors in qtStyleSheet format
+RED = 'rgb(255, 0, 0)'
+YELLOW = 'rgb(237, 212, 0)'
+BLACK = 'rgb(0, 0, 0)'
+LIGHT_BLUE = 'rgb(114, 159, 207)'
+BLUE = 'rgb(0, 0, 255)'
+WHITE = 'rgb(255, 255, 255)'
+
+## Style sheet of a real-time value in each band, indexed by band:
+# alarm high, warning high, normal, warning low and alarm low
+BAND_STYLE_SHEETS = (
+    f'background-color: {RED}; color: {WHITE}',
+    f'background-color: {YELLOW}; color: {BLACK}',
+    f'background-color: {WHITE}; color: {BLACK}',
+    f'background-color: {LIGHT_BLUE}; color: {BLACK}',
+    f'background-color: {BLUE}; color: {WHITE}',
+)
+
+## Band of a value that was not classified yet
+NO_BAND = -1
+
+def classify_bands(values: np.ndarray, thresholds: np.ndarray) -> np.ndarray:
+    '''! Finds the band of each real-time value compared to its thresholds.
+
+    @param values The values, one per parameter
+    @param thresholds One row per parameter holding its alarm high,
+                      warning high, warning low and alarm low thresholds
+    @return The index into BAND_STYLE_SHEETS of each value
+    '''
+    alarm_high, warning_high, warning_low, alarm_low = thresholds[:len(values)].T
+
+    return np.select(
+        [values >= alarm_high, values >= warning_high, values > warning_low, values > alarm_low],
+        [0, 1, 2, 3],
+        default=4
+    )
+
 class DiagnosticMonitorDialog(QDialog, Ui_Dialog):
 
     ## Signal emitted when internal timer times out
@@ -35,25 +74,28 @@ class DiagnosticMonitorDialog(QDialog, Ui_Dialog):
     ## Messaging interval in milliseconds
     MESSAGE_INTERVAL_MSEC = 1000
 
-    ## SFP object to monitor diagnostics of
-    associated_sfp = SFP([0]*256, [0]*256)
-    
-    ## IP address of associated docking station
-    dock_ip = ""
-
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, dock_ip: str = ""):
         '''! Initilazes the Diagnostic Monitoring Dialgo
+
+        @param parent The parent widget
+        @param dock_ip IP address of the docking station being monitored
         '''
         super().__init__(parent)
         self.setupUi(self)
 
-        # Window is application modal - cannot do anything else until it's closed out.
-        # This may not be the greatest solution
-        self.setWindowModality(Qt.WindowModality.ApplicationModal)
-        self.setWindowTitle("Monitor SFP Parameters")
+        ## SFP object to monitor diagnostics of
+        self.associated_sfp = SFP([0]*256, [0]*256)
 
+        ## IP address of associated docking station
+        self.dock_ip = dock_ip
+
+        # Not modal, so that several docking stations can be monitored
+        # at the same time
+        self.setWindowTitle(f"Monitor SFP Parameters - {dock_ip}" if dock_ip else "Monitor SFP Parameters")
 
         self.diagnostic_plot_window = DiagnosticPlotWidget()
+        if dock_ip:
+            self.diagnostic_plot_window.setWindowTitle(f"Diagnostic Plots - {dock_ip}")
 
         self.lineEdit.setReadOnly(True)
         self.lineEdit_2.setReadOnly(True)
@@ -74,6 +116,33 @@ class DiagnosticMonitorDialog(QDialog, Ui_Dialog):
         for line_edit in line_edits:
             line_edit.setReadOnly(True)
 
+        ## Real-time value line edits, in the order of real_time_values()
+        # followed by the optional laser temperature and TEC current
+        self.value_line_edits = [
+            self.temperatureLineEdit, self.vccLineEdit, self.txBiasCurrentLineEdit,
+            self.txPowerLineEdit, self.rxPowerLineEdit, self.laserTempLineEdit, self.tecCurrentLineEdit
+        ]
+
+        ## Alarm high, warning high, warning low and alarm low line edits
+        # of each real-time value
+        self.threshold_line_edits = [
+            (self.tempHighAlarmLineEdit, self.tempHighWarnLineEdit, self.tempLowWarnLineEdit, self.tempLowAlarmLineEdit),
+            (self.vccHighAlarmLineEdit, self.vccHighWarnLineEdit, self.vccLowWarnLineEdit, self.vccLowAlarmLineEdit),
+            (self.txBiasHighAlarmLineEdit, self.txBiasHighWarnLineEdit, self.txBiasLowWarnLineEdit, self.txBiasLowAlarmLineEdit),
+            (self.txPowerHighAlarmLineEdit, self.txPowerHighWarnLineEdit, self.txPowerLowWarnLineEdit, self.txPowerLowAlarmLineEdit),
+            (self.rxPowerHighAlarmLineEdit, self.rxPowerHighWarnLineEdit, self.rxPowerLowWarnLineEdit, self.rxPowerLowAlarmLineEdit),
+            (self.laserTempHighAlarmLineEdit, self.laserTempHighWarnLineEdit, self.laserTempLowWarnLineEdit, self.laserTempLowAlarmLineEdit),
+            (self.tecCurrentHighAlarmLineEdit, self.tecCurrentHighWarnLineEdit, self.tecCurrentLowWarnLineEdit, self.tecCurrentLowAlarmLineEdit),
+        ]
+
+        # Thresholds of each real-time value as shown, read once per
+        # update_alarm_warning_tab(). None until the thresholds are read.
+        self._thresholds = None
+
+        # Band each real-time value line edit is styled for, so the style
+        # sheet is only set when a value crosses into another band
+        self._bands = np.full(len(self.value_line_edits), NO_BAND)
+
         self.timer = QTimer()
         self.timer.timeout.connect(self._emit_command_restart_timer)
 
@@ -85,61 +154,62 @@ class DiagnosticMonitorDialog(QDialog, Ui_Dialog):
         self.diagnostic_plot_window.raise_()
 
     def update_alarm_warning_tab(self):
-        
+        '''! Shows the alarm and warning thresholds of the SFP and keeps
+        them for classifying the real-time values.
+        '''
         sfp_ptr = self.associated_sfp
 
-        self.tempHighAlarmLineEdit.setText(f'{sfp_ptr.get_temp_high_alarm():.3f}')
-        self.tempLowAlarmLineEdit.setText(f'{sfp_ptr.get_temp_low_alarm():.3f}')
-        self.tempHighWarnLineEdit.setText(f'{sfp_ptr.get_temp_high_warning():.3f}')
-        self.tempLowWarnLineEdit.setText(f'{sfp_ptr.get_temp_low_warning():.3f}')
-
-        # Voltage is measured in 100 uV, or 100 * 10^-6 = 10^-4 = 10000.0 
-        # if we want it in Volts
-        self.vccHighAlarmLineEdit.setText(f'{sfp_ptr.get_voltage_high_alarm() / 10000.0:.3f}')
-        self.vccLowAlarmLineEdit.setText(f'{sfp_ptr.get_voltage_low_alarm() / 10000.0:.3f}')
-        self.vccHighWarnLineEdit.setText(f'{sfp_ptr.get_voltage_high_warning() / 10000.0:.3f}')
-        self.vccLowWarnLineEdit.setText(f'{sfp_ptr.get_voltage_low_warning() / 10000.0:.3f}')
-
-        # LSB is 2 uA, or 2*10**-6
-        # If we want milli, multiply by 10^3
-        self.txBiasHighAlarmLineEdit.setText(f'{sfp_ptr.get_bias_high_alarm() * 2*10**-3:.3f}')
-        self.txBiasLowAlarmLineEdit.setText(f'{sfp_ptr.get_bias_low_alarm()*2*10**-3:.3f}')
-        self.txBiasHighWarnLineEdit.setText(f'{sfp_ptr.get_bias_high_warning()*2*10**-3:.3f}')
-        self.txBiasLowWarnLineEdit.setText(f'{sfp_ptr.get_bias_low_warning()*2*10**-3:.3f}')
-
-        # LSB is 0.1uW
-        self.txPowerHighAlarmLineEdit.setText(f'{sfp_ptr.get_tx_power_high_alarm() * 0.1:.3f}')
-        self.txPowerLowAlarmLineEdit.setText(f'{sfp_ptr.get_tx_power_low_alarm() * 0.1:.3f}')
-        self.txPowerHighWarnLineEdit.setText(f'{sfp_ptr.get_tx_power_high_warning() * 0.1:.3f}')
-        self.txPowerLowWarnLineEdit.setText(f'{sfp_ptr.get_tx_power_low_warning() * 0.1:.3f}')
-
-        # LSB is 0.1uW
-        self.rxPowerHighAlarmLineEdit.setText(f'{sfp_ptr.get_rx_power_high_alarm() * 0.1:.3f}')
-        self.rxPowerLowAlarmLineEdit.setText(f'{sfp_ptr.get_rx_power_low_alarm() * 0.1:.3f}')
-        self.rxPowerHighWarnLineEdit.setText(f'{sfp_ptr.get_rx_power_high_warning() * 0.1:.3f}')
-        self.rxPowerLowWarnLineEdit.setText(f'{sfp_ptr.get_rx_power_low_warning() * 0.1:.3f}')
-
-        self.laserTempHighAlarmLineEdit.setText(f'{sfp_ptr.get_optional_laser_temp_high_alarm():.3f}')
-        self.laserTempLowAlarmLineEdit.setText(f'{sfp_ptr.get_optional_laser_temp_low_alarm():.3f}')
-        self.laserTempHighWarnLineEdit.setText(f'{sfp_ptr.get_optional_laser_temp_high_warning():.3f}')
-        self.laserTempLowWarnLineEdit.setText(f'{sfp_ptr.get_optional_laser_temp_low_warning():.3f}')
-
-        self.tecCurrentHighAlarmLineEdit.setText(f'{sfp_ptr.get_optional_tec_current_high_alarm():.3f}')
-        self.tecCurrentLowAlarmLineEdit.setText(f'{sfp_ptr.get_optional_tec_current_low_alarm():.3f}')
-        self.tecCurrentHighWarnLineEdit.setText(f'{sfp_ptr.get_optional_tec_current_high_warning():.3f}')
-        self.tecCurrentLowWarnLineEdit.setText(f'{sfp_ptr.get_optional_laser_temp_low_warning():.3f}')
+        thresholds = [
+            (sfp_ptr.get_temp_high_alarm(), sfp_ptr.get_temp_high_warning(),
+             sfp_ptr.get_temp_low_warning(), sfp_ptr.get_temp_low_alarm()),
 
-    def update_real_time_tab(self):
-        sfp = self.associated_sfp
-        # Update the color of the text based on the value
-        # compared to thresholds
-        #
-        # Red:         >= alarm high
-        # Orange:      >= warning high
-        # Green/black: > warning low
-        # light blue:  > alarm low
-        # dark blue:   <= alarm low
+            # Voltage is measured in 100 uV, or 100 * 10^-6 = 10^-4 = 10000.0 
+            # if we want it in Volts
+            tuple(float(value) / 10000.0 for value in (
+                sfp_ptr.get_voltage_high_alarm(), sfp_ptr.get_voltage_high_warning(),
+                sfp_ptr.get_voltage_low_warning(), sfp_ptr.get_voltage_low_alarm())),
+
+            # LSB is 2 uA, or 2*10**-6
+            # If we want milli, multiply by 10^3
+            tuple(float(value) * 2*10**-3 for value in (
+                sfp_ptr.get_bias_high_alarm(), sfp_ptr.get_bias_high_warning(),
+                sfp_ptr.get_bias_low_warning(), sfp_ptr.get_bias_low_alarm())),
 
+            # LSB is 0.1uW
+            tuple(float(value) * 0.1 for value in (
+                sfp_ptr.get_tx_power_high_alarm(), sfp_ptr.get_tx_power_high_warning(),
+                sfp_ptr.get_tx_power_low_warning(), sfp_ptr.get_tx_power_low_alarm())),
+
+            # LSB is 0.1uW
+            tuple(float(value) * 0.1 for value in (
+                sfp_ptr.get_rx_power_high_alarm(), sfp_ptr.get_rx_power_high_warning(),
+                sfp_ptr.get_rx_power_low_warning(), sfp_ptr.get_rx_power_low_alarm())),
+
+            (sfp_ptr.get_optional_laser_temp_high_alarm(), sfp_ptr.get_optional_laser_temp_high_warning(),
+             sfp_ptr.get_optional_laser_temp_low_warning(), sfp_ptr.get_optional_laser_temp_low_alarm()),
+
+            (sfp_ptr.get_optional_tec_current_high_alarm(), sfp_ptr.get_optional_tec_current_high_warning(),
+             sfp_ptr.get_optional_tec_current_low_warning(), sfp_ptr.get_optional_tec_current_low_alarm()),
+        ]
+
+        # Values are compared with the thresholds as they are shown
+        self._thresholds = np.round(np.array(thresholds, dtype=float), 3)
+
+        for line_edits, row in zip(self.threshold_line_edits, self._thresholds):
+            for line_edit, threshold in zip(line_edits, row):
+                line_edit.setText(f'{threshold:.3f}')
+
+        # The bands may have moved, so every value is restyled
+        self._bands[:] = NO_BAND
+
+    def real_time_values(self) -> Tuple[float, float, float, float, float]:
+        '''! Converts the real-time diagnostic registers of the SFP into
+        the units shown in the real-time tab.
+
+        @return (temperature in C, VCC in V, TX bias in mA,
+                 TX power in uW, RX power in uW)
+        '''
+        sfp = self.associated_sfp
 
         temperature = sfp.get_temperature()
         vcc = sfp.get_vcc() / Decimal(10000.0)
@@ -147,133 +217,69 @@ class DiagnosticMonitorDialog(QDialog, Ui_Dialog):
         tx_pwr = sfp.get_tx_power() * Decimal(0.1)
         rx_pwr = sfp.calculate_rx_power_uw() * Decimal(0.1)
 
-        data_to_plot = DiagnosticData(
-            150,
-            3.5,
-            6.42,
-            0,
-            0.1
-        )
-
-        if not self.diagnostic_plot_window.isHidden():
-            logging.debug("handle new data")
-            self.diagnostic_plot_window.handle_new_data(data_to_plot)
-
-
-        self.temperatureLineEdit.setText(f'{temperature:.3f}')
-        self._update_color_indicator(
-            float(self.temperatureLineEdit.text()), 
-            float(self.tempHighAlarmLineEdit.text()),
-            float(self.tempHighWarnLineEdit.text()),
-            float(self.tempLowWarnLineEdit.text()),
-            float(self.tempLowAlarmLineEdit.text()),
-            self.temperatureLineEdit
-        )
-
-        self.vccLineEdit.setText(f'{vcc:.3f}')
-        self._update_color_indicator(
-            float(self.vccLineEdit.text()),
-            float(self.vccHighAlarmLineEdit.text()),
-            float(self.vccHighWarnLineEdit.text()),
-            float(self.vccLowWarnLineEdit.text()),
-            float(self.vccLowAlarmLineEdit.text()),
-            self.vccLineEdit
-        )
-
-        self.txBiasCurrentLineEdit.setText(f'{tx_bias:.3f}')
-        self._update_color_indicator(
-            float(self.txBiasCurrentLineEdit.text()),
-            float(self.txBiasHighAlarmLineEdit.text()),
-            float(self.txBiasHighWarnLineEdit.text()),
-            float(self.txBiasLowWarnLineEdit.text()),
-            float(self.txBiasLowAlarmLineEdit.text()),
-            self.txBiasCurrentLineEdit
-        )
-
-        self.txPowerLineEdit.setText(f'{tx_pwr:.3f}')
-        self._update_color_indicator(
-            float(self.txPowerLineEdit.text()),
-            float(self.txPowerHighAlarmLineEdit.text()),
-            float(self.txPowerHighWarnLineEdit.text()),
-            float(self.txPowerLowWarnLineEdit.text()),
-            float(self.txPowerLowAlarmLineEdit.text()),
-            self.txPowerLineEdit
-        )
-
-        self.rxPowerLineEdit.setText(f'{rx_pwr:.3f}')
-        self._update_color_indicator(
-            float(self.rxPowerLineEdit.text()),
-            float(self.rxPowerHighAlarmLineEdit.text()),
-            float(self.rxPowerHighWarnLineEdit.text()),
-            float(self.rxPowerLowWarnLineEdit.text()),
-            float(self.rxPowerLowAlarmLineEdit.text()),
-            self.rxPowerLineEdit
-        )
-
-        # Provide color coding for optional parameters
+        return float(temperature), float(vcc), float(tx_bias), float(tx_pwr), float(rx_pwr)
+
+    def record_real_time_sample(self) -> Tuple[float, float, float, float, float]:
+        '''! Adds the current real-time values to the plot history without
+        repainting anything. The plot keeps the samples while it is
+        hidden, so it already has a history when it is opened.
+
+        @return The values, see real_time_values()
+        '''
+        values = self.real_time_values()
+        self.diagnostic_plot_window.add_sample(DiagnosticData(*values))
+        return values
+
+    def update_real_time_tab(self):
+        '''! Shows the real-time values of the SFP. Each value is colored by
+        its band compared to the thresholds:
+
+        Red:         >= alarm high
+        Yellow:      >= warning high
+        White:       > warning low
+        Light blue:  > alarm low
+        Blue:        <= alarm low
+        '''
+        sfp = self.associated_sfp
+
+        values = list(self.real_time_values())
+
+        self.diagnostic_plot_window.refresh()
+
+        # The optional parameters are only supported by internally
+        # calibrated modules
         if sfp.calibration_type == SFP.CalibrationType.INTERNAL:
-            self.laserTempLineEdit.setText(f'{sfp.get_laser_temp_or_wavelength():.3f}')
-            self._update_color_indicator(
-                float(self.laserTempLineEdit.text()),
-                float(self.laserTempHighAlarmLineEdit.text()),
-                float(self.laserTempHighWarnLineEdit.text()),
-                float(self.laserTempLowWarnLineEdit.text()),
-                float(self.laserTempLowAlarmLineEdit.text()),
-                self.laserTempLineEdit
-            )
-            self.tecCurrentLineEdit.setText(f'{sfp.get_tec_current():.3f}')
-            self._update_color_indicator(
-                float(self.tecCurrentLineEdit.text()),
-                float(self.tecCurrentHighAlarmLineEdit.text()),
-                float(self.tecCurrentHighWarnLineEdit.text()),
-                float(self.tecCurrentLowWarnLineEdit.text()),
-                float(self.tecCurrentLowAlarmLineEdit.text()),
-                self.tecCurrentLineEdit
-            )
+            values += [float(sfp.get_laser_temp_or_wavelength()), float(sfp.get_tec_current())]
         else:
-            self.laserTempLineEdit.setText('Not supported')
-            self.tecCurrentLineEdit.setText('Not supported')
+            for i, line_edit in enumerate(self.value_line_edits[5:], 5):
+                line_edit.setText('Not supported')
+                if self._bands[i] != NO_BAND:
+                    line_edit.setStyleSheet('')
+                    self._bands[i] = NO_BAND
 
-        
+        # Values are compared as they are shown
+        values = np.round(np.array(values), 3)
 
-        
+        for line_edit, value in zip(self.value_line_edits, values):
+            line_edit.setText(f'{value:.3f}')
 
-    def _update_color_indicator(self, diagnostic_value: Union[Decimal, float], 
-        alarm_high: Union[Decimal, float], warning_high: Union[Decimal, float], 
-        warning_low: Union[Decimal, float], alarm_low: Union[Decimal, float], 
-        line_edit: QLineEdit
-    ):
+        if self._thresholds is not None:
+            self._update_color_indicators(values)
+
+    def _update_color_indicators(self, values: np.ndarray):
         '''! Updates the color of real-time diagnostic values to visually indicate
-        where they are compared to alarm and warning thresholds. Text color is
-        RED for alarm high, YELLOW for warning high, BLACK for normal, LIGHT BLUE
-        for warning low, and BLUE for alarm low.
-
-        @param diagnostic_value The diagnostic value to be interpreted
-        @param alarm_high The alarm high threshold
-        @param warning_high The warning high threshold
-        @param warning_low The warning low threshold
-        @param alarm_low The alarm low threshold
-        @param line_edit The QLineEdit object to be updated
+        where they are compared to alarm and warning thresholds. A style sheet
+        is only set when a value crosses into another band.
+
+        @param values The shown real-time values, in the order of
+                      value_line_edits
         '''
+        bands = classify_bands(values, self._thresholds)
 
-        # Colors in qtStyleSheet format
-        RED = 'rgb(255, 0, 0)'
-        YELLOW = 'rgb(237, 212, 0)'
-        BLACK = 'rgb(0, 0, 0)'
-        LIGHT_BLUE = 'rgb(114, 159, 207)'
-        BLUE = 'rgb(0, 0, 255)'
-        WHITE = 'rgb(255, 255, 255)'
-
-        if diagnostic_value >= alarm_high:
-            line_edit.setStyleSheet(f'background-color: {RED}; color: {WHITE}')
-        elif diagnostic_value >= warning_high:
-            line_edit.setStyleSheet(f'background-color: {YELLOW}; color: {BLACK}')
-        elif diagnostic_value > warning_low:
-            line_edit.setStyleSheet(f'background-color: {WHITE}; color: {BLACK}')
-        elif diagnostic_value > alarm_low:
-            line_edit.setStyleSheet(f'background-color: {LIGHT_BLUE}; color: {BLACK}')
-        else:
-            line_edit.setStyleSheet(f'background-color: {BLUE}; color: {WHITE}')
+        for i in np.flatnonzero(bands != self._bands[:len(bands)]):
+            self.value_line_edits[i].setStyleSheet(BAND_STYLE_SHEETS[bands[i]])
+
+        self._bands[:len(bands)] = bands
 
     def _emit_command_restart_timer(self):
         '''! Emits the timed_command signal and restarts the timer.'''
@@ -0,0 +1,335 @@
+##
+# @file persona_table_model.py
+# @brief Table model of the personas shown on the main screen.
+#
+# @section file_author Author
+# - Created on 10/19/2026
+#
+# Rows are read from the storage repository one page at a time, when the
+# view scrolls near the end of the rows it already has. Sorting is done by
+# the database, and only the columns that are shown are read.
+#
+# Personas are never changed once stored, so personas added after the
+# table was loaded are found by their ID alone and merged into the rows
+# that are already loaded.
+#
+# Given a DatabaseWorker, every query runs on the worker and the rows are
+# added when it is done, so the GUI thread never waits on the database.
+##
+
+##
+# Standard Imports
+##
+from typing import Callable, List, Optional, Set
+
+##
+# Third Party Library Imports
+##
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt, pyqtSignal
+from PyQt5.QtGui import QFont
+
+##
+# Local Library Imports
+##
+from modules.core.sfp import connector_type_name
+from modules.database.repository import PersonaQuery, PersonaSummary, get_repository
+
+class PersonaTableModel(QAbstractTableModel):
+    '''! Lazily loaded table of personas.
+
+    @brief Usage:
+        model = PersonaTableModel()
+        table_view.setModel(model)
+        model.refresh()
+    '''
+
+    ## Number of rows read from the database at a time
+    FETCH_SIZE = 256
+
+    ## Emitted with True when a query starts and False when it is done
+    loading_changed = pyqtSignal(bool)
+
+    ## Emitted with the error message when a query fails
+    load_failed = pyqtSignal(str)
+
+    ## Emitted with the number of new personas found by fetch_new_rows()
+    new_rows_found = pyqtSignal(int)
+
+    ## Header text and PersonaSummary field of each column
+    COLUMNS = [
+        ('ID', 'id'),
+        ('Vendor ID', 'vendor_name'),
+        ('Vendor Part Number', 'part_number'),
+        ('Vendor Serial Number', 'serial_number'),
+        ('Connector Type', 'connector'),
+        ('Wavelength (nm)', 'wavelength'),
+    ]
+
+    def __init__(self, repository=None, parent=None, worker=None):
+        '''! Initializes an empty model. Nothing is read until refresh()
+        or sort() is called.
+
+        @param repository The StorageRepository to read from, the
+                          process-wide repository by default
+        @param parent The parent QObject
+        @param worker The DatabaseWorker to run queries on, or None to
+                      run them right away
+        '''
+        super().__init__(parent)
+
+        self._repository = repository
+        self._worker = worker
+        self._pending = 0
+        self._fetching = False
+
+        # Incremented when the rows are dropped, so that results of
+        # queries made for the old rows are ignored
+        self._generation = 0
+
+        self._rows: List[PersonaSummary] = []
+        self._row_ids: Set[int] = set()
+        self._has_more = False
+        self._last_seen_id = 0
+        self._order_by = 'id'
+
+        # _last_seen_id is only known once a first page was read, so
+        # fetch_new_rows() waits for it
+        self._first_page_loaded = False
+        self._new_rows_requested = False
+        self._descending = False
+
+        self._header_font = QFont()
+        self._header_font.setBold(True)
+
+    def _get_repository(self):
+        if self._repository is None:
+            self._repository = get_repository()
+        return self._repository
+
+    def _run(self, job: Callable, on_result: Callable) -> None:
+        '''! Runs a query on the worker, or right away without one, and
+        hands its result to on_result.
+        '''
+        generation = self._generation
+        self._add_pending(1)
+
+        def deliver(result):
+            if generation != self._generation:
+                return
+            self._add_pending(-1)
+            on_result(result)
+
+        def fail(error):
+            if generation != self._generation:
+                return
+            self._add_pending(-1)
+            self._fetching = False
+            self.load_failed.emit(f'{error}')
+
+        if self._worker is not None:
+            self._worker.submit(job, on_result=deliver, on_error=fail)
+            return
+
+        try:
+            result = job()
+        except Exception as ex:
+            fail(ex)
+            return
+        deliver(result)
+
+    def _add_pending(self, count: int) -> None:
+        was_loading = self.is_loading()
+        self._pending += count
+
+        if self.is_loading() != was_loading:
+            self.loading_changed.emit(self.is_loading())
+
+    def is_loading(self) -> bool:
+        '''! Gets whether a query is running.'''
+        return self._pending > 0
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self.COLUMNS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+
+        field = self.COLUMNS[index.column()][1]
+        value = getattr(self._rows[index.row()], field)
+
+        if field == 'connector':
+            return connector_type_name(value)
+
+        return str(value)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation != Qt.Horizontal:
+            return None
+
+        if role == Qt.DisplayRole:
+            return self.COLUMNS[section][0]
+
+        if role == Qt.FontRole:
+            return self._header_font
+
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return not parent.isValid() and self._has_more and not self._fetching
+
+    def fetchMore(self, parent=QModelIndex()) -> None:
+        '''! Reads the next page of rows from the database.'''
+        if parent.isValid() or self._fetching:
+            return
+
+        # Pages continue after the last loaded row rather than at an
+        # offset, which would shift when new rows are merged in
+        order_by = self._order_by
+        descending = self._descending
+        after = self._rows[-1] if self._rows else None
+
+        self._fetching = True
+        self._run(
+            lambda: self._get_repository().search_personas(
+                PersonaQuery(), limit=self.FETCH_SIZE, order_by=order_by,
+                descending=descending, after=after
+            ),
+            self._append_rows
+        )
+
+    def _append_rows(self, rows: List[PersonaSummary]) -> None:
+        self._fetching = False
+        self._has_more = len(rows) == self.FETCH_SIZE
+
+        rows = [row for row in rows if row.id not in self._row_ids]
+        if not rows:
+            return
+
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._rows.extend(rows)
+        self._row_ids.update(row.id for row in rows)
+        self.endInsertRows()
+
+    def fetch_new_rows(self) -> None:
+        '''! Reads the personas added since the last refresh and merges
+        them into the loaded rows at their sorted position. The number of
+        new personas is emitted with new_rows_found.
+
+        @brief A new persona that sorts after the last loaded row is left
+        for fetchMore() to read when the user scrolls there. While the
+        first page is read, this runs once it arrives.
+        '''
+        if not self._first_page_loaded:
+            self._new_rows_requested = True
+            return
+
+        query = PersonaQuery(after_id=self._last_seen_id)
+
+        self._run(lambda: self._get_repository().search_personas(query), self._merge_new_rows)
+
+    def _merge_new_rows(self, rows: List[PersonaSummary]) -> None:
+        for row in rows:
+            self._last_seen_id = max(self._last_seen_id, row.id)
+
+            if row.id in self._row_ids:
+                continue
+
+            position = self._insert_position(row)
+            if position == len(self._rows) and self._has_more:
+                continue
+
+            self.beginInsertRows(QModelIndex(), position, position)
+            self._rows.insert(position, row)
+            self._row_ids.add(row.id)
+            self.endInsertRows()
+
+        self.new_rows_found.emit(len(rows))
+
+    def _sort_key(self, row: PersonaSummary) -> tuple:
+        '''! Gets the key a row is sorted by, the same way the database
+        sorts it. Text is compared without case.
+        '''
+        value = getattr(row, self._order_by)
+        if isinstance(value, str):
+            value = value.lower()
+        return (value, row.id)
+
+    def _insert_position(self, row: PersonaSummary) -> int:
+        '''! Binary searches the loaded rows for where a row belongs.'''
+        key = self._sort_key(row)
+        low, high = 0, len(self._rows)
+
+        while low < high:
+            middle = (low + high) // 2
+            middle_key = self._sort_key(self._rows[middle])
+
+            if (middle_key > key) if self._descending else (middle_key < key):
+                low = middle + 1
+            else:
+                high = middle
+
+        return low
+
+    def sort(self, column: int, order=Qt.AscendingOrder) -> None:
+        '''! Sorts the rows in the database and reads the first page again.'''
+        self._order_by = self.COLUMNS[column][1]
+        self._descending = order == Qt.DescendingOrder
+        self.refresh()
+
+    def refresh(self) -> None:
+        '''! Drops every row and reads the first page again.'''
+        # Queries made for the old rows are no longer waited on
+        self._generation += 1
+        self._add_pending(-self._pending)
+        self._fetching = True
+        self._first_page_loaded = False
+
+        self.beginResetModel()
+        self._rows = []
+        self._row_ids = set()
+        self._has_more = False
+        self.endResetModel()
+
+        order_by = self._order_by
+        descending = self._descending
+
+        def read_first_page():
+            repository = self._get_repository()
+
+            # The newest ID is read first, so a persona added while the
+            # first page is read is not missed by fetch_new_rows()
+            newest = repository.search_personas(PersonaQuery(), limit=1, descending=True)
+            rows = repository.search_personas(
+                PersonaQuery(), limit=self.FETCH_SIZE, order_by=order_by, descending=descending
+            )
+            return (newest[0].id if newest else 0), rows
+
+        self._run(read_first_page, self._set_first_page)
+
+    def _set_first_page(self, result) -> None:
+        self._last_seen_id, rows = result
+        self._first_page_loaded = True
+        self._append_rows(rows)
+
+        if self._new_rows_requested:
+            self._new_rows_requested = False
+            self.fetch_new_rows()
+
+    def persona_id(self, row: int) -> int:
+        '''! Gets the persona ID of a row.'''
+        return self._rows[row].id
+
+    def legacy_id(self, row: int) -> Optional[int]:
+        '''! Gets the legacy page table ID of a row, which docking stations
+        reprogram modules from, or None if the persona has none.
+        '''
+        return self._rows[row].legacy_id
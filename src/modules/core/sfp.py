@@ -19,6 +19,46 @@ from typing import List
 from modules.core.convert import *
 from enum import Enum
 
+# From SFF-8024 Table 4-3
+def connector_type_name(code: int) -> str:
+    '''! Gets the name of a connector type code, page 0xA0 byte 2.'''
+    result = [
+        'Unknown or unspecified',
+        'SC (Subscriber Connector)',
+        'Fibre Channel Style 1 copper connector',
+        'Fibre Channel Style 2 copper connector',
+        'BNC/TNC (Bayonet/Threaded Neill-Concelman)',
+        'Fibre Channel coax headers',
+        'Fibre Jack',
+        'LC (Lucent Connector)',
+        'MT-RJ (Mechanical Transfer - Registered Jack)',
+        'MU (Multiple Optical)',
+        'SG',
+        'Optical Pigtail',
+        'MPO 1x12 (Multifiber Parallel Optic)',
+        'MPO 2x16']
+
+    result2 = [
+        'HSSDC II (High Speed Serial Data Connector)',
+        'Copper Pigtail',
+        'RJ45 (Registered Jack)',
+        'No seperable connector',
+        'MXC 2x16',
+        'CS optical connector',
+        'SN (previously Mini CS) optical connector',
+        'MPO 2x12',
+        'MPO 1x16',
+    ]
+
+    if code < 0x0E:
+        return result[code]
+    elif (code >= 0x0E and code <= 0x1F) or (code >= 0x29 and code <= 0x7F):
+        return "Reserved"
+    elif code > 0x1F and code < 0x29:
+        return result2[code - 0x20]
+    else:
+        return "Vendor specific"
+
 class SFP:
     '''! Class used for interpreting EEPROM values of SFP+ modules.
     Has two lists of integers that represent the memory map
@@ -169,45 +209,7 @@ class SFP:
 
     # From SFF-8024 Table 4-3
     def get_connector_type(self) -> str:
-        code = self.page_a0[2]
-
-        result = [
-            'Unknown or unspecified',
-            'SC (Subscriber Connector)',
-            'Fibre Channel Style 1 copper connector',
-            'Fibre Channel Style 2 copper connector',
-            'BNC/TNC (Bayonet/Threaded Neill-Concelman)',
-            'Fibre Channel coax headers',
-            'Fibre Jack',
-            'LC (Lucent Connector)',
-            'MT-RJ (Mechanical Transfer - Registered Jack)',
-            'MU (Multiple Optical)',
-            'SG',
-            'Optical Pigtail',
-            'MPO 1x12 (Multifiber Parallel Optic)',
-            'MPO 2x16']
-        
-        result2 = [
-            'HSSDC II (High Speed Serial Data Connector)',
-            'Copper Pigtail',
-            'RJ45 (Registered Jack)',
-            'No seperable connector',
-            'MXC 2x16',
-            'CS optical connector',
-            'SN (previously Mini CS) optical connector',
-            'MPO 2x12',
-            'MPO 1x16',
-        ]
-
-        if code < 0x0E:
-            return result[code]
-        elif (code >= 0x0E and code <= 0x1F) or (code >= 0x29 and code <= 0x7F):
-            return "Reserved"
-        elif code > 0x1F and code < 0x29:
-            print(f'{code - 0x20 = }')
-            return result2[code - 0x20]
-        else:
-            return "Vendor specific"
+        return connector_type_name(self.page_a0[2])
 
     # See comments in method
     def get_transceiver_info(self) -> List[str]:
@@ -8,12 +8,12 @@
 # - Modified on 10/19/2021 by Connor DeCamp
 # - Modified on 10/21/2021 by Connor DeCamp
 # - Modified on 11/04/2021 by Connor DeCamp
+# - Modified on 10/19/2026
 ##
 
 ##
 # Standard Imports
 ##
-import time
 from typing import Tuple
 import logging
 
@@ -22,22 +22,25 @@ import logging
 ##
 from PyQt5 import QtCore
 from PyQt5.QtWidgets import QAbstractScrollArea, QErrorMessage,\
-                            QListWidgetItem, QPlainTextEdit,\
-                            QTableWidgetItem, QMainWindow
+                            QListWidgetItem, QMainWindow
 
 ##
 # Local Library Imports
 ## 
 
 from modules.core.sfp import SFP
-from modules.core.monitor_dialog import DiagnosticMonitorDialog
+from modules.core.database_worker import get_database_worker
+from modules.core.debug_log import DebugLog
 from modules.core.window_autogen import Ui_MainWindow
 from modules.core.memory_map_dialog import MemoryMapDialog
+from modules.core.persona_table_model import PersonaTableModel
+from modules.database.repository import get_repository
+from modules.database.telemetry_store import TelemetryStore
 
 from modules.network.message import MessageCode, Message
 from modules.network.message import ReadRegisterMessage, bytes_to_message
-from modules.network.network_threads import BroadcastWorker
-from modules.network.sql_connection import SQLConnection
+from modules.network.discovery_cache import DiscoveryCache
+from modules.network.network_threads import BroadcastWorker, SubnetSweepWorker
 from modules.network.tcp_server import TCPServer
 from modules.network.utility import DeviceType
 
@@ -60,13 +63,32 @@ class Window(QMainWindow, Ui_MainWindow):
         super().__init__(parent)
         self.setupUi(self)
 
+        ## Shows the debug messages on the log tab in batches
+        self.debug_log = DebugLog(self.plainTextEdit, parent=self)
+
+        ## Runs database queries so the window never waits on them
+        self.database_worker = get_database_worker()
+        self.database_worker.job_failed.connect(self.append_to_debug_log)
+
+        ## Personas shown in the SFP table, read from the database as
+        # the user scrolls
+        self.persona_model = PersonaTableModel(parent=self, worker=self.database_worker)
+        self.personaTableView.setModel(self.persona_model)
+        self.persona_model.loading_changed.connect(self._handle_persona_loading_changed)
+        self.persona_model.load_failed.connect(self._handle_database_error)
+        self.persona_model.new_rows_found.connect(
+            lambda count: self.append_to_debug_log(f"Added {count} new personas to the SFP table")
+        )
+
         # User-defined setup methods
         self.connect_signal_slots()
 
         # Allow columns to adjust to their contents
-        self.tableWidget.setSizeAdjustPolicy(QAbstractScrollArea.AdjustToContents)
-        self.tableWidget.resizeColumnsToContents()
-        self.tableWidget.verticalHeader().setVisible(False)
+        self.personaTableView.setSizeAdjustPolicy(QAbstractScrollArea.AdjustToContents)
+        self.personaTableView.verticalHeader().setVisible(False)
+
+        ## Devices that were already discovered
+        self.discovery_cache = DiscoveryCache()
 
         self.append_to_debug_log('Starting UDP device discovery thread')
         self.udp_thread = QtCore.QThread()
@@ -78,6 +100,19 @@ class Window(QMainWindow, Ui_MainWindow):
         self.kill_signal.connect(self.worker.cleanup)
         self.udp_thread.start()
 
+        # Unicast sweeps reach devices on routed segments that
+        # broadcasts cannot. Only used if ranges are configured.
+        self.sweep_worker = SubnetSweepWorker()
+        self.sweep_thread = QtCore.QThread()
+
+        if self.sweep_worker.is_enabled():
+            self.append_to_debug_log('Starting unicast subnet sweep discovery thread')
+            self.sweep_worker.moveToThread(self.sweep_thread)
+            self.sweep_worker.device_response.connect(self.handle_udp_client_message)
+            self.sweep_thread.started.connect(self.sweep_worker.on_thread_start)
+            self.kill_signal.connect(self.sweep_worker.cleanup)
+            self.sweep_thread.start()
+
         #udp_thread = BroadcastThread()
         #udp_thread.device_response.connect(self.handleUdpClientMessage)
         #self.kill_signal.connect(udp_thread.main_window_close_event_handler)
@@ -94,15 +129,16 @@ class Window(QMainWindow, Ui_MainWindow):
         self.tcp_server.update_ui_signal.connect(self.handle_update_ui_signal)
         self.tcp_server.log_signal.connect(self.append_to_debug_log)
 
-        self.tcp_server.diagnostic_init_a0_signal.connect(self.handle_init_diagnostic_a0)
-        self.tcp_server.diagnostic_init_a2_signal.connect(self.handle_init_diagnostic_a2)
-        self.tcp_server.real_time_refresh_signal.connect(self.handle_real_time_refresh)
         self.tcp_server.remote_io_error_signal.connect(self.handle_remote_io_error)
 
         self.dock_discover_signal.connect(self.tcp_server.init_dock_connection)
         self.cloudplug_discover_signal.connect(self.tcp_server.init_cloudplug_connection)
         self.send_command_signal.connect(self.tcp_server.handle_send_command_signal)
         self.kill_signal.connect(self.tcp_server._close_all_connections)
+
+        # A device going away is a topology change, so discovery
+        # should go back to broadcasting quickly
+        self.tcp_server.client_disconnected_signal.connect(self.worker.reset_broadcast_interval)
         
         self.tcp_thread.started.connect(self.tcp_server.open_session)
         self.tcp_thread.start()
@@ -132,61 +168,62 @@ class Window(QMainWindow, Ui_MainWindow):
 
         #self.tcp_server_thread.start()
         
-        ## The diagnostic monitoring window object
-        self.diagnostic_monitor_dialog = DiagnosticMonitorDialog(self)
-        self.diagnostic_monitor_dialog.timed_command.connect(self.handle_diagnostic_timer_timeout)
+        ## Keeps every real-time diagnostic sample, written in the background
+        self.telemetry_store = TelemetryStore()
+
+        ## Diagnostic monitoring of every docking station the user opened,
+        # created when the first one is opened, see _get_monitor_dashboard()
+        self.monitor_dashboard = None
         
-        # Populate the table when the application opens
-        try:
-            self._refresh_sfp_table()
-        except Exception as ex:
-            logging.error(f'{ex}')
-            error_dialog = QErrorMessage()
-            error_dialog.showMessage(f'{ex}')
-            error_dialog.exec()
-            self.kill_signal.emit(-1)
-            time.sleep(2)
-            raise ex
+        # Populate the table once the window is painted. The window
+        # shows while the personas are read.
+        QtCore.QTimer.singleShot(0, self._refresh_sfp_table)
+
+    def _get_monitor_dashboard(self):
+        '''! Creates the monitor dashboard on first use. Its windows and
+        plots are slow to import, so the main window shows without them.
+
+        @return The MonitorDashboard
+        '''
+        if self.monitor_dashboard is None:
+            from modules.core.monitor_dashboard import MonitorDashboard
+
+            self.monitor_dashboard = MonitorDashboard(self.telemetry_store, parent_widget=self)
+            self.monitor_dashboard.send_command.connect(self.send_command_signal)
+            self.tcp_server.diagnostic_init_a0_signal.connect(self.monitor_dashboard.handle_init_diagnostic_a0)
+            self.tcp_server.diagnostic_init_a2_signal.connect(self.monitor_dashboard.handle_init_diagnostic_a2)
+            self.tcp_server.real_time_refresh_signal.connect(self.monitor_dashboard.handle_real_time_refresh)
+
+        return self.monitor_dashboard
 
     def connect_signal_slots(self):
         # Connect the 'Reprogram Cloudplugs' button to the correct callback
         self.reprogramButton.clicked.connect(self.cloudplug_reprogram_button_handler)
-        self.tableWidget.doubleClicked.connect(self.display_sfp_memory_map)
+        self.personaTableView.doubleClicked.connect(self.display_sfp_memory_map)
         self.readSfpMemoryButton.clicked.connect(self.clone_sfp_memory_button_handler)
         self.monitorSfpButton.clicked.connect(self.display_monitor_dialog)
 
     def display_sfp_memory_map(self, clicked_model_index):
 
         # The SFP the user double clicked from the table
-        selected_row_in_table = clicked_model_index.row()
-
-        selected_sfp_id = int(self.tableWidget.item(
-            selected_row_in_table, 0
-        ).text())
-
-        mydb = SQLConnection()
-        mycursor = mydb.get_cursor()
-        mycursor.execute(f"SELECT * FROM sfp_info.page_a0 WHERE id={selected_sfp_id};")
-
-        page_a0 = []
-
-        # Get the page_a0 values from the cursor
-        for res in mycursor:
-            for i in range(1, len(res)):
-                page_a0.append(res[i])
+        selected_sfp_id = self.persona_model.persona_id(clicked_model_index.row())
 
-        mycursor.execute(f"SELECT * FROM sfp_info.page_a2 WHERE id={selected_sfp_id};")
+        self.statusbar.showMessage(f'Loading SFP {selected_sfp_id}...')
+        self.database_worker.submit(
+            lambda: get_repository().get_persona(selected_sfp_id),
+            on_result=lambda persona: self._show_sfp_memory_map(selected_sfp_id, persona),
+            on_error=self._handle_database_error
+        )
 
-        page_a2 = []
+    def _show_sfp_memory_map(self, selected_sfp_id: int, persona) -> None:
+        '''! Opens the memory map dialog of a persona once it is read.'''
+        self.statusbar.clearMessage()
 
-        # Get the page_a2 values from the cursor
-        for res in mycursor:
-            for i in range(1, len(res)):
-                page_a2.append(res[i])
-
-        mydb.close()
+        if persona is None:
+            self.append_to_debug_log(f'SFP with ID {selected_sfp_id} no longer exists')
+            return
 
-        sfp = SFP(page_a0, page_a2)
+        sfp = SFP(persona.page_a0, persona.page_a2)
 
         # Compare checksum values
         #print(format(sfp.calculate_cc_base(), '02X'))
@@ -199,32 +236,6 @@ class Window(QMainWindow, Ui_MainWindow):
         memory_dialog.refresh_stress_scenario_table(selected_sfp_id)
         memory_dialog.show()
 
-    def append_row_to_sfp_table(self, id_memory_map_tuple: Tuple) -> None:
-        '''! Appends an entry to the SFP table shown on the main screen
-        of the application. The page 0xA0 identifying information is
-        used to determine vendor name, part number, serial number, etc.
-        
-        @param id_memory_map_tuple A tuple consisting of the SFP ID from the database
-        and the information page (0xA0) memory map values.
-        '''
-        self.append_to_debug_log(f'Adding SFP with ID {id_memory_map_tuple[0]} to SFP table')
-
-        ID = 0
-        temp_sfp = SFP(id_memory_map_tuple[1:], [0]*256)
-
-        rowPosition = self.tableWidget.rowCount()        
-        self.tableWidget.insertRow(rowPosition)
-
-        self.tableWidget.setItem(rowPosition, 0, QTableWidgetItem(str(id_memory_map_tuple[ID])))
-        self.tableWidget.setItem(rowPosition, 1, QTableWidgetItem(temp_sfp.get_vendor_name()))
-        self.tableWidget.setItem(rowPosition, 2, QTableWidgetItem(temp_sfp.get_vendor_part_number()))
-        self.tableWidget.setItem(rowPosition, 3, QTableWidgetItem(temp_sfp.get_vendor_serial_number()))
-        self.tableWidget.setItem(rowPosition, 4, QTableWidgetItem(temp_sfp.get_connector_type()))
-        self.tableWidget.setItem(rowPosition, 5, QTableWidgetItem(str(temp_sfp.get_wavelength())))
-
-
-        self.tableWidget.resizeColumnsToContents()
-
     def cloudplug_reprogram_button_handler(self) -> None:
         """! User presses this button to reprogram the selected cloudplugs with
         a single selected SFP/SFP+ persona.
@@ -242,7 +253,7 @@ class Window(QMainWindow, Ui_MainWindow):
             error_dialog.exec()
             return
 
-        selected_sfp_persona = self.tableWidget.selectionModel().selectedIndexes()
+        selected_sfp_persona = self.personaTableView.selectionModel().selectedRows()
 
         if len(selected_sfp_persona) == 0:
             error_dialog = QErrorMessage()
@@ -250,8 +261,16 @@ class Window(QMainWindow, Ui_MainWindow):
             error_dialog.exec()
             return
 
-        sfp_id = int(selected_sfp_persona[0].data())
+        # Docking stations read the persona from the legacy page tables,
+        # so the legacy ID is sent, not the ID of the personas table
+        sfp_id = self.persona_model.legacy_id(selected_sfp_persona[0].row())
 
+        if sfp_id is None:
+            error_dialog = QErrorMessage()
+            error_dialog.showMessage("This SFP has no legacy page table row, so CloudPlugs can not be "
+                                     "reprogrammed with it!")
+            error_dialog.exec()
+            return
 
         msg_code = MessageCode.REPGORAM_CLOUDPLUG
         data_to_send = [sfp_id]
@@ -275,18 +294,31 @@ class Window(QMainWindow, Ui_MainWindow):
 
         received_message = bytes_to_message(raw_data)
 
+        if MessageCode(received_message.code) == MessageCode.DOCK_DISCOVER_ACK:
+            device_type = DeviceType.DOCKING_STATION
+            discover_signal = self.dock_discover_signal
+        elif MessageCode(received_message.code) == MessageCode.CLOUDPLUG_DISCOVER_ACK:
+            device_type = DeviceType.CLOUDPLUG
+            discover_signal = self.cloudplug_discover_signal
+        else:
+            self.append_to_debug_log(f"Unknown data from {sender_ip}:{sender_port}")
+            return
+
+        # Devices reply to every DISCOVER round, only new or expired
+        # devices need a connection to be set up
+        if not self.discovery_cache.observe(sender_ip, device_type):
+            return
+
         self.append_to_debug_log(received_message)
 
-        if MessageCode(received_message.code) == MessageCode.DOCK_DISCOVER_ACK:
+        if device_type == DeviceType.DOCKING_STATION:
             self.append_to_debug_log(f"Discovered DOCKING STATION at {sender_ip}:{sender_port}")
             logging.debug(f"Emitting DOCK {sender_ip}")
-            self.dock_discover_signal.emit(sender_ip)
-        elif MessageCode(received_message.code) == MessageCode.CLOUDPLUG_DISCOVER_ACK:
+        else:
             self.append_to_debug_log(f"Discovered CLOUDPLUG at {sender_ip}:{sender_port}")
             logging.debug(f"Emitting CLOUDPLUG {sender_ip}")
-            self.cloudplug_discover_signal.emit(sender_ip)
-        else:
-            self.append_to_debug_log(f"Unknown data from {sender_ip}:{sender_port}")
+
+        discover_signal.emit(sender_ip)
 
     def clone_sfp_memory_button_handler(self):
         '''! Method that handles when the "Clone SFP Memory" button is
@@ -324,6 +356,8 @@ class Window(QMainWindow, Ui_MainWindow):
         device_type = data[0]
         device_ip = data[1]
 
+        self.discovery_cache.mark_connected(device_ip, device_type)
+
         if device_type == DeviceType.DOCKING_STATION:
             self.dockingStationList.addItem(QListWidgetItem(device_ip))
         elif device_type == DeviceType.CLOUDPLUG:
@@ -342,10 +376,15 @@ class Window(QMainWindow, Ui_MainWindow):
         device_type = data[0]
         device_ip = data[1]
 
+        self.discovery_cache.mark_disconnected(device_ip, device_type)
+
         if device_type == DeviceType.DOCKING_STATION:
             for item in self.dockingStationList.findItems(device_ip, QtCore.Qt.MatchExactly):
                 row_of_item = self.dockingStationList.row(item)
                 self.dockingStationList.takeItem(row_of_item) # removeListItem didn't work
+
+            if self.monitor_dashboard is not None:
+                self.monitor_dashboard.close_session(device_ip)
         elif device_type == DeviceType.CLOUDPLUG:
             for item in self.listWidget.findItems(device_ip, QtCore.Qt.MatchExactly):
                 row_of_item = self.listWidget.row(item)
@@ -361,7 +400,7 @@ class Window(QMainWindow, Ui_MainWindow):
         if code == MessageCode.CLONE_SFP_MEMORY_SUCCESS:
             self.append_to_debug_log("A docking station successfully, cloned SFP memory")
             self.readSfpMemoryButton.setEnabled(True)
-            self._refresh_sfp_table()
+            self._fetch_new_personas()
         elif code == MessageCode.CLONE_SFP_MEMORY_ERROR:
             self.append_to_debug_log("A docking station had an error reading SFP memory.")
             self.readSfpMemoryButton.setEnabled(True)
@@ -369,162 +408,74 @@ class Window(QMainWindow, Ui_MainWindow):
     def _refresh_sfp_table(self):
         '''! Refreshes the SFP table on the main screen.
 
-        @brief Accesses the SFP database to refresh all of the available
-        personas.
+        @brief Only the first page of personas is read, the rest are read
+        as the user scrolls down the table.
         '''
-        sql_statement = "SELECT * FROM page_a0"
-        self.append_to_debug_log(f"Executing SQL STATEMENT: {sql_statement}")
-        
-        db = SQLConnection()
-
-        cursor = db.get_cursor()
-        cursor.execute(sql_statement)
-
-        self.tableWidget.setRowCount(0)
-
-        for data_tuple in cursor:
-            self.append_row_to_sfp_table(data_tuple)
+        self.append_to_debug_log("Loading personas from the database")
+
+        # Personas cloned by the docking stations land in the legacy
+        # page tables first
+        self.database_worker.submit(
+            lambda: get_repository().import_legacy_pages(),
+            on_result=lambda _: self.persona_model.refresh(),
+            on_error=self._handle_database_error
+        )
+
+    def _fetch_new_personas(self):
+        '''! Adds the personas stored since the SFP table was loaded,
+        without reading the rest of the table again.
+        '''
+        self.database_worker.submit(
+            lambda: get_repository().import_legacy_pages(),
+            on_result=lambda _: self.persona_model.fetch_new_rows(),
+            on_error=self._handle_database_error
+        )
+
+    def _handle_persona_loading_changed(self, loading: bool):
+        '''! Shows that personas are being read until they are in the table.'''
+        if loading:
+            self.statusbar.showMessage("Loading personas...")
+        else:
+            self.statusbar.clearMessage()
+            self.personaTableView.resizeColumnsToContents()
 
-        db.close()
+    def _handle_database_error(self, error):
+        '''! Reports a failed query. The window keeps working without
+        the database, so the query can be made again later.
+        '''
+        logging.error(f'{error}')
+        self.append_to_debug_log(f'Database error: {error}')
+        self.statusbar.showMessage(f'Database unavailable: {error}')
     
         
     def display_monitor_dialog(self):
-        '''! Function to display the diagnostic monitoring dialog.
+        '''! Function to display the diagnostic monitoring dialogs.
 
-        @brief If the user has selected a connected Docking Station,
-        it opens a diagnostic monitoring dialog that allows the user
-        to see the diagnostics of the SFP module.
+        @brief Opens a diagnostic monitoring dialog for every selected
+        Docking Station, each showing the diagnostics of the SFP module
+        in that Docking Station.
         '''
         selected_items = self.dockingStationList.selectedItems()
         
-        if len(selected_items) != 1:
+        if not selected_items:
             error_msg = QErrorMessage()
-            if len(selected_items) > 1:
-                error_msg.showMessage("You can only choose 1 Docking Station!")
-            else:
-                error_msg.showMessage("No Docking Stations are available!")
+            error_msg.showMessage("No Docking Stations are available!")
 
             error_msg.exec()
             error_msg.deleteLater()
-        else:
-            selected_item = selected_items[0]
-            # We need to read a lot of values from the SFP before
-            # we start doing diagnostic monitoring
-            # Initially, we need to read:
-            #   - Vendor name (16 bytes)
-            #   - Part number (16 bytes)
-            #   - Diagnostic Monitoring Type (1 byte)
-            #   - ALL of the alarm and warning thresholds (40 or 56 bytes)
-
-            # So we are expecting at least 73 and at most
-            # 89 bytes back from the docking station
-
-            dock_ip = selected_item.text()
-            self.diagnostic_monitor_dialog.dock_ip = dock_ip
-
-            page_a0_registers = [20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35,
-                                 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55,
-                                 92]
-            msg = ReadRegisterMessage(MessageCode.DIAGNOSTIC_INIT_A0, "", 0x50, page_a0_registers)
-            self.send_command_signal.emit((dock_ip, msg))
-
-            page_a2_registers = [i for i in range(91 + 1)]
-            page_a2_registers += [i for i in range(96, 109 + 1)]
-            msg = ReadRegisterMessage(MessageCode.DIAGNOSTIC_INIT_A2, "", 0x51, page_a2_registers)
-            self.send_command_signal.emit((dock_ip, msg))
-
-            self.diagnostic_monitor_dialog.start_timer()
-            self.diagnostic_monitor_dialog.show()
-
-    def handle_init_diagnostic_a0(self, cmd: ReadRegisterMessage):
-        '''! Handles updating identifying information from the SFP inserted
-        in the docking station. This is so the user knows what SFP
-        is being monitored.
-
-        @param cmd The ReadRegisterMessage object received from the TCP Server.
-        '''
-        sfp_ptr = self.diagnostic_monitor_dialog.associated_sfp
-
-        i = 0
-        for val in cmd.register_numbers[0:16]:
-            sfp_ptr.page_a0[20 + i] = val
-            i += 1
-
-        i = 0        
-        for val in cmd.register_numbers[16:32]:
-            sfp_ptr.page_a0[40 + i] = val
-            i += 1
-
-        diagnostic_int = cmd.register_numbers[len(cmd.register_numbers) - 1]
-        sfp_ptr.page_a0[92] = diagnostic_int
-        sfp_ptr.force_calibration_check()
-
-        calibration_str = ""
-        if sfp_ptr.calibration_type == SFP.CalibrationType.INTERNAL:
-            calibration_str = "Internally Calibrated"
-        elif sfp_ptr.calibration_type == SFP.CalibrationType.EXTERNAL:
-            calibration_str = "Externally Calibrated"
-
-        self.diagnostic_monitor_dialog.lineEdit.setText(sfp_ptr.get_vendor_name())
-        self.diagnostic_monitor_dialog.lineEdit_2.setText(sfp_ptr.get_vendor_part_number())
-        self.diagnostic_monitor_dialog.lineEdit_3.setText(calibration_str)
-        
-
-
-    def handle_init_diagnostic_a2(self, cmd: ReadRegisterMessage):
-        '''! Handles the diagnostic information from page 0xA2 of the
-        SFP memory map. This page contains the diagnostic alarms/warnings
-        and calibration constants.
-
-        @param cmd The ReadRegisterMessage that was received from the TCP Server.
-        '''
-        m = self.diagnostic_monitor_dialog
-        sfp_ptr = m.associated_sfp
-
-        for i in range(91 + 1):
-            sfp_ptr.page_a2[i] = cmd.register_numbers[i]
-
-        for i in range(96, 109 + 1):
-            sfp_ptr.page_a2[i] = cmd.register_numbers[i - 4]
-
-        self.diagnostic_monitor_dialog.update_alarm_warning_tab()
-        self.diagnostic_monitor_dialog.update_real_time_tab()
-
-    def handle_diagnostic_timer_timeout(self):
-        '''! Handles the diagnostic monitoring timeout. Sends a message to the
-        respective docking station that requests the updated A/D values.
-        '''
-        # Send a refresh real-time diagnostics message
-        code = MessageCode.REAL_TIME_REFRESH
-        page_num = 0x51
-        # All the register numbers for diagnostic information
-        registers = [96, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108, 109]
-
-        command = ReadRegisterMessage(code, "", page_num, registers)
-        self.send_command_signal.emit((self.diagnostic_monitor_dialog.dock_ip, command))
-
-    def handle_real_time_refresh(self, cmd: ReadRegisterMessage):
-        '''! Handles the refreshing of diagnostic data from the
-        a docking station.
-
-        @param cmd The ReadRegisterMessage object that contains the updated
-        A/D values.
-        '''
-        # Expecting data from registers [96, 109] in page 0x51 (aka 0xA2)
-        sfp_ptr = self.diagnostic_monitor_dialog.associated_sfp
-        sfp_ptr.force_calibration_check()
-
-        for i in range(96, 109 + 1):
-            sfp_ptr.page_a2[i] = cmd.register_numbers[i - 96]
+            return
 
-        self.diagnostic_monitor_dialog.update_real_time_tab()
+        for selected_item in selected_items:
+            self._get_monitor_dashboard().open_session(selected_item.text())
 
-    def handle_remote_io_error(self, cmd: Message):
+    def handle_remote_io_error(self, dock_ip: str, cmd: Message):
         '''! Handles when a device responds with 'Remote IO Error'.
+        @param dock_ip The IP address of the device
         @param cmd The message object that was sent
         '''
-        self.append_to_debug_log(cmd)
-        self.diagnostic_monitor_dialog.close()
+        self.append_to_debug_log(f'{dock_ip}: {cmd}')
+        if self.monitor_dashboard is not None:
+            self.monitor_dashboard.handle_remote_io_error(dock_ip, cmd)
 
     ##
     # Utility functions
@@ -542,22 +493,21 @@ class Window(QMainWindow, Ui_MainWindow):
         logging.debug("Killed TCP thread")
         self.udp_thread.exit()
         logging.debug("Killed UDP thread")
+        self.sweep_thread.exit()
+        if self.monitor_dashboard is not None:
+            self.monitor_dashboard.close_all()
+        self.database_worker.shutdown()
+        self.telemetry_store.close()
         event.accept()
 
     def append_to_debug_log(self, text: str):
         '''! Allows timestamped debug messages to be added to a text log.
+        The message is shown with the next batch, see DebugLog.
 
             @param text The text to be added to the debug log.
         '''
         logging.debug(text)
-        # Select the text-edit widget on the debug tab
-        text_edit = self.logTab.findChild(QPlainTextEdit, 'plainTextEdit')
-
-        # If we find it
-        if text_edit:
-            # Format the local time into HH:MM:SS and append to the debug log
-            formatted_time = time.strftime('%H:%M:%S', time.localtime())
-            text_edit.appendPlainText(f'[{formatted_time}]: {text}')
+        self.debug_log.append(text)
 
 
 
@@ -90,64 +90,27 @@ class Ui_MainWindow(object):
         self.gridLayout_5.addWidget(self.runStressRecordingButton, 1, 0, 1, 1)
         self.gridLayout_3.addLayout(self.gridLayout_5, 2, 1, 1, 1)
         self.gridLayout_2.addLayout(self.gridLayout_3, 0, 0, 1, 1)
-        self.tableWidget = QtWidgets.QTableWidget(self.tab)
+        self.personaTableView = QtWidgets.QTableView(self.tab)
         font = QtGui.QFont()
         font.setBold(False)
         font.setWeight(50)
-        self.tableWidget.setFont(font)
-        self.tableWidget.setSizeAdjustPolicy(QtWidgets.QAbstractScrollArea.AdjustToContents)
-        self.tableWidget.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
-        self.tableWidget.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
-        self.tableWidget.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
-        self.tableWidget.setShowGrid(True)
-        self.tableWidget.setGridStyle(QtCore.Qt.SolidLine)
-        self.tableWidget.setColumnCount(6)
-        self.tableWidget.setObjectName("tableWidget")
-        self.tableWidget.setRowCount(0)
-        item = QtWidgets.QTableWidgetItem()
-        font = QtGui.QFont()
-        font.setBold(True)
-        font.setWeight(75)
-        item.setFont(font)
-        self.tableWidget.setHorizontalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        font = QtGui.QFont()
-        font.setBold(True)
-        font.setWeight(75)
-        item.setFont(font)
-        self.tableWidget.setHorizontalHeaderItem(1, item)
-        item = QtWidgets.QTableWidgetItem()
-        font = QtGui.QFont()
-        font.setBold(True)
-        font.setWeight(75)
-        item.setFont(font)
-        self.tableWidget.setHorizontalHeaderItem(2, item)
-        item = QtWidgets.QTableWidgetItem()
-        font = QtGui.QFont()
-        font.setBold(True)
-        font.setWeight(75)
-        item.setFont(font)
-        self.tableWidget.setHorizontalHeaderItem(3, item)
-        item = QtWidgets.QTableWidgetItem()
-        font = QtGui.QFont()
-        font.setBold(True)
-        font.setWeight(75)
-        item.setFont(font)
-        self.tableWidget.setHorizontalHeaderItem(4, item)
-        item = QtWidgets.QTableWidgetItem()
-        font = QtGui.QFont()
-        font.setBold(True)
-        font.setWeight(75)
-        item.setFont(font)
-        self.tableWidget.setHorizontalHeaderItem(5, item)
-        self.tableWidget.verticalHeader().setVisible(False)
-        self.gridLayout_2.addWidget(self.tableWidget, 2, 0, 1, 1)
+        self.personaTableView.setFont(font)
+        self.personaTableView.setSizeAdjustPolicy(QtWidgets.QAbstractScrollArea.AdjustToContents)
+        self.personaTableView.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.personaTableView.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
+        self.personaTableView.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.personaTableView.setShowGrid(True)
+        self.personaTableView.setGridStyle(QtCore.Qt.SolidLine)
+        self.personaTableView.setObjectName("personaTableView")
+        self.personaTableView.verticalHeader().setVisible(False)
+        self.gridLayout_2.addWidget(self.personaTableView, 2, 0, 1, 1)
         self.tabWidget.addTab(self.tab, "")
         self.tab_2 = QtWidgets.QWidget()
         self.tab_2.setObjectName("tab_2")
         self.gridLayout_4 = QtWidgets.QGridLayout(self.tab_2)
         self.gridLayout_4.setObjectName("gridLayout_4")
         self.dockingStationList = QtWidgets.QListWidget(self.tab_2)
+        self.dockingStationList.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
         self.dockingStationList.setObjectName("dockingStationList")
         self.gridLayout_4.addWidget(self.dockingStationList, 1, 0, 1, 1)
         self.label_4 = QtWidgets.QLabel(self.tab_2)
@@ -197,19 +160,7 @@ class Ui_MainWindow(object):
         self.label_3.setText(_translate("MainWindow", "User Controls"))
         self.reprogramButton.setText(_translate("MainWindow", "Update CloudPlug Personas"))
         self.runStressRecordingButton.setText(_translate("MainWindow", "Run Stress Scenario"))
-        self.tableWidget.setSortingEnabled(True)
-        item = self.tableWidget.horizontalHeaderItem(0)
-        item.setText(_translate("MainWindow", "ID"))
-        item = self.tableWidget.horizontalHeaderItem(1)
-        item.setText(_translate("MainWindow", "Vendor ID"))
-        item = self.tableWidget.horizontalHeaderItem(2)
-        item.setText(_translate("MainWindow", "Vendor Part Number"))
-        item = self.tableWidget.horizontalHeaderItem(3)
-        item.setText(_translate("MainWindow", "Vendor Serial Number"))
-        item = self.tableWidget.horizontalHeaderItem(4)
-        item.setText(_translate("MainWindow", "Connector Type"))
-        item = self.tableWidget.horizontalHeaderItem(5)
-        item.setText(_translate("MainWindow", "Wavelength (nm)"))
+        self.personaTableView.setSortingEnabled(True)
         self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab), _translate("MainWindow", "CloudPlug"))
         self.label_4.setText(_translate("MainWindow", "Connected Docking Stations"))
         self.readSfpMemoryButton.setText(_translate("MainWindow", "Read SFP Memory"))
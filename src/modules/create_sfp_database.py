@@ -1,167 +1,36 @@
 # Script to create a database of SFP information
+#
+# Run from the src folder with: python -m modules.create_sfp_database
 
-import mysql.connector
 from typing import List
 
-def create_table(cursor):
-    try:
-        cursor.execute("CREATE TABLE sfp (id INT AUTO_INCREMENT PRIMARY KEY\
-            , vendor_id VARCHAR(255), vendor_part_number VARCHAR(255), transceiver_type VARCHAR(255))")
-    except Exception as ex:
-        print("ERROR in create_table()")
-        print(ex)
-        return
-
-def create_page_table(cursor, table_name: str):
-    try:
-        sql = f"CREATE TABLE {table_name} (id INT AUTO_INCREMENT PRIMARY KEY, "
-        
-        for i in range(255):
-            sql += f'`{i}` INT, '
-
-        sql += '`255` INT);'
-
-        #print(sql)
-
-        cursor.execute(sql)
-
-    except Exception as ex:
-        print("Error in create_page_table()")
-        print(ex)
-        return
-
-def insert_sfp_data_to_table(cursor, tablename: str, values: List[str]) -> None:
-    
-    sql_statement = f"select count(*) as count from information_schema.columns where table_name=\'{tablename}\'"
-    cursor.execute(sql_statement)
-
-    result = cursor.fetchone()
-    # Remove auto-increment primary key
-    columns_in_table = result[0] - 1
-
-    if len(values) != columns_in_table:
-        print(f'ERROR: Expected {columns_in_table} values to insert but got {len(values)}')
-        return
-
-    sql_statement = f"INSERT INTO {tablename} (vendor_id, vendor_part_number, transceiver_type) VALUES (%s, %s, %s)"
-    vals = tuple(values)        
-
-    cursor.execute(sql_statement, vals)
-    
-    # Also create entry in page table for this
-
-    sql_statement = f'INSERT INTO page_a0 ('
-    for i in range(255):
-        sql_statement += f"`{i}`, "
-    sql_statement += '`255`) VALUES ('
-    for i in range(255):
-        sql_statement += "%s, "
-    sql_statement += "%s)"
-
-    vals = [0] * 256
-    vals = tuple(vals)
-    cursor.execute(sql_statement, vals)
+from modules.database.repository import PAGE_SIZE, get_repository, pad_page
 
 def read_sfp_memory_map(filepath: str) -> List[int]:
     '''
-    Given a path to a .bin file containing SFP memory maps, reads
-    the 
-    '''
-    mem_vals = []
-
-    bin_file = open(filepath, 'rb')
-    for line in bin_file:
-        mem_vals = mem_vals + list(line)
+    Given a path to a .bin file containing an SFP memory map, reads
+    page 0xA0 from it. Missing values are filled with 0.
 
-    bin_file.close()
-
-
-    if len(mem_vals) < 256:
-        for _ in range(256 - len(mem_vals)):
-            mem_vals.append(0)
-
-    return mem_vals
+    Use modules.import_eeprom_dumps to store dumps in the database.
+    '''
+    with open(filepath, 'rb') as bin_file:
+        return pad_page(list(bin_file.read(PAGE_SIZE)))
 
 def get_info_from_memory_map(memory_map: List[int]):
     pass
 
 def main():
-    
-    mydb = mysql.connector.connect(
-        host="localhost",
-        user="connor",
-        password="cloudplug!@#@!",
-        database="sfp_info"
-    )
-
-    mycursor = mydb.cursor()
-
-
-    # Create table for stress scenarios
-    query = (
-        "CREATE TABLE `stress_scenarios` ("
-        "    `stress_id` INT AUTO_INCREMENT PRIMARY KEY,"
-        "    `sfp_id` INT,"
-        "    `scenario_name` VARCHAR(255),"
-        "    FOREIGN KEY (`sfp_id`) REFERENCES `page_a0`(`id`) ON DELETE CASCADE,"
-        "    FOREIGN KEY (`sfp_id`) REFERENCES `page_a2`(`id`) ON DELETE CASCADE,"
-    )
-    
-    # Need 1 byte for each value
-    num_vals = 19
-    for i in range(num_vals):
-        query += f'`{i}` INT, '
-
-    query += f'`{num_vals}` INT)'
-
-    #print(query)
-
-    #query = "INSERT INTO stress_scenarios (stress_id, sfp_id, scenario_name, 0, 1, 2, 3, 4, 5, 6, 7, 8, 9) "
-
-    mycursor.execute(query)
-    mydb.commit()
-
-
-
-    #create_table(mycursor)
-    #create_page_table(mycursor, 'page_a0')
-    #create_page_table(mycursor, 'page_a2')
-
-    #T= Testing insertion to database
-    #sql = "INSERT INTO sfp (vendor_id, vendor_part_number, transceiver_type) VALUES (%s, %s, %s)"
-    #vals = ("Raspberry Pi", "unknown", "QFBR-576LP")
-    #mycursor.execute(sql, vals)
-    #insert_sfp_data_to_table(mycursor, "sfp", list(vals))
-    #print(mycursor.rowcount, "record inserted")
-
-    #print("\n\nReading all entries from sfp table")
-    #sql = "SELECT * from sfp"
-    #mycursor.execute(sql)
-
-    #myresult = mycursor.fetchall()
-
-    #for x in myresult:
-    #    print(x)
+    '''
+    Creates the persona, stress scenario and telemetry tables in the
+    database selected in the .env file.
+    '''
+    repository = get_repository()
+    repository.create_schema()
 
     #print('\n\nReading sfp memory')
     #memory_map = read_sfp_memory_map('sfp3.bin')
     #print(f'Length is {len(memory_map)}')
 
-    '''
-    memory_map2 = []
-    print('Reading other file')
-    with open('sfp_memory_map.bin') as file:
-        for line in file:
-            vals = line.split(',')
-            for val in vals:
-                if val != '\n':
-                    print(int(val, 16), end=' ')
-                    memory_map2.append(int(val, 16))
-
-    for i, j in zip(memory_map, memory_map2):
-        if i != j:
-            raise Exception('Lists not equal')
-    '''
     # Testing writing old data to binary file
     #with open('sfp2.bin', 'wb') as mem_file:
     #    vals = bytes(memory_map)
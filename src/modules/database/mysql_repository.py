@@ -0,0 +1,590 @@
+##
+# @file mysql_repository.py
+# @brief MySQL implementation of the storage repository.
+#
+# @section file_author Author
+# - Created on 10/19/2026
+#
+# Personas are stored in the personas table, one BINARY(256) column per
+# memory page. The fields personas are searched by and a content hash
+# are indexed generated columns, so they never have to be decoded on the
+# client. The content hash is unique, so a persona is stored once no
+# matter how often the same module is cloned.
+#
+# The docking stations still write cloned modules into the legacy
+# page_a0 and page_a2 tables, with one INT column per byte. Those rows are
+# converted into the personas table by import_legacy_pages(), in batches
+# and while the tables stay in use. The persona_references table maps
+# every converted legacy ID to the persona holding its pages.
+##
+
+##
+# Standard Imports
+##
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+##
+# Local Library Imports
+##
+from modules.database.repository import MAX_IN_LIST, PAGE_SIZE, PERSONA_SUMMARY_COLUMNS, \
+                                        REAL_TIME_END, REAL_TIME_START, STRESS_CHUNK_SAMPLES, \
+                                        STRESS_SAMPLE_SIZE, Persona, PersonaQuery, \
+                                        PersonaSummary, StorageRepository, \
+                                        StressScenario, TELEMETRY_ROLLUP_COLUMNS, \
+                                        TELEMETRY_ROLLUP_SELECT, TelemetryRollup, TelemetrySample, \
+                                        build_persona_search, check_stress_waveform, chunks, \
+                                        pack_page, persona_content_hash, telemetry_rollup_row
+from modules.network.sql_connection import Statement, get_connection_pool
+
+## Number of value columns stress scenarios were stored in before they
+# had a waveform column. Tables made back then still have them.
+LEGACY_STRESS_SCENARIO_VALUES = 20
+
+## Number of rows fetched at a time when streaming a result
+STREAM_FETCH_SIZE = 1000
+
+## Name of the legacy page table conversion in the persona_migration table
+LEGACY_PAGES_MIGRATION = 'page_tables'
+
+## Columns of search_personas(). The legacy ID of a persona is its oldest
+# legacy page table row, which docking stations reprogram modules from.
+SEARCH_PERSONAS_COLUMNS = PERSONA_SUMMARY_COLUMNS + (
+    "(SELECT MIN(r.legacy_id) FROM persona_references r WHERE r.persona_id = personas.id)",
+)
+
+##
+# Statements that run often. They are prepared on the server once per
+# pooled connection.
+##
+GET_PERSONA = Statement('get_persona', "SELECT page_a0, page_a2 FROM personas WHERE id=%s")
+# LAST_INSERT_ID(id) makes the ID of the stored persona the insert ID
+# when the same content is stored already
+ADD_PERSONA = Statement(
+    'add_persona',
+    "INSERT INTO personas (page_a0, page_a2) VALUES (%s, %s) "
+    "ON DUPLICATE KEY UPDATE id = LAST_INSERT_ID(id)"
+)
+GET_MIGRATION_STATE = Statement(
+    'get_migration_state', "SELECT last_legacy_id FROM persona_migration WHERE name=%s"
+)
+GET_LEGACY_PAGES = Statement(
+    'get_legacy_pages',
+    "SELECT a0.*, a2.* FROM page_a0 a0 LEFT JOIN page_a2 a2 ON a2.id = a0.id "
+    "WHERE a0.id > %s ORDER BY a0.id LIMIT %s"
+)
+LIST_STRESS_SCENARIOS = Statement(
+    'list_stress_scenarios',
+    "SELECT stress_id, persona_id, scenario_name, parameter, sample_period, "
+    f"LENGTH(waveform) DIV {STRESS_SAMPLE_SIZE} "
+    "FROM stress_scenarios WHERE persona_id=%s ORDER BY stress_id"
+)
+ADD_STRESS_SCENARIO = Statement(
+    'add_stress_scenario',
+    "INSERT INTO stress_scenarios (sfp_id, persona_id, scenario_name, parameter, sample_period, "
+    "waveform) SELECT a2.id, p.id, %s, %s, %s, %s FROM personas p "
+    "LEFT JOIN page_a0 a0 ON a0.id = p.legacy_id LEFT JOIN page_a2 a2 ON a2.id = a0.id "
+    "WHERE p.id=%s"
+)
+GET_STRESS_WAVEFORM_LENGTH = Statement(
+    'get_stress_waveform_length', "SELECT LENGTH(waveform) FROM stress_scenarios WHERE stress_id=%s"
+)
+GET_STRESS_WAVEFORM_CHUNK = Statement(
+    'get_stress_waveform_chunk',
+    "SELECT SUBSTRING(waveform, %s, %s) FROM stress_scenarios WHERE stress_id=%s"
+)
+GET_TELEMETRY_ROLLUPS = Statement(
+    'get_telemetry_rollups',
+    f"SELECT {TELEMETRY_ROLLUP_SELECT} FROM telemetry_rollups "
+    "WHERE module_id=%s AND resolution=%s AND bucket_start>=%s AND bucket_start<%s "
+    "ORDER BY bucket_start"
+)
+GET_TELEMETRY_SAMPLES = Statement(
+    'get_telemetry_samples',
+    "SELECT module_id, timestamp, temperature, vcc, tx_bias, tx_power, rx_power "
+    "FROM telemetry_samples WHERE module_id=%s AND timestamp>=%s AND timestamp<%s "
+    "ORDER BY timestamp"
+)
+
+# Minimums and maximums are kept with LEAST() and GREATEST()
+_MERGE_TELEMETRY_ROLLUP = (
+    "INSERT INTO telemetry_rollups (module_id, resolution, bucket_start, sample_count, "
+    f"{', '.join(TELEMETRY_ROLLUP_COLUMNS)}) "
+    f"VALUES ({', '.join(['%s'] * (4 + len(TELEMETRY_ROLLUP_COLUMNS)))}) "
+    "ON DUPLICATE KEY UPDATE sample_count = sample_count + VALUES(sample_count), " +
+    ', '.join(
+        f"{column} = {column} + VALUES({column})" if column.endswith('_sum')
+        else f"{column} = {'LEAST' if column.endswith('_min') else 'GREATEST'}({column}, VALUES({column}))"
+        for column in TELEMETRY_ROLLUP_COLUMNS
+    )
+)
+
+def _text_column(offset: int) -> str:
+    '''! Builds a generated column that decodes a 16 character ASCII
+    field of page 0xA0 the same way persona_index_fields() does.
+    SUBSTRING is 1-indexed.
+    '''
+    return (
+        f"VARCHAR(16) AS (TRIM(REPLACE(CAST(SUBSTRING(page_a0, {offset + 1}, 16) "
+        f"AS CHAR(16) CHARACTER SET latin1), CHAR(0 USING latin1), ''))) STORED"
+    )
+
+def _byte_column(offset: int) -> str:
+    '''! Builds a generated column that holds a single byte of page 0xA0.'''
+    return f"TINYINT UNSIGNED AS (ORD(SUBSTRING(page_a0, {offset + 1}, 1))) STORED"
+
+##
+# Generated columns of the personas table and the kind of index they have.
+# The transceiver compliance bytes are only tested with bit masks, where
+# an index does not help. The canonical hash is calculated like
+# persona_content_hash() does.
+##
+PERSONA_GENERATED_COLUMNS = {
+    'vendor_name': (_text_column(20), 'INDEX'),
+    'part_number': (_text_column(40), 'INDEX'),
+    'serial_number': (_text_column(68), 'INDEX'),
+    'identifier': (_byte_column(0), 'INDEX'),
+    'connector': (_byte_column(2), 'INDEX'),
+    'wavelength': (
+        "SMALLINT UNSIGNED AS "
+        "(ORD(SUBSTRING(page_a0, 61, 1)) << 8 | ORD(SUBSTRING(page_a0, 62, 1))) STORED",
+        'INDEX'
+    ),
+    'transceiver': ("BIGINT UNSIGNED AS (CONV(HEX(SUBSTRING(page_a0, 4, 8)), 16, 10)) STORED", None),
+    'canonical_hash': (
+        "BINARY(32) AS (UNHEX(SHA2(CONCAT(page_a0, SUBSTRING(page_a2, 1, "
+        f"{REAL_TIME_START}), SUBSTRING(page_a2, {REAL_TIME_END + 1})), 256))) STORED",
+        'UNIQUE INDEX'
+    ),
+}
+
+_PERSONAS_TABLE = (
+    "CREATE TABLE IF NOT EXISTS `personas` ("
+    "    `id` INT AUTO_INCREMENT PRIMARY KEY,"
+    "    `legacy_id` INT NULL,"
+    "    `page_a0` BINARY(256) NOT NULL,"
+    "    `page_a2` BINARY(256) NOT NULL,"
+    "    UNIQUE INDEX `personas_legacy_id` (`legacy_id`))"
+)
+
+class MySQLRepository(StorageRepository):
+    '''! Stores everything in the MySQL database from the .env file.
+    Connections are checked out of the process-wide connection pool.
+    '''
+
+    def __init__(self, pool=None):
+        '''! Initializes the repository.
+
+        @param pool The SQLConnectionPool to use, the process-wide pool by default
+        '''
+        super().__init__()
+
+        self._pool = pool if pool is not None else get_connection_pool()
+
+    def create_schema(self) -> None:
+        # The legacy page tables are still written by the docking stations
+        legacy_columns = ', '.join(f'`{i}` INT' for i in range(PAGE_SIZE))
+
+        statements = [
+            f"CREATE TABLE IF NOT EXISTS page_a0 (id INT AUTO_INCREMENT PRIMARY KEY, {legacy_columns})",
+            f"CREATE TABLE IF NOT EXISTS page_a2 (id INT AUTO_INCREMENT PRIMARY KEY, {legacy_columns})",
+            _PERSONAS_TABLE,
+            (
+                "CREATE TABLE IF NOT EXISTS `persona_references` ("
+                "    `legacy_id` INT PRIMARY KEY,"
+                "    `persona_id` INT NOT NULL,"
+                "    INDEX `persona_references_persona_id` (`persona_id`))"
+            ),
+            (
+                "CREATE TABLE IF NOT EXISTS `persona_migration` ("
+                "    `name` VARCHAR(64) PRIMARY KEY,"
+                "    `last_legacy_id` INT NOT NULL)"
+            ),
+            (
+                "CREATE TABLE IF NOT EXISTS `stress_scenarios` ("
+                "    `stress_id` INT AUTO_INCREMENT PRIMARY KEY,"
+                "    `sfp_id` INT,"
+                "    `scenario_name` VARCHAR(255),"
+                "    `parameter` TINYINT UNSIGNED NULL,"
+                "    `sample_period` INT UNSIGNED NULL,"
+                "    `waveform` MEDIUMBLOB NOT NULL,"
+                "    FOREIGN KEY (`sfp_id`) REFERENCES `page_a0`(`id`) ON DELETE CASCADE,"
+                "    FOREIGN KEY (`sfp_id`) REFERENCES `page_a2`(`id`) ON DELETE CASCADE)"
+            ),
+            (
+                "CREATE TABLE IF NOT EXISTS `telemetry_samples` ("
+                "    `id` BIGINT AUTO_INCREMENT PRIMARY KEY,"
+                "    `module_id` VARCHAR(64) NOT NULL,"
+                "    `timestamp` DOUBLE NOT NULL,"
+                "    `temperature` DOUBLE, `vcc` DOUBLE, `tx_bias` DOUBLE,"
+                "    `tx_power` DOUBLE, `rx_power` DOUBLE,"
+                "    INDEX `module_time` (`module_id`, `timestamp`))"
+            ),
+            (
+                "CREATE TABLE IF NOT EXISTS `telemetry_rollups` ("
+                "    `module_id` VARCHAR(64) NOT NULL,"
+                "    `resolution` INT NOT NULL,"
+                "    `bucket_start` DOUBLE NOT NULL,"
+                "    `sample_count` INT NOT NULL,"
+                f"   {', '.join(f'`{column}` DOUBLE' for column in TELEMETRY_ROLLUP_COLUMNS)},"
+                "    PRIMARY KEY (`module_id`, `resolution`, `bucket_start`))"
+            ),
+        ]
+
+        with self._pool.connection() as db:
+            cursor = db.get_cursor()
+            for statement in statements:
+                cursor.execute(statement)
+
+            # Stress scenarios were keyed by the legacy page table ID.
+            # They are now looked up by the ID in the personas table.
+            if not self._column_exists(cursor, 'stress_scenarios', 'persona_id'):
+                cursor.execute(
+                    "ALTER TABLE stress_scenarios ADD COLUMN `persona_id` INT NULL, "
+                    "ADD INDEX `stress_scenarios_persona_id` (`persona_id`)"
+                )
+
+            # Generated columns are added one by one so that tables made
+            # before a column existed get it too
+            for name, (definition, index) in PERSONA_GENERATED_COLUMNS.items():
+                if self._column_exists(cursor, 'personas', name):
+                    continue
+
+                cursor.execute(f"ALTER TABLE personas ADD COLUMN `{name}` {definition}")
+
+                # Personas stored before the column was unique may be
+                # stored more than once
+                if index == 'UNIQUE INDEX':
+                    self._merge_duplicate_personas(cursor)
+                if index:
+                    cursor.execute(f"ALTER TABLE personas ADD {index} `personas_{name}` (`{name}`)")
+
+            # The hash over both whole pages was replaced by canonical_hash
+            if self._column_exists(cursor, 'personas', 'content_hash'):
+                cursor.execute("ALTER TABLE personas DROP COLUMN `content_hash`")
+
+            # Stress scenarios were stored one byte per value column. The
+            # bytes are packed into the waveform, skipping unused columns.
+            if not self._column_exists(cursor, 'stress_scenarios', 'waveform'):
+                legacy_values = ', '.join(f'`{i}`' for i in range(LEGACY_STRESS_SCENARIO_VALUES))
+                cursor.execute(
+                    "ALTER TABLE stress_scenarios ADD COLUMN `parameter` TINYINT UNSIGNED NULL, "
+                    "ADD COLUMN `sample_period` INT UNSIGNED NULL, "
+                    "ADD COLUMN `waveform` MEDIUMBLOB NULL"
+                )
+                cursor.execute(
+                    f"UPDATE stress_scenarios SET waveform = CHAR({legacy_values} USING binary)"
+                )
+
+    @staticmethod
+    def _merge_duplicate_personas(cursor) -> None:
+        '''! Keeps the oldest of the personas that have the same canonical
+        hash. Stress scenarios and legacy IDs of the others are moved to it.
+        '''
+        cursor.execute(
+            "INSERT IGNORE INTO persona_references (legacy_id, persona_id) "
+            "SELECT legacy_id, id FROM personas WHERE legacy_id IS NOT NULL"
+        )
+        cursor.execute(
+            "CREATE TEMPORARY TABLE persona_duplicates (id INT PRIMARY KEY, keep_id INT NOT NULL) "
+            "SELECT p.id, k.keep_id FROM personas p JOIN ("
+            "    SELECT canonical_hash, MIN(id) AS keep_id FROM personas "
+            "    GROUP BY canonical_hash HAVING COUNT(*) > 1"
+            ") k ON k.canonical_hash = p.canonical_hash WHERE p.id <> k.keep_id"
+        )
+        try:
+            cursor.execute(
+                "UPDATE stress_scenarios s JOIN persona_duplicates d ON d.id = s.persona_id "
+                "SET s.persona_id = d.keep_id"
+            )
+            cursor.execute(
+                "UPDATE persona_references r JOIN persona_duplicates d ON d.id = r.persona_id "
+                "SET r.persona_id = d.keep_id"
+            )
+            cursor.execute("DELETE p FROM personas p JOIN persona_duplicates d ON d.id = p.id")
+        finally:
+            cursor.execute("DROP TEMPORARY TABLE persona_duplicates")
+
+    @staticmethod
+    def _column_exists(cursor, table_name: str, column_name: str) -> bool:
+        cursor.execute(
+            "SELECT COUNT(*) FROM information_schema.columns "
+            "WHERE table_schema = DATABASE() AND table_name = %s AND column_name = %s",
+            (table_name, column_name)
+        )
+        return cursor.fetchone()[0] > 0
+
+    def iter_persona_pages_a0(self) -> Iterator[Tuple[int, List[int]]]:
+        with self._pool.connection() as db:
+            cursor = db.get_cursor()
+            cursor.execute("SELECT id, page_a0 FROM personas ORDER BY id")
+
+            for persona_id, page_a0 in cursor:
+                yield persona_id, list(page_a0)
+
+    def _load_pages(self, persona_ids: List[int]) -> Dict[int, Tuple[bytes, bytes]]:
+        pages = {}
+
+        with self._pool.connection() as db:
+            # Opening a single persona is by far the most common read
+            if len(persona_ids) == 1:
+                rows = db.query(GET_PERSONA, (persona_ids[0],))
+                return {persona_ids[0]: (bytes(rows[0][0]), bytes(rows[0][1]))} if rows else {}
+
+            cursor = db.get_cursor()
+            for chunk in chunks(persona_ids, MAX_IN_LIST):
+                cursor.execute(
+                    f"SELECT id, page_a0, page_a2 FROM personas WHERE id IN ({', '.join(['%s'] * len(chunk))})",
+                    chunk
+                )
+                pages.update((row[0], (bytes(row[1]), bytes(row[2]))) for row in cursor)
+
+        return pages
+
+    def add_persona(self, page_a0: List[int], page_a2: List[int]) -> int:
+        with self._pool.connection() as db:
+            cursor = db.execute(ADD_PERSONA, (pack_page(page_a0), pack_page(page_a2)))
+
+        # No row is changed when the same content is stored already
+        if cursor.rowcount:
+            self.persona_cache.invalidate([cursor.lastrowid])
+        return cursor.lastrowid
+
+    def add_personas(self, personas: List[Tuple[bytes, bytes]]) -> int:
+        rows = [(pack_page(page_a0), pack_page(page_a2)) for page_a0, page_a2 in personas]
+        if not rows:
+            return 0
+
+        with self._pool.connection() as db:
+            cursor = db.get_cursor()
+
+            # executemany sends a single multi-row INSERT. Stored personas
+            # are left as they are, so they do not count as changed rows.
+            db.connection.start_transaction()
+            try:
+                cursor.executemany(
+                    "INSERT INTO personas (page_a0, page_a2) VALUES (%s, %s) "
+                    "ON DUPLICATE KEY UPDATE id = id",
+                    rows
+                )
+                db.connection.commit()
+            except Exception:
+                db.connection.rollback()
+                raise
+
+        return cursor.rowcount
+
+    def find_content_hashes(self, content_hashes: Iterable[bytes]) -> Set[bytes]:
+        found = set()
+
+        with self._pool.connection() as db:
+            cursor = db.get_cursor()
+
+            for chunk in chunks(list(content_hashes), MAX_IN_LIST):
+                cursor.execute(
+                    f"SELECT canonical_hash FROM personas WHERE canonical_hash IN ({', '.join(['%s'] * len(chunk))})",
+                    chunk
+                )
+                found.update(bytes(row[0]) for row in cursor)
+
+        return found
+
+    def import_legacy_pages(self, batch_size: int = 500) -> int:
+        total = 0
+
+        while True:
+            converted = self._import_legacy_batch(batch_size)
+            total += converted
+
+            if converted < batch_size:
+                return total
+
+    def _import_legacy_batch(self, batch_size: int) -> int:
+        '''! Converts the next batch of legacy page table rows in one
+        transaction.
+
+        @param batch_size Maximum number of personas to convert
+        @return The number of personas converted
+        '''
+        with self._pool.connection() as db:
+            state = db.query(GET_MIGRATION_STATE, (LEGACY_PAGES_MIGRATION,))
+            last_legacy_id = state[0][0] if state else 0
+
+            # One extra row is read to know whether the last row of the
+            # batch is also the newest row in the table
+            rows = db.query(GET_LEGACY_PAGES, (last_legacy_id, batch_size + 1))
+
+            personas = []
+            for index, row in enumerate(rows[:batch_size]):
+                page_a0 = row[1:PAGE_SIZE + 1]
+                page_a2_id = row[PAGE_SIZE + 1]
+                page_a2 = row[PAGE_SIZE + 2:]
+
+                if page_a2_id is None:
+                    # A docking station writes page 0xA0 first. If this is
+                    # the newest row, page 0xA2 may still be on its way.
+                    if index == len(rows) - 1:
+                        break
+                    page_a2 = []
+
+                personas.append((row[0], pack_page(page_a0), pack_page(page_a2)))
+
+            if not personas:
+                return 0
+
+            first_legacy_id = personas[0][0]
+            last_legacy_id = personas[-1][0]
+            hashes = [persona_content_hash(page_a0, page_a2) for _, page_a0, page_a2 in personas]
+
+            cursor = db.get_cursor()
+            db.connection.start_transaction()
+            try:
+                # Repeated clones of a module keep the legacy ID of the
+                # first clone
+                cursor.executemany(
+                    "INSERT INTO personas (legacy_id, page_a0, page_a2) VALUES (%s, %s, %s) "
+                    "ON DUPLICATE KEY UPDATE id = id",
+                    personas
+                )
+
+                persona_ids = {}
+                for chunk in chunks(sorted(set(hashes)), MAX_IN_LIST):
+                    cursor.execute(
+                        "SELECT canonical_hash, id FROM personas "
+                        f"WHERE canonical_hash IN ({', '.join(['%s'] * len(chunk))})",
+                        chunk
+                    )
+                    persona_ids.update((bytes(row[0]), row[1]) for row in cursor)
+
+                cursor.executemany(
+                    "INSERT INTO persona_references (legacy_id, persona_id) VALUES (%s, %s) "
+                    "ON DUPLICATE KEY UPDATE persona_id = VALUES(persona_id)",
+                    [(persona[0], persona_ids[content_hash])
+                     for persona, content_hash in zip(personas, hashes)]
+                )
+                cursor.execute(
+                    "UPDATE stress_scenarios s JOIN persona_references r ON r.legacy_id = s.sfp_id "
+                    "SET s.persona_id = r.persona_id "
+                    "WHERE s.persona_id IS NULL AND r.legacy_id BETWEEN %s AND %s",
+                    (first_legacy_id, last_legacy_id)
+                )
+                cursor.execute(
+                    "INSERT INTO persona_migration (name, last_legacy_id) VALUES (%s, %s) "
+                    "ON DUPLICATE KEY UPDATE last_legacy_id = VALUES(last_legacy_id)",
+                    (LEGACY_PAGES_MIGRATION, last_legacy_id)
+                )
+                db.connection.commit()
+            except Exception:
+                db.connection.rollback()
+                raise
+
+        return len(personas)
+
+    def search_personas(self, query: PersonaQuery, limit: Optional[int] = None, offset: int = 0,
+                        order_by: str = 'id', descending: bool = False,
+                        after: Optional[PersonaSummary] = None) -> List[PersonaSummary]:
+        sql, params = build_persona_search(query, '%s', limit, offset, order_by, descending, after,
+                                           columns=SEARCH_PERSONAS_COLUMNS)
+
+        # Only a few combinations of criteria and sort orders are used.
+        # The SQL of each is the same string every time, so it is found
+        # in the prepared statements of the connection and reused.
+        with self._pool.connection() as db:
+            rows = db.query(Statement('search_personas', sql), tuple(params))
+
+        return [PersonaSummary(*row) for row in rows]
+
+    def iter_personas(self, query: PersonaQuery) -> Iterator[Persona]:
+        sql, params = build_persona_search(query, '%s', columns=Persona._fields)
+
+        with self._pool.connection() as db:
+            # The cursor is unbuffered, so the server streams rows as they
+            # are fetched instead of the client reading the whole result
+            cursor = db.get_cursor()
+            cursor.execute(sql, params)
+
+            while True:
+                rows = cursor.fetchmany(STREAM_FETCH_SIZE)
+                if not rows:
+                    return
+
+                for persona_id, page_a0, page_a2 in rows:
+                    yield Persona(persona_id, list(page_a0), list(page_a2))
+
+    def list_stress_scenarios(self, persona_id: int) -> List[StressScenario]:
+        with self._pool.connection() as db:
+            rows = db.query(LIST_STRESS_SCENARIOS, (persona_id,))
+
+        return [StressScenario(*row) for row in rows]
+
+    def add_stress_scenario(self, persona_id: int, scenario_name: str, parameter: int,
+                            sample_period: int, waveform: bytes) -> int:
+        waveform = check_stress_waveform(waveform)
+
+        with self._pool.connection() as db:
+            # sfp_id keeps pointing at the legacy page tables when the
+            # persona came from them. It has a foreign key to both tables,
+            # so it is NULL unless both legacy rows still exist, and the
+            # scenario is found through persona_id.
+            cursor = db.execute(
+                ADD_STRESS_SCENARIO, (scenario_name, parameter, sample_period, waveform, persona_id)
+            )
+            return cursor.lastrowid
+
+    def iter_stress_waveform(self, stress_id: int,
+                             chunk_samples: int = STRESS_CHUNK_SAMPLES) -> Iterator[memoryview]:
+        chunk_size = chunk_samples * STRESS_SAMPLE_SIZE
+
+        with self._pool.connection() as db:
+            rows = db.query(GET_STRESS_WAVEFORM_LENGTH, (stress_id,))
+        if not rows or rows[0][0] is None:
+            return
+
+        # Each chunk is its own query, so the whole blob never has to be
+        # sent at once. The connection goes back to the pool between
+        # chunks, as the caller may take its time with each one.
+        # SUBSTRING is 1-indexed.
+        for offset in range(0, rows[0][0], chunk_size):
+            with self._pool.connection() as db:
+                chunk = db.query(GET_STRESS_WAVEFORM_CHUNK, (offset + 1, chunk_size, stress_id))
+            if not chunk:
+                return
+            yield memoryview(chunk[0][0])
+
+    def add_telemetry_samples(self, samples: List[TelemetrySample]) -> None:
+        if not samples:
+            return
+
+        with self._pool.connection() as db:
+            cursor = db.get_cursor()
+            cursor.executemany(
+                "INSERT INTO telemetry_samples (module_id, timestamp, temperature, vcc, "
+                "tx_bias, tx_power, rx_power) VALUES (%s, %s, %s, %s, %s, %s, %s)",
+                [tuple(sample) for sample in samples]
+            )
+
+    def get_telemetry_samples(self, module_id: str, start: float, end: float) -> List[TelemetrySample]:
+        with self._pool.connection() as db:
+            rows = db.query(GET_TELEMETRY_SAMPLES, (module_id, start, end))
+
+        return [TelemetrySample(*row) for row in rows]
+
+    def add_telemetry_rollups(self, rollups: List[TelemetryRollup]) -> None:
+        if not rollups:
+            return
+
+        with self._pool.connection() as db:
+            cursor = db.get_cursor()
+            db.connection.start_transaction()
+            try:
+                cursor.executemany(_MERGE_TELEMETRY_ROLLUP, [telemetry_rollup_row(rollup) for rollup in rollups])
+                db.connection.commit()
+            except Exception:
+                db.connection.rollback()
+                raise
+
+    def get_telemetry_rollups(self, module_id: str, resolution: int, start: float,
+                              end: float) -> List[TelemetryRollup]:
+        with self._pool.connection() as db:
+            rows = db.query(GET_TELEMETRY_ROLLUPS, (module_id, resolution, start, end))
+
+        return [TelemetryRollup(*row) for row in rows]
@@ -0,0 +1,102 @@
+##
+# @file persona_cache.py
+# @brief Least recently used cache of persona memory pages.
+#
+# @section file_author Author
+# - Created on 10/19/2026
+#
+# Used by StorageRepository.get_persona() so that opening a persona that
+# was opened recently does not go to the database.
+##
+
+##
+# Standard Imports
+##
+import threading
+from collections import OrderedDict
+from typing import Iterable, Optional, Tuple
+
+class PersonaCache:
+    '''! Thread-safe LRU cache of the packed memory pages of personas,
+    keyed by persona ID.
+
+    @brief The cache is bounded both by number of personas and by bytes of
+    page data. The least recently used personas are dropped first.
+    '''
+
+    ## Default maximum number of cached personas
+    DEFAULT_MAX_ENTRIES = 1024
+
+    ## Default maximum bytes of cached page data
+    DEFAULT_MAX_BYTES = 1024 * 1024
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES):
+        '''! Initializes an empty cache.
+
+        @param max_entries Maximum number of cached personas
+        @param max_bytes Maximum bytes of cached page data
+        '''
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+        ## Number of lookups answered from the cache
+        self.hits = 0
+
+        ## Number of lookups that had to go to the database
+        self.misses = 0
+
+    def get(self, persona_id: int) -> Optional[Tuple[bytes, bytes]]:
+        '''! Gets the pages of a persona and marks it as recently used.
+
+        @param persona_id The ID of the persona
+        @return (page 0xA0, page 0xA2) or None if it is not cached
+        '''
+        with self._lock:
+            pages = self._entries.get(persona_id)
+
+            if pages is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(persona_id)
+            self.hits += 1
+            return pages
+
+    def put(self, persona_id: int, page_a0: bytes, page_a2: bytes) -> None:
+        '''! Caches the pages of a persona.'''
+        size = len(page_a0) + len(page_a2)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            self._remove(persona_id)
+
+            self._entries[persona_id] = (page_a0, page_a2)
+            self._size += size
+
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, persona_ids: Iterable[int]) -> None:
+        '''! Drops personas that were written to from the cache.'''
+        with self._lock:
+            for persona_id in persona_ids:
+                self._remove(persona_id)
+
+    def clear(self) -> None:
+        '''! Drops every persona from the cache.'''
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _remove(self, persona_id: int) -> None:
+        pages = self._entries.pop(persona_id, None)
+        if pages is not None:
+            self._size -= len(pages[0]) + len(pages[1])
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,570 @@
+##
+# @file repository.py
+# @brief Defines the storage repository interface used by the rest of
+#        the software to read and write personas, stress scenarios
+#        and telemetry.
+#
+# @section file_author Author
+# - Created on 10/19/2026
+#
+# There are two implementations:
+# - MySQLRepository in mysql_repository.py, for the shared lab database
+# - SQLiteRepository in sqlite_repository.py, for a local bench station,
+#   tests and benchmarks that run without a database server
+#
+# The backend is chosen with the STORAGE_BACKEND setting in the .env
+# file ("mysql" or "sqlite").
+##
+
+##
+# Standard Imports
+##
+import hashlib
+import threading
+from abc import ABC, abstractmethod
+from collections import namedtuple
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+##
+# Local Library Imports
+##
+from modules.database.persona_cache import PersonaCache
+from modules.network.sql_connection import get_database_settings
+
+## Number of bytes in a memory page
+PAGE_SIZE = 256
+
+## Most values bound to a single IN (...) list
+MAX_IN_LIST = 500
+
+## Bytes of page 0xA2 that hold the real-time diagnostics of a module.
+# They change while the module runs, so they are not part of the
+# content hash of a persona.
+REAL_TIME_START = 96
+REAL_TIME_END = 128
+
+## Bytes per stress waveform sample, a register value as (MSB, LSB)
+STRESS_SAMPLE_SIZE = 2
+
+## Number of waveform samples read at a time when streaming a stress scenario
+STRESS_CHUNK_SAMPLES = 4096
+
+##
+# Named tuple for a persona, the two memory pages of an SFP
+##
+Persona = namedtuple("Persona", "id, page_a0, page_a2")
+
+##
+# Named tuple for the searchable fields of a persona, decoded from page 0xA0.
+# legacy_id is the legacy page table row docking stations reprogram a
+# module from, or None if the persona has no legacy row.
+##
+PersonaSummary = namedtuple(
+    "PersonaSummary",
+    "id, vendor_name, part_number, serial_number, identifier, connector, wavelength, legacy_id",
+    defaults=(None,)
+)
+
+## PersonaSummary fields that are columns of the personas table. They can
+# be searched and sorted by.
+PERSONA_SUMMARY_COLUMNS = PersonaSummary._fields[:-1]
+
+##
+# Named tuple for a stress scenario of a persona. The waveform itself is
+# read with StorageRepository.iter_stress_waveform(). parameter and
+# sample_period are None for scenarios stored before they were recorded.
+##
+StressScenario = namedtuple(
+    "StressScenario",
+    "stress_id, sfp_id, scenario_name, parameter, sample_period, sample_count"
+)
+
+##
+# Named tuple for a single real-time diagnostic sample of a module
+##
+TelemetrySample = namedtuple(
+    "TelemetrySample",
+    "module_id, timestamp, temperature, vcc, tx_bias, tx_power, rx_power"
+)
+
+## Diagnostic values of a TelemetrySample
+TELEMETRY_FIELDS = ('temperature', 'vcc', 'tx_bias', 'tx_power', 'rx_power')
+
+##
+# Named tuple for the minimum, maximum and mean of every diagnostic value
+# of a module over one bucket of time. The bucket covers
+# start <= timestamp < start + resolution, in seconds.
+##
+TelemetryRollup = namedtuple(
+    "TelemetryRollup",
+    "module_id, resolution, start, count, " +
+    ', '.join(f'{field}_min, {field}_max, {field}_mean' for field in TELEMETRY_FIELDS)
+)
+
+@dataclass
+class PersonaQuery:
+    '''! Search criteria for personas. Criteria that are None are not
+    used, and every criterion that is used must match.
+    '''
+    ## Vendor name, page 0xA0 bytes 20-35
+    vendor_name: Optional[str] = None
+    ## Vendor part number, page 0xA0 bytes 40-55
+    part_number: Optional[str] = None
+    ## Vendor serial number, page 0xA0 bytes 68-83
+    serial_number: Optional[str] = None
+    ## Match the text criteria as prefixes instead of whole values
+    prefix: bool = False
+    ## Lowest wavelength in nm, inclusive
+    min_wavelength: Optional[int] = None
+    ## Highest wavelength in nm, inclusive
+    max_wavelength: Optional[int] = None
+    ## Identifier code, page 0xA0 byte 0
+    identifier: Optional[int] = None
+    ## Connector code, page 0xA0 byte 2
+    connector: Optional[int] = None
+    ## Transceiver compliance bits that must all be set, see transceiver_bit()
+    transceiver_mask: int = 0
+    ## Only personas with a larger ID, to find personas added since then
+    after_id: Optional[int] = None
+
+class StorageRepository(ABC):
+    '''! Interface for storing personas, memory pages, stress scenarios
+    and telemetry.
+
+    @brief Persona pages are read through an LRU PersonaCache, so
+    reopening a persona does not go to the database. Implementations
+    load pages in _load_pages() and invalidate the cache when they write
+    to a persona.
+    '''
+
+    def __init__(self):
+        ## Recently read persona pages
+        self.persona_cache = PersonaCache()
+
+    @abstractmethod
+    def create_schema(self) -> None:
+        '''! Creates the tables if they do not exist.'''
+
+    @abstractmethod
+    def iter_persona_pages_a0(self) -> Iterator[Tuple[int, List[int]]]:
+        '''! Iterates over every persona's ID and page 0xA0.'''
+
+    @abstractmethod
+    def _load_pages(self, persona_ids: List[int]) -> Dict[int, Tuple[bytes, bytes]]:
+        '''! Reads the pages of personas from the database in a single
+        query.
+
+        @param persona_ids The IDs of the personas
+        @return Dictionary of persona ID to (page 0xA0, page 0xA2) for the
+                personas that exist
+        '''
+
+    def get_personas(self, persona_ids: Iterable[int]) -> Dict[int, Persona]:
+        '''! Gets both memory pages of many personas. Personas that are
+        not cached are read together.
+
+        @param persona_ids The IDs of the personas
+        @return Dictionary of persona ID to Persona for the personas that exist
+        '''
+        pages = {}
+        missing = []
+
+        for persona_id in persona_ids:
+            cached = self.persona_cache.get(persona_id)
+            if cached is None:
+                missing.append(persona_id)
+            else:
+                pages[persona_id] = cached
+
+        if missing:
+            loaded = self._load_pages(missing)
+            for persona_id, (page_a0, page_a2) in loaded.items():
+                self.persona_cache.put(persona_id, page_a0, page_a2)
+            pages.update(loaded)
+
+        # Every caller gets its own lists
+        return {
+            persona_id: Persona(persona_id, list(page_a0), list(page_a2))
+            for persona_id, (page_a0, page_a2) in pages.items()
+        }
+
+    def get_persona(self, persona_id: int) -> Optional[Persona]:
+        '''! Gets both memory pages of a persona.
+
+        @param persona_id The ID of the persona
+        @return The Persona or None if it does not exist
+        '''
+        return self.get_personas([persona_id]).get(persona_id)
+
+    def get_page(self, persona_id: int, page_number: int) -> Optional[List[int]]:
+        '''! Gets a single memory page of a persona.
+
+        @param persona_id The ID of the persona
+        @param page_number 0xA0 or 0xA2
+        @return The 256 values of the page or None
+        '''
+        persona = self.get_persona(persona_id)
+
+        if persona is None:
+            return None
+
+        return persona.page_a0 if page_number == 0xA0 else persona.page_a2
+
+    @abstractmethod
+    def add_persona(self, page_a0: List[int], page_a2: List[int]) -> int:
+        '''! Stores a persona unless a persona with the same content hash
+        is stored already.
+
+        @return The ID of the new persona, or of the stored one
+        '''
+
+    @abstractmethod
+    def add_personas(self, personas: List[Tuple[bytes, bytes]]) -> int:
+        '''! Stores many personas in a single transaction. Personas with
+        the content hash of a stored persona are skipped.
+
+        @param personas List of (page 0xA0, page 0xA2) tuples
+        @return The number of new personas stored
+        '''
+
+    @abstractmethod
+    def find_content_hashes(self, content_hashes: Iterable[bytes]) -> Set[bytes]:
+        '''! Finds which persona content hashes are already stored.
+
+        @param content_hashes Hashes from persona_content_hash()
+        @return The subset of the hashes that are stored
+        '''
+
+    def import_legacy_pages(self, batch_size: int = 500) -> int:
+        '''! Converts personas written in the legacy one-column-per-byte
+        page tables into the compact persona table.
+
+        @param batch_size Number of personas converted per transaction
+        @return The number of personas converted
+        '''
+        return 0
+
+    @abstractmethod
+    def search_personas(self, query: PersonaQuery, limit: Optional[int] = None, offset: int = 0,
+                        order_by: str = 'id', descending: bool = False,
+                        after: Optional[PersonaSummary] = None) -> List[PersonaSummary]:
+        '''! Finds the personas that match the search criteria. Every
+        criterion and sort column is answered from an indexed column.
+
+        @param query The PersonaQuery to match
+        @param limit Maximum number of personas to return, or None for all
+        @param offset Number of matching personas to skip
+        @param order_by The PERSONA_SUMMARY_COLUMNS field to sort by
+        @param descending Sort from the largest to the smallest value
+        @param after The last persona of the previous page. Only personas
+                     sorted after it are returned, which unlike offset
+                     stays correct when personas are added in between.
+        @return List of PersonaSummary
+        '''
+
+    @abstractmethod
+    def iter_personas(self, query: PersonaQuery) -> Iterator[Persona]:
+        '''! Streams the personas that match the search criteria, ordered
+        by ID. Rows are read from the database as they are iterated, so
+        any number of personas can be read in constant memory.
+
+        @param query The PersonaQuery to match
+        @return Iterator of Persona
+        '''
+
+    @abstractmethod
+    def list_stress_scenarios(self, persona_id: int) -> List[StressScenario]:
+        '''! Gets every stress scenario of a persona, without reading
+        their waveforms.'''
+
+    @abstractmethod
+    def add_stress_scenario(self, persona_id: int, scenario_name: str, parameter: int,
+                            sample_period: int, waveform: bytes) -> int:
+        '''! Stores a new stress scenario for a persona.
+
+        @param persona_id The ID of the persona
+        @param scenario_name The name of the scenario
+        @param parameter The code of the diagnostic parameter that is modified
+        @param sample_period Milliseconds between waveform samples
+        @param waveform The packed samples, see check_stress_waveform()
+        @return The ID of the new stress scenario
+        '''
+
+    @abstractmethod
+    def iter_stress_waveform(self, stress_id: int,
+                             chunk_samples: int = STRESS_CHUNK_SAMPLES) -> Iterator[memoryview]:
+        '''! Streams the waveform of a stress scenario in chunks, so long
+        waveforms are never held in memory at once. Every chunk is read
+        with its own query into a new bytes object holding whole samples.
+        The memoryview lets playback slice it without further copies.
+
+        @param stress_id The ID of the stress scenario
+        @param chunk_samples Most samples in a chunk
+        @return Iterator of memoryview, empty if the scenario does not exist
+        '''
+
+    @abstractmethod
+    def add_telemetry_samples(self, samples: List[TelemetrySample]) -> None:
+        '''! Appends real-time diagnostic samples.'''
+
+    @abstractmethod
+    def get_telemetry_samples(self, module_id: str, start: float, end: float) -> List[TelemetrySample]:
+        '''! Gets the samples of a module with start <= timestamp < end.'''
+
+    @abstractmethod
+    def add_telemetry_rollups(self, rollups: List[TelemetryRollup]) -> None:
+        '''! Merges rollups into the stored rollups of the same module,
+        resolution and start, in a single transaction.
+
+        @brief Merging lets a bucket be written in parts as its samples
+        arrive: counts and sums add up, minimums and maximums are kept.
+        '''
+
+    @abstractmethod
+    def get_telemetry_rollups(self, module_id: str, resolution: int, start: float,
+                              end: float) -> List[TelemetryRollup]:
+        '''! Gets the rollups of a module at a resolution whose bucket
+        starts in start <= bucket start < end, ordered by time.
+        '''
+
+    def close(self) -> None:
+        '''! Releases any resources held by the repository.'''
+        self.persona_cache.clear()
+
+
+def pad_page(values: List[int]) -> List[int]:
+    '''! Pads or truncates memory page values to exactly PAGE_SIZE values.'''
+    values = list(values[:PAGE_SIZE])
+    return values + [0] * (PAGE_SIZE - len(values))
+
+def pack_page(values: List[int]) -> bytes:
+    '''! Packs memory page values into PAGE_SIZE bytes. Missing values
+    (None) are stored as 0.
+    '''
+    return bytes((value or 0) & 0xFF for value in pad_page(values))
+
+def _text_field(page: bytes, start: int, length: int) -> str:
+    '''! Decodes an ASCII field of a memory page without its padding.
+    Blank modules leave the fields filled with zeros instead of spaces.
+    '''
+    return page[start:start + length].decode('latin-1').replace('\x00', '').strip(' ')
+
+def persona_index_fields(page_a0: bytes) -> dict:
+    '''! Decodes the page 0xA0 fields that personas are indexed by.
+
+    @param page_a0 The packed page 0xA0
+    @return Dictionary of vendor_name, part_number, serial_number,
+            identifier, connector, wavelength and transceiver
+    '''
+    return {
+        'vendor_name': _text_field(page_a0, 20, 16),
+        'part_number': _text_field(page_a0, 40, 16),
+        'serial_number': _text_field(page_a0, 68, 16),
+        'identifier': page_a0[0],
+        'connector': page_a0[2],
+        'wavelength': page_a0[60] << 8 | page_a0[61],
+        'transceiver': int.from_bytes(page_a0[3:11], 'big'),
+    }
+
+def transceiver_bit(byte_number: int, bit_number: int) -> int:
+    '''! Gets the transceiver compliance mask of a single bit.
+
+    @brief The transceiver compliance codes are page 0xA0 bytes 3-10. They
+    are stored as one 64 bit number with byte 3 as the most significant byte.
+
+    @param byte_number The byte of page 0xA0, from 3 to 10
+    @param bit_number The bit of the byte, from 0 to 7
+    @return The mask to use in PersonaQuery.transceiver_mask
+    '''
+    if not 3 <= byte_number <= 10 or not 0 <= bit_number <= 7:
+        raise ValueError(f'Byte {byte_number} bit {bit_number} is not a transceiver compliance bit')
+
+    return 1 << ((10 - byte_number) * 8 + bit_number)
+
+def _escape_like(value: str) -> str:
+    '''! Escapes the LIKE wildcards in a value, using ! as escape character.'''
+    return value.replace('!', '!!').replace('%', '!%').replace('_', '!_')
+
+def build_persona_search(query: PersonaQuery, placeholder: str, limit: Optional[int] = None,
+                         offset: int = 0, order_by: str = 'id', descending: bool = False,
+                         after: Optional[PersonaSummary] = None,
+                         columns: Iterable[str] = PERSONA_SUMMARY_COLUMNS) -> Tuple[str, list]:
+    '''! Builds the SELECT statement of StorageRepository.search_personas().
+
+    @param query The PersonaQuery to match
+    @param placeholder The parameter placeholder of the database driver
+    @param limit Maximum number of rows, or None for all
+    @param offset Number of rows to skip
+    @param order_by The PERSONA_SUMMARY_COLUMNS field to sort by
+    @param descending Sort from the largest to the smallest value
+    @param after The last persona of the previous page
+    @param columns The columns to select
+    @return The SQL statement and its parameters
+    '''
+    if order_by not in PERSONA_SUMMARY_COLUMNS:
+        raise ValueError(f'Personas can not be sorted by {order_by}')
+    conditions = []
+    params = []
+
+    # A LIKE pattern with only a trailing % is answered with an index range scan
+    for column in ('vendor_name', 'part_number', 'serial_number'):
+        value = getattr(query, column)
+        if value is None:
+            continue
+
+        if query.prefix:
+            conditions.append(f"{column} LIKE {placeholder} ESCAPE '!'")
+            params.append(_escape_like(value) + '%')
+        else:
+            conditions.append(f"{column} = {placeholder}")
+            params.append(value)
+
+    for column in ('identifier', 'connector'):
+        value = getattr(query, column)
+        if value is not None:
+            conditions.append(f"{column} = {placeholder}")
+            params.append(value)
+
+    if query.min_wavelength is not None:
+        conditions.append(f"wavelength >= {placeholder}")
+        params.append(query.min_wavelength)
+
+    if query.max_wavelength is not None:
+        conditions.append(f"wavelength <= {placeholder}")
+        params.append(query.max_wavelength)
+
+    if query.transceiver_mask:
+        conditions.append(f"(transceiver & {placeholder}) = {placeholder}")
+        params += [query.transceiver_mask, query.transceiver_mask]
+
+    if query.after_id is not None:
+        conditions.append(f"id > {placeholder}")
+        params.append(query.after_id)
+
+    if after is not None:
+        comparison = '<' if descending else '>'
+        if order_by == 'id':
+            conditions.append(f"id {comparison} {placeholder}")
+            params.append(after.id)
+        else:
+            value = getattr(after, order_by)
+            conditions.append(
+                f"({order_by} {comparison} {placeholder} OR "
+                f"({order_by} = {placeholder} AND id {comparison} {placeholder}))"
+            )
+            params += [value, value, after.id]
+
+    sql = f"SELECT {', '.join(columns)} FROM personas"
+    if conditions:
+        sql += " WHERE " + " AND ".join(conditions)
+    # The ID breaks ties so that pages never overlap
+    direction = 'DESC' if descending else 'ASC'
+    sql += f" ORDER BY {order_by} {direction}"
+    if order_by != 'id':
+        sql += f", id {direction}"
+
+    if limit is not None or offset:
+        sql += f" LIMIT {placeholder} OFFSET {placeholder}"
+        params += [limit if limit is not None else 2**63 - 1, offset]
+
+    return sql, params
+
+def check_stress_waveform(waveform: bytes) -> bytes:
+    '''! Checks a packed stress waveform.
+
+    @brief Each sample is the two bytes (MSB, LSB) written to the
+    diagnostic register of the parameter in page 0xA2.
+
+    @param waveform The packed samples
+    @return The waveform as bytes
+    @exception ValueError If the waveform is empty or holds a partial sample
+    '''
+    waveform = bytes(waveform)
+
+    if not waveform:
+        raise ValueError('A stress waveform needs at least one sample')
+
+    if len(waveform) % STRESS_SAMPLE_SIZE:
+        raise ValueError(f'{len(waveform)} bytes is not a whole number of {STRESS_SAMPLE_SIZE} byte samples')
+
+    return waveform
+
+def telemetry_rollup_row(rollup: TelemetryRollup) -> tuple:
+    '''! Converts a rollup into the values of a telemetry_rollups row,
+    which stores sums instead of means so that rows can be merged.
+    '''
+    row = [rollup.module_id, rollup.resolution, rollup.start, rollup.count]
+    for field in TELEMETRY_FIELDS:
+        row += [
+            getattr(rollup, f'{field}_min'),
+            getattr(rollup, f'{field}_max'),
+            getattr(rollup, f'{field}_mean') * rollup.count,
+        ]
+    return tuple(row)
+
+## Value columns of the telemetry_rollups table, in telemetry_rollup_row() order
+TELEMETRY_ROLLUP_COLUMNS = [
+    f'{field}_{statistic}' for field in TELEMETRY_FIELDS for statistic in ('min', 'max', 'sum')
+]
+
+## Columns that select a TelemetryRollup from the telemetry_rollups table
+TELEMETRY_ROLLUP_SELECT = 'module_id, resolution, bucket_start, sample_count, ' + ', '.join(
+    f'{field}_min, {field}_max, {field}_sum / sample_count' for field in TELEMETRY_FIELDS
+)
+
+def persona_content_hash(page_a0: bytes, page_a2: bytes) -> bytes:
+    '''! Calculates the SHA-256 hash of both packed memory pages, leaving
+    out the real-time diagnostics of page 0xA2. Two clones of the same
+    module have the same hash.
+    '''
+    page_a2 = page_a2[:REAL_TIME_START] + page_a2[REAL_TIME_END:]
+    return hashlib.sha256(page_a0 + page_a2).digest()
+
+def chunks(values: list, size: int) -> Iterator[list]:
+    '''! Splits a list into lists of at most size values.'''
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+def open_repository() -> StorageRepository:
+    '''! Opens the repository selected by the STORAGE_BACKEND setting and
+    brings its schema up to date.
+    '''
+    settings = get_database_settings()
+
+    if settings['backend'] == 'sqlite':
+        from modules.database.sqlite_repository import SQLiteRepository
+        return SQLiteRepository(settings['sqlite_path'])
+
+    if settings['backend'] == 'mysql':
+        from modules.database.mysql_repository import MySQLRepository
+        repository = MySQLRepository()
+
+        # Existing databases get the new tables and columns before the
+        # first query. Every step of create_schema() is idempotent.
+        try:
+            repository.create_schema()
+        except Exception as ex:
+            raise Exception(
+                f'The MySQL schema could not be updated ({ex}). Run '
+                '"python -m modules.migrate_persona_schema" from the src folder '
+                'with an account allowed to create and alter tables.'
+            ) from ex
+
+        return repository
+
+    raise Exception(f"Unknown storage backend: {settings['backend']}")
+
+## The process-wide repository
+_repository = None
+_repository_lock = threading.Lock()
+
+def get_repository() -> StorageRepository:
+    '''! Gets the process-wide repository, opening it on first use.'''
+    global _repository
+
+    with _repository_lock:
+        if _repository is None:
+            _repository = open_repository()
+
+    return _repository
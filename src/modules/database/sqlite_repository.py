@@ -0,0 +1,440 @@
+##
+# @file sqlite_repository.py
+# @brief Embedded SQLite implementation of the storage repository.
+#
+# @section file_author Author
+# - Created on 10/19/2026
+#
+# Lets a bench station run without a database server. The database is
+# opened in WAL mode so readers never wait on the writer. Every query is
+# parameterized, so the sqlite3 module reuses the compiled statement
+# from its per-connection statement cache.
+##
+
+##
+# Standard Imports
+##
+import sqlite3
+import threading
+from dataclasses import replace
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+##
+# Local Library Imports
+##
+from modules.database.repository import MAX_IN_LIST, STRESS_CHUNK_SAMPLES, STRESS_SAMPLE_SIZE, \
+                                        Persona, PersonaQuery, PersonaSummary, StorageRepository, \
+                                        StressScenario, TELEMETRY_ROLLUP_COLUMNS, \
+                                        TELEMETRY_ROLLUP_SELECT, TelemetryRollup, TelemetrySample, \
+                                        build_persona_search, check_stress_waveform, chunks, \
+                                        pack_page, persona_content_hash, persona_index_fields, \
+                                        telemetry_rollup_row
+
+## Number of compiled statements kept per connection
+STATEMENT_CACHE_SIZE = 256
+
+## Columns decoded from page 0xA0 when a persona is stored, so that
+# personas can be searched without reading their pages. Text columns
+# compare without case, like the MySQL columns do, which also lets
+# SQLite answer LIKE prefix patterns from the index.
+INDEXED_COLUMNS = {
+    'vendor_name': 'TEXT COLLATE NOCASE',
+    'part_number': 'TEXT COLLATE NOCASE',
+    'serial_number': 'TEXT COLLATE NOCASE',
+    'identifier': 'INTEGER',
+    'connector': 'INTEGER',
+    'wavelength': 'INTEGER',
+    'transceiver': 'INTEGER',
+    'canonical_hash': 'BLOB',
+}
+
+## Columns that are only tested with bit masks, where an index does not help
+UNINDEXED_COLUMNS = {'transceiver'}
+
+## Columns with a unique index. A persona is stored once per content hash.
+UNIQUE_COLUMNS = {'canonical_hash'}
+
+## Columns of the stress_scenarios table added after it was first released.
+# The packed waveform is kept in the scenario_values column.
+STRESS_SCENARIO_COLUMNS = {
+    'parameter': 'INTEGER',
+    'sample_period': 'INTEGER',
+}
+
+_SCHEMA = [
+    (
+        "CREATE TABLE IF NOT EXISTS personas ("
+        "    id INTEGER PRIMARY KEY AUTOINCREMENT,"
+        "    page_a0 BLOB NOT NULL,"
+        "    page_a2 BLOB NOT NULL)"
+    ),
+    (
+        "CREATE TABLE IF NOT EXISTS stress_scenarios ("
+        "    stress_id INTEGER PRIMARY KEY AUTOINCREMENT,"
+        "    sfp_id INTEGER NOT NULL REFERENCES personas(id) ON DELETE CASCADE,"
+        "    scenario_name TEXT,"
+        "    parameter INTEGER,"
+        "    sample_period INTEGER,"
+        "    scenario_values BLOB NOT NULL)"
+    ),
+    "CREATE INDEX IF NOT EXISTS stress_scenarios_sfp_id ON stress_scenarios (sfp_id)",
+    (
+        "CREATE TABLE IF NOT EXISTS telemetry_samples ("
+        "    module_id TEXT NOT NULL,"
+        "    timestamp REAL NOT NULL,"
+        "    temperature REAL, vcc REAL, tx_bias REAL, tx_power REAL, rx_power REAL)"
+    ),
+    "CREATE INDEX IF NOT EXISTS telemetry_samples_module_time ON telemetry_samples (module_id, timestamp)",
+    (
+        "CREATE TABLE IF NOT EXISTS telemetry_rollups ("
+        "    module_id TEXT NOT NULL,"
+        "    resolution INTEGER NOT NULL,"
+        "    bucket_start REAL NOT NULL,"
+        "    sample_count INTEGER NOT NULL,"
+        f"   {', '.join(f'{column} REAL' for column in TELEMETRY_ROLLUP_COLUMNS)},"
+        "    PRIMARY KEY (module_id, resolution, bucket_start)) WITHOUT ROWID"
+    ),
+]
+
+# Minimums and maximums are kept with the two argument min() and max()
+_MERGE_TELEMETRY_ROLLUP = (
+    "INSERT INTO telemetry_rollups (module_id, resolution, bucket_start, sample_count, "
+    f"{', '.join(TELEMETRY_ROLLUP_COLUMNS)}) "
+    f"VALUES ({', '.join(['?'] * (4 + len(TELEMETRY_ROLLUP_COLUMNS)))}) "
+    "ON CONFLICT (module_id, resolution, bucket_start) DO UPDATE SET "
+    "sample_count = sample_count + excluded.sample_count, " +
+    ', '.join(
+        f"{column} = {column} + excluded.{column}" if column.endswith('_sum')
+        else f"{column} = {'min' if column.endswith('_min') else 'max'}({column}, excluded.{column})"
+        for column in TELEMETRY_ROLLUP_COLUMNS
+    )
+)
+
+_INSERT_PERSONA = (
+    "INSERT INTO personas (page_a0, page_a2, vendor_name, part_number, serial_number, "
+    "identifier, connector, wavelength, transceiver, canonical_hash) VALUES (:page_a0, "
+    ":page_a2, :vendor_name, :part_number, :serial_number, :identifier, :connector, "
+    ":wavelength, :transceiver, :canonical_hash) "
+    "ON CONFLICT (canonical_hash) DO NOTHING"
+)
+
+def _to_signed64(value: int) -> int:
+    '''! Converts an unsigned 64 bit number to the signed integer SQLite
+    stores. Bitwise operators give the same result on both.
+    '''
+    return value - (1 << 64) if value >= (1 << 63) else value
+
+class SQLiteRepository(StorageRepository):
+    '''! Stores everything in a local SQLite database file.
+
+    @brief Each thread gets its own connection to the database file,
+    so the repository can be used from worker threads.
+    '''
+
+    def __init__(self, path: str):
+        '''! Opens (and creates if needed) the database file.
+
+        @param path Path of the database file, or ":memory:"
+        '''
+        super().__init__()
+
+        self.path = path
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+
+        # An in-memory database only exists on one connection, so
+        # it has to be shared between threads
+        self._shared_connection = None
+        if path == ':memory:':
+            self._shared_connection = self._open_connection(check_same_thread=False)
+
+        self.create_schema()
+
+    def _open_connection(self, check_same_thread: bool = True) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            self.path,
+            isolation_level=None,
+            check_same_thread=check_same_thread,
+            cached_statements=STATEMENT_CACHE_SIZE
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute("PRAGMA foreign_keys=ON")
+
+        with self._connections_lock:
+            self._connections.append(connection)
+
+        return connection
+
+    def _connection(self) -> sqlite3.Connection:
+        '''! Gets the connection of the calling thread.'''
+        if self._shared_connection is not None:
+            return self._shared_connection
+
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = self._open_connection()
+            self._local.connection = connection
+
+        return connection
+
+    def create_schema(self) -> None:
+        connection = self._connection()
+        for statement in _SCHEMA:
+            connection.execute(statement)
+
+        # Databases created before the index columns existed get them added
+        # and filled in from the stored pages
+        existing_columns = {row[1] for row in connection.execute("PRAGMA table_info(personas)")}
+        missing_columns = [name for name in INDEXED_COLUMNS if name not in existing_columns]
+
+        for name in missing_columns:
+            connection.execute(f"ALTER TABLE personas ADD COLUMN {name} {INDEXED_COLUMNS[name]}")
+
+        if missing_columns:
+            self._fill_index_columns(connection)
+
+        # Personas stored before the content hash was unique may be stored
+        # more than once
+        if 'canonical_hash' in missing_columns:
+            self._merge_duplicate_personas(connection)
+
+        for name in INDEXED_COLUMNS:
+            if name in UNINDEXED_COLUMNS:
+                continue
+            unique = 'UNIQUE ' if name in UNIQUE_COLUMNS else ''
+            connection.execute(f"CREATE {unique}INDEX IF NOT EXISTS personas_{name} ON personas ({name})")
+
+        # The hash over both whole pages was replaced by canonical_hash.
+        # DROP COLUMN needs SQLite 3.35, older libraries keep the unused,
+        # nullable column.
+        if 'content_hash' in existing_columns:
+            connection.execute("DROP INDEX IF EXISTS personas_content_hash")
+            if sqlite3.sqlite_version_info >= (3, 35, 0):
+                connection.execute("ALTER TABLE personas DROP COLUMN content_hash")
+
+        existing_columns = {row[1] for row in connection.execute("PRAGMA table_info(stress_scenarios)")}
+        for name, definition in STRESS_SCENARIO_COLUMNS.items():
+            if name not in existing_columns:
+                connection.execute(f"ALTER TABLE stress_scenarios ADD COLUMN {name} {definition}")
+
+    def _fill_index_columns(self, connection: sqlite3.Connection) -> None:
+        rows = connection.execute("SELECT id, page_a0, page_a2 FROM personas").fetchall()
+
+        with connection:
+            connection.execute("BEGIN")
+            connection.executemany(
+                "UPDATE personas SET vendor_name=:vendor_name, part_number=:part_number, "
+                "serial_number=:serial_number, identifier=:identifier, connector=:connector, "
+                "wavelength=:wavelength, transceiver=:transceiver, "
+                "canonical_hash=:canonical_hash WHERE id=:id",
+                [dict(self._index_values(page_a0, page_a2), id=persona_id)
+                 for persona_id, page_a0, page_a2 in rows]
+            )
+
+    @staticmethod
+    def _merge_duplicate_personas(connection: sqlite3.Connection) -> None:
+        '''! Keeps the oldest of the personas that have the same content
+        hash. Stress scenarios of the others are moved to it.
+        '''
+        with connection:
+            connection.execute("BEGIN")
+            connection.execute(
+                "CREATE TEMP TABLE persona_duplicates AS "
+                "SELECT p.id AS id, k.keep_id AS keep_id FROM personas p JOIN ("
+                "    SELECT canonical_hash, MIN(id) AS keep_id FROM personas "
+                "    GROUP BY canonical_hash HAVING COUNT(*) > 1"
+                ") k ON k.canonical_hash = p.canonical_hash WHERE p.id <> k.keep_id"
+            )
+            connection.execute(
+                "UPDATE stress_scenarios SET sfp_id = "
+                "(SELECT keep_id FROM persona_duplicates d WHERE d.id = stress_scenarios.sfp_id) "
+                "WHERE sfp_id IN (SELECT id FROM persona_duplicates)"
+            )
+            connection.execute("DELETE FROM personas WHERE id IN (SELECT id FROM persona_duplicates)")
+            connection.execute("DROP TABLE persona_duplicates")
+
+    @classmethod
+    def _persona_row(cls, page_a0: List[int], page_a2: List[int]) -> dict:
+        '''! Gets the values of every personas column for _INSERT_PERSONA.'''
+        page_a0 = pack_page(page_a0)
+        page_a2 = pack_page(page_a2)
+
+        values = cls._index_values(page_a0, page_a2)
+        values.update(page_a0=page_a0, page_a2=page_a2)
+        return values
+
+    @staticmethod
+    def _index_values(page_a0: bytes, page_a2: bytes) -> dict:
+        values = persona_index_fields(page_a0)
+        values['transceiver'] = _to_signed64(values['transceiver'])
+        values['canonical_hash'] = persona_content_hash(page_a0, page_a2)
+        return values
+
+    def iter_persona_pages_a0(self) -> Iterator[Tuple[int, List[int]]]:
+        cursor = self._connection().execute("SELECT id, page_a0 FROM personas ORDER BY id")
+
+        for persona_id, page_a0 in cursor:
+            yield persona_id, list(page_a0)
+
+    def _load_pages(self, persona_ids: List[int]) -> Dict[int, Tuple[bytes, bytes]]:
+        pages = {}
+        connection = self._connection()
+
+        for chunk in chunks(persona_ids, MAX_IN_LIST):
+            cursor = connection.execute(
+                f"SELECT id, page_a0, page_a2 FROM personas WHERE id IN ({', '.join('?' * len(chunk))})",
+                chunk
+            )
+            pages.update((row[0], (row[1], row[2])) for row in cursor)
+
+        return pages
+
+    def add_persona(self, page_a0: List[int], page_a2: List[int]) -> int:
+        connection = self._connection()
+        row = self._persona_row(page_a0, page_a2)
+
+        cursor = connection.execute(_INSERT_PERSONA, row)
+        if cursor.rowcount == 0:
+            # The same content is stored already
+            return connection.execute(
+                "SELECT id FROM personas WHERE canonical_hash=?", (row['canonical_hash'],)
+            ).fetchone()[0]
+
+        self.persona_cache.invalidate([cursor.lastrowid])
+        return cursor.lastrowid
+
+    def add_personas(self, personas: List[Tuple[bytes, bytes]]) -> int:
+        rows = [self._persona_row(page_a0, page_a2) for page_a0, page_a2 in personas]
+
+        connection = self._connection()
+        with connection:
+            connection.execute("BEGIN")
+            cursor = connection.executemany(_INSERT_PERSONA, rows)
+
+        # Conflicting rows are not counted
+        return cursor.rowcount if rows else 0
+
+    def find_content_hashes(self, content_hashes: Iterable[bytes]) -> Set[bytes]:
+        found = set()
+        connection = self._connection()
+
+        for chunk in chunks(list(content_hashes), MAX_IN_LIST):
+            cursor = connection.execute(
+                f"SELECT canonical_hash FROM personas WHERE canonical_hash IN ({', '.join('?' * len(chunk))})",
+                chunk
+            )
+            found.update(row[0] for row in cursor)
+
+        return found
+
+    def search_personas(self, query: PersonaQuery, limit: Optional[int] = None, offset: int = 0,
+                        order_by: str = 'id', descending: bool = False,
+                        after: Optional[PersonaSummary] = None) -> List[PersonaSummary]:
+        query = replace(query, transceiver_mask=_to_signed64(query.transceiver_mask))
+        sql, params = build_persona_search(query, '?', limit, offset, order_by, descending, after)
+
+        return [PersonaSummary(*row) for row in self._connection().execute(sql, params)]
+
+    def iter_personas(self, query: PersonaQuery) -> Iterator[Persona]:
+        query = replace(query, transceiver_mask=_to_signed64(query.transceiver_mask))
+        sql, params = build_persona_search(query, '?', columns=Persona._fields)
+
+        for persona_id, page_a0, page_a2 in self._connection().execute(sql, params):
+            yield Persona(persona_id, list(page_a0), list(page_a2))
+
+    def list_stress_scenarios(self, persona_id: int) -> List[StressScenario]:
+        # length() of a blob is read from the row header, not the blob
+        cursor = self._connection().execute(
+            "SELECT stress_id, sfp_id, scenario_name, parameter, sample_period, "
+            f"length(scenario_values) / {STRESS_SAMPLE_SIZE} FROM stress_scenarios "
+            "WHERE sfp_id=? ORDER BY stress_id",
+            (persona_id,)
+        )
+        return [StressScenario(*row) for row in cursor]
+
+    def add_stress_scenario(self, persona_id: int, scenario_name: str, parameter: int,
+                            sample_period: int, waveform: bytes) -> int:
+        cursor = self._connection().execute(
+            "INSERT INTO stress_scenarios (sfp_id, scenario_name, parameter, sample_period, "
+            "scenario_values) VALUES (?, ?, ?, ?, ?)",
+            (persona_id, scenario_name, parameter, sample_period, check_stress_waveform(waveform))
+        )
+        return cursor.lastrowid
+
+    def iter_stress_waveform(self, stress_id: int,
+                             chunk_samples: int = STRESS_CHUNK_SAMPLES) -> Iterator[memoryview]:
+        connection = self._connection()
+
+        row = connection.execute(
+            "SELECT length(scenario_values) FROM stress_scenarios WHERE stress_id=?", (stress_id,)
+        ).fetchone()
+        if row is None or row[0] is None:
+            return
+
+        # Each chunk is its own substr() query, so only one chunk of the
+        # blob is read at a time. substr() is 1-indexed.
+        chunk_size = chunk_samples * STRESS_SAMPLE_SIZE
+        for offset in range(0, row[0], chunk_size):
+            chunk = connection.execute(
+                "SELECT substr(scenario_values, ?, ?) FROM stress_scenarios WHERE stress_id=?",
+                (offset + 1, chunk_size, stress_id)
+            ).fetchone()
+            if chunk is None:
+                return
+            yield memoryview(chunk[0])
+
+    def add_telemetry_samples(self, samples: List[TelemetrySample]) -> None:
+        if not samples:
+            return
+
+        connection = self._connection()
+        with connection:
+            connection.execute("BEGIN")
+            connection.executemany(
+                "INSERT INTO telemetry_samples (module_id, timestamp, temperature, vcc, "
+                "tx_bias, tx_power, rx_power) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [tuple(sample) for sample in samples]
+            )
+
+    def get_telemetry_samples(self, module_id: str, start: float, end: float) -> List[TelemetrySample]:
+        cursor = self._connection().execute(
+            "SELECT module_id, timestamp, temperature, vcc, tx_bias, tx_power, rx_power "
+            "FROM telemetry_samples WHERE module_id=? AND timestamp>=? AND timestamp<? "
+            "ORDER BY timestamp",
+            (module_id, start, end)
+        )
+        return [TelemetrySample(*row) for row in cursor]
+
+    def add_telemetry_rollups(self, rollups: List[TelemetryRollup]) -> None:
+        if not rollups:
+            return
+
+        connection = self._connection()
+        with connection:
+            connection.execute("BEGIN")
+            connection.executemany(
+                _MERGE_TELEMETRY_ROLLUP, [telemetry_rollup_row(rollup) for rollup in rollups]
+            )
+
+    def get_telemetry_rollups(self, module_id: str, resolution: int, start: float,
+                              end: float) -> List[TelemetryRollup]:
+        cursor = self._connection().execute(
+            f"SELECT {TELEMETRY_ROLLUP_SELECT} FROM telemetry_rollups "
+            "WHERE module_id=? AND resolution=? AND bucket_start>=? AND bucket_start<? "
+            "ORDER BY bucket_start",
+            (module_id, resolution, start, end)
+        )
+        return [TelemetryRollup(*row) for row in cursor]
+
+    def close(self) -> None:
+        super().close()
+
+        with self._connections_lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections.clear()
+
+        self._local = threading.local()
+        self._shared_connection = None
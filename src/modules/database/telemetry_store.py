@@ -0,0 +1,266 @@
+##
+# @file telemetry_store.py
+# @brief Write-behind store of real-time diagnostic samples.
+#
+# @section file_author Author
+# - Created on 10/19/2026
+#
+# Samples are handed to record() and written by a background thread in
+# batches, one transaction per batch, so the GUI thread never waits on
+# the database. Every sample is kept in the append-only telemetry_samples
+# table.
+#
+# The writer also keeps 1 second, 1 minute and 1 hour rollups (minimum,
+# maximum and mean of each value) up to date. Only the change since the
+# last write is kept in memory and merged into the stored rollups, so a
+# rollup stays correct across restarts. Long time ranges are read from
+# the rollups instead of the samples, see get_history().
+#
+# While writes fail the delay between them doubles up to
+# MAX_FLUSH_INTERVAL, and drops back to the flush interval after the next
+# successful write.
+##
+
+##
+# Standard Imports
+##
+import math
+import time
+import queue
+import logging
+import threading
+from collections import deque
+from typing import Dict, List, Optional, Tuple, Union
+
+##
+# Local Library Imports
+##
+from modules.database.repository import TELEMETRY_FIELDS, StorageRepository, TelemetryRollup, \
+                                        TelemetrySample, get_repository
+
+## Rollup resolutions in seconds, from finest to coarsest
+ROLLUP_RESOLUTIONS = (1, 60, 3600)
+
+# Queued by TelemetryStore.close() to stop the writer thread
+_STOP = object()
+
+class _RollupBucket:
+    '''! Minimum, maximum and sum of each diagnostic value of the samples
+    in one bucket of time that are not written yet.
+    '''
+
+    def __init__(self, values: List[float]):
+        self.count = 1
+        self.minimum = list(values)
+        self.maximum = list(values)
+        self.total = list(values)
+
+    def add(self, values: List[float]) -> None:
+        self.count += 1
+        for i, value in enumerate(values):
+            if value < self.minimum[i]:
+                self.minimum[i] = value
+            if value > self.maximum[i]:
+                self.maximum[i] = value
+            self.total[i] += value
+
+    def rollup(self, module_id: str, resolution: int, start: float) -> TelemetryRollup:
+        values = []
+        for i in range(len(TELEMETRY_FIELDS)):
+            values += [self.minimum[i], self.maximum[i], self.total[i] / self.count]
+
+        return TelemetryRollup(module_id, resolution, start, self.count, *values)
+
+class TelemetryStore:
+    '''! Stores real-time diagnostic samples and their rollups.
+
+    @brief Usage:
+        store = TelemetryStore()
+        store.record(TelemetrySample(dock_ip, time.time(), ...))
+        ...
+        store.close()
+    '''
+
+    ## Seconds between writes
+    DEFAULT_FLUSH_INTERVAL = 1.0
+
+    ## Most seconds between writes while the database keeps failing. The
+    # delay doubles after every failed write up to this value.
+    MAX_FLUSH_INTERVAL = 60.0
+
+    ## Most samples written per transaction
+    DEFAULT_BATCH_SIZE = 1000
+
+    ## Most samples kept while the database can not be written to. The
+    # oldest samples are dropped first.
+    MAX_PENDING_SAMPLES = 100000
+
+    def __init__(self, repository: Optional[StorageRepository] = None,
+                 flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+                 batch_size: int = DEFAULT_BATCH_SIZE):
+        '''! Initializes the store. The writer thread starts with the first
+        recorded sample.
+
+        @param repository The StorageRepository to write to, the
+                          process-wide repository by default
+        @param flush_interval Seconds between writes
+        @param batch_size Most samples written per transaction
+        '''
+        self._repository = repository
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+
+        # Seconds until the next write, longer while writes keep failing
+        self._flush_delay = flush_interval
+
+        self._queue = queue.Queue()
+        self._thread = None
+        self._thread_lock = threading.Lock()
+        self._closed = False
+
+        # Samples and rollup changes that are not written yet
+        self._pending = deque(maxlen=self.MAX_PENDING_SAMPLES)
+        self._buckets: Dict[Tuple[str, int, float], _RollupBucket] = {}
+        self._write_lock = threading.Lock()
+
+    def _get_repository(self) -> StorageRepository:
+        if self._repository is None:
+            self._repository = get_repository()
+        return self._repository
+
+    def record(self, sample: TelemetrySample) -> None:
+        '''! Queues a sample to be written. Never waits on the database.
+
+        @param sample The TelemetrySample, with every diagnostic value set
+        '''
+        if self._closed:
+            raise Exception('The telemetry store is closed')
+
+        self._queue.put(sample)
+
+        if self._thread is None:
+            with self._thread_lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._run, name='telemetry-writer', daemon=True
+                    )
+                    self._thread.start()
+
+    def _run(self) -> None:
+        next_flush = time.monotonic() + self._flush_delay
+        written = True
+
+        while True:
+            timeout = max(0.0, next_flush - time.monotonic())
+            try:
+                sample = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                sample = None
+
+            stopping = sample is _STOP
+            if sample is not None and not stopping:
+                self._add(sample)
+
+            # A full batch is only written early while writes succeed
+            batch_ready = written and len(self._pending) >= self.batch_size
+
+            if stopping or batch_ready or time.monotonic() >= next_flush:
+                written = self.flush()
+                self._update_flush_delay(written)
+                next_flush = time.monotonic() + self._flush_delay
+
+            if stopping:
+                return
+
+    def _update_flush_delay(self, written: bool) -> None:
+        '''! Backs off exponentially while writes fail, so a database that
+        stays unavailable is not retried every flush interval.
+
+        @param written Whether the last write succeeded
+        '''
+        if written:
+            self._flush_delay = self.flush_interval
+        else:
+            self._flush_delay = min(self._flush_delay * 2, max(self.MAX_FLUSH_INTERVAL, self.flush_interval))
+
+    def _add(self, sample: TelemetrySample) -> None:
+        '''! Adds a sample to the pending samples and rollups.'''
+        values = [getattr(sample, field) for field in TELEMETRY_FIELDS]
+
+        with self._write_lock:
+            self._pending.append(sample)
+
+            for resolution in ROLLUP_RESOLUTIONS:
+                key = (sample.module_id, resolution, math.floor(sample.timestamp / resolution) * resolution)
+
+                bucket = self._buckets.get(key)
+                if bucket is None:
+                    self._buckets[key] = _RollupBucket(values)
+                else:
+                    bucket.add(values)
+
+    def flush(self) -> bool:
+        '''! Writes the pending samples and rollups.
+
+        @return True if everything was written. On failure nothing is
+                lost, the pending samples are written next time.
+        '''
+        with self._write_lock:
+            if not self._pending and not self._buckets:
+                return True
+
+            samples = list(self._pending)
+            rollups = [
+                bucket.rollup(module_id, resolution, start)
+                for (module_id, resolution, start), bucket in self._buckets.items()
+            ]
+
+            try:
+                repository = self._get_repository()
+                for i in range(0, len(samples), self.batch_size):
+                    batch = samples[i:i + self.batch_size]
+                    repository.add_telemetry_samples(batch)
+                    for _ in batch:
+                        self._pending.popleft()
+
+                repository.add_telemetry_rollups(rollups)
+                self._buckets.clear()
+            except Exception as ex:
+                logging.error(f'Writing telemetry failed, will try again: {ex}')
+                return False
+
+        return True
+
+    def get_history(self, module_id: str, start: float, end: float,
+                    max_points: int = 2000) -> List[Union[TelemetrySample, TelemetryRollup]]:
+        '''! Reads the history of a module at the finest resolution that
+        fits in max_points.
+
+        @param module_id The module to read
+        @param start The first timestamp, inclusive
+        @param end The last timestamp, exclusive
+        @param max_points Most points wanted, for example the pixel width
+                          of a plot
+        @return TelemetrySample list if the samples fit, TelemetryRollup
+                list of the finest rollup that fits otherwise
+        '''
+        repository = self._get_repository()
+
+        # Samples arrive about once a second, like the finest rollup
+        for resolution in ROLLUP_RESOLUTIONS:
+            if (end - start) / resolution <= max_points:
+                if resolution == ROLLUP_RESOLUTIONS[0]:
+                    return repository.get_telemetry_samples(module_id, start, end)
+                return repository.get_telemetry_rollups(module_id, resolution, start, end)
+
+        return repository.get_telemetry_rollups(module_id, ROLLUP_RESOLUTIONS[-1], start, end)
+
+    def close(self) -> None:
+        '''! Writes everything that is pending and stops the writer thread.'''
+        self._closed = True
+
+        if self._thread is not None:
+            self._queue.put(_STOP)
+            self._thread.join()
+        else:
+            self.flush()
@@ -0,0 +1,144 @@
+# Script to export personas from the database
+#
+# Run from the src folder with:
+#   python -m modules.export_personas <format> <output> [filters]
+#
+# Formats:
+# - bin:     a directory with one <id>.bin file per persona, holding
+#            page 0xA0 followed by page 0xA2
+# - archive: the same files in a gzip compressed tar archive
+# - jsonl:   one JSON object per line with the decoded identifying fields
+#            and both pages as hex
+#
+# Personas are streamed from the database, so memory use does not grow
+# with the number of personas. A bin export, or an extracted archive, can
+# be read back with modules.import_eeprom_dumps.
+
+import io
+import os
+import json
+import time
+import tarfile
+import argparse
+from typing import Iterable
+
+from modules.core.sfp import connector_type_name
+from modules.database.repository import Persona, PersonaQuery, get_repository, pack_page, \
+                                        persona_index_fields
+
+def _dump_name(persona: Persona) -> str:
+    return f'{persona.id}.bin'
+
+def _dump_bytes(persona: Persona) -> bytes:
+    return pack_page(persona.page_a0) + pack_page(persona.page_a2)
+
+def export_bin(personas: Iterable[Persona], directory: str) -> int:
+    '''! Writes every persona to its own dump file.
+
+    @param personas The personas to export
+    @param directory The directory to write to, created if needed
+    @return The number of personas written
+    '''
+    os.makedirs(directory, exist_ok=True)
+
+    count = 0
+    for persona in personas:
+        with open(os.path.join(directory, _dump_name(persona)), 'wb') as dump_file:
+            dump_file.write(_dump_bytes(persona))
+        count += 1
+
+    return count
+
+def export_archive(personas: Iterable[Persona], path: str) -> int:
+    '''! Writes every persona as a dump file into a .tar.gz archive.
+
+    @param personas The personas to export
+    @param path The path of the archive
+    @return The number of personas written
+    '''
+    count = 0
+    with tarfile.open(path, 'w:gz') as archive:
+        for persona in personas:
+            data = _dump_bytes(persona)
+
+            info = tarfile.TarInfo(_dump_name(persona))
+            info.size = len(data)
+            info.mtime = int(time.time())
+            archive.addfile(info, io.BytesIO(data))
+            count += 1
+
+    return count
+
+def decode_persona(persona: Persona) -> dict:
+    '''! Decodes the identifying fields of a persona for the JSON lines
+    export.
+    '''
+    page_a0 = pack_page(persona.page_a0)
+    page_a2 = pack_page(persona.page_a2)
+    fields = persona_index_fields(page_a0)
+
+    return {
+        'id': persona.id,
+        'vendor_name': fields['vendor_name'],
+        'part_number': fields['part_number'],
+        'serial_number': fields['serial_number'],
+        'identifier': fields['identifier'],
+        'connector': connector_type_name(fields['connector']),
+        'wavelength': fields['wavelength'],
+        'transceiver': f"{fields['transceiver']:016X}",
+        'page_a0': page_a0.hex(),
+        'page_a2': page_a2.hex(),
+    }
+
+def export_jsonl(personas: Iterable[Persona], path: str) -> int:
+    '''! Writes every persona as a line of JSON.
+
+    @param personas The personas to export
+    @param path The path of the JSON lines file
+    @return The number of personas written
+    '''
+    count = 0
+    with open(path, 'w', encoding='utf-8') as jsonl_file:
+        for persona in personas:
+            jsonl_file.write(json.dumps(decode_persona(persona)))
+            jsonl_file.write('\n')
+            count += 1
+
+    return count
+
+## Export function of each format
+EXPORTERS = {
+    'bin': export_bin,
+    'archive': export_archive,
+    'jsonl': export_jsonl,
+}
+
+def main():
+    parser = argparse.ArgumentParser(description='Exports personas from the database')
+    parser.add_argument('format', choices=sorted(EXPORTERS), help='output format')
+    parser.add_argument('output', help='output directory for bin, output file otherwise')
+    parser.add_argument('--vendor-name', help='only personas with this vendor name')
+    parser.add_argument('--part-number', help='only personas with this part number')
+    parser.add_argument('--serial-number', help='only personas with this serial number')
+    parser.add_argument('--prefix', action='store_true', help='match the text filters as prefixes')
+    parser.add_argument('--min-wavelength', type=int, help='lowest wavelength in nm')
+    parser.add_argument('--max-wavelength', type=int, help='highest wavelength in nm')
+    args = parser.parse_args()
+
+    query = PersonaQuery(
+        vendor_name=args.vendor_name,
+        part_number=args.part_number,
+        serial_number=args.serial_number,
+        prefix=args.prefix,
+        min_wavelength=args.min_wavelength,
+        max_wavelength=args.max_wavelength
+    )
+
+    start = time.perf_counter()
+    count = EXPORTERS[args.format](get_repository().iter_personas(query), args.output)
+    elapsed = time.perf_counter() - start
+
+    print(f'Exported {count} personas in {elapsed:.2f} seconds')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+# Script to import directories of SFP EEPROM dumps as personas
+#
+# Run from the src folder with:
+#   python -m modules.import_eeprom_dumps <directory> [<directory> ...]
+#
+# Every file matching the pattern is read and validated in a process pool
+# (see modules/core/eeprom_dump.py for the accepted formats). Dumps whose
+# content is already stored, or that appear more than once, are skipped.
+# New personas are written in batches, one transaction per batch.
+
+import os
+import time
+import argparse
+import fnmatch
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator, List
+
+from modules.core.eeprom_dump import EepromDump, read_dump
+from modules.database.repository import StorageRepository, get_repository
+
+##
+# Named tuple for the result of an import
+##
+ImportSummary = namedtuple("ImportSummary", "imported, duplicates, invalid")
+
+## Number of personas written per transaction
+DEFAULT_BATCH_SIZE = 5000
+
+## Most files handed to a worker process at a time
+MAX_CHUNK_SIZE = 256
+
+def find_dump_files(directories: Iterable[str], pattern: str = '*.bin') -> Iterator[str]:
+    '''! Walks directories for dump files.
+
+    @param directories The directories to walk
+    @param pattern The file name pattern of dump files
+    @return Iterator of file paths
+    '''
+    for directory in directories:
+        for root, _, file_names in os.walk(directory):
+            for file_name in sorted(fnmatch.filter(file_names, pattern)):
+                yield os.path.join(root, file_name)
+
+def _store_batch(repository: StorageRepository, batch: List[EepromDump]) -> int:
+    '''! Stores the dumps of a batch that are not stored yet.
+
+    @return The number of personas stored
+    '''
+    stored = repository.find_content_hashes(dump.content_hash for dump in batch)
+    new_dumps = [dump for dump in batch if dump.content_hash not in stored]
+
+    return repository.add_personas([(dump.page_a0, dump.page_a2) for dump in new_dumps])
+
+def import_dumps(repository: StorageRepository, paths: List[str], workers: int = None,
+                 batch_size: int = DEFAULT_BATCH_SIZE, report=print) -> ImportSummary:
+    '''! Imports dump files as personas.
+
+    @param repository The StorageRepository to store personas in
+    @param paths The dump files to import
+    @param workers Number of processes that read dumps, all CPUs by default
+    @param batch_size Number of personas written per transaction
+    @param report Function called with a message for every invalid dump
+    @return The ImportSummary
+    '''
+    workers = workers or os.cpu_count() or 1
+
+    imported = 0
+    invalid = 0
+    seen_hashes = set()
+    batch = []
+
+    def read_all(pool) -> Iterator[EepromDump]:
+        if pool is None:
+            return map(read_dump, paths)
+
+        # Large chunks keep the cost of sending work to the processes low
+        chunk_size = max(1, min(MAX_CHUNK_SIZE, len(paths) // (workers * 4)))
+        return pool.map(read_dump, paths, chunksize=chunk_size)
+
+    pool = ProcessPoolExecutor(workers) if workers > 1 and len(paths) > 1 else None
+    try:
+        for dump in read_all(pool):
+            if dump.error is not None:
+                invalid += 1
+                report(f'Skipping {dump.path}: {dump.error}')
+                continue
+
+            if dump.content_hash in seen_hashes:
+                continue
+            seen_hashes.add(dump.content_hash)
+
+            batch.append(dump)
+            if len(batch) >= batch_size:
+                imported += _store_batch(repository, batch)
+                batch = []
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    if batch:
+        imported += _store_batch(repository, batch)
+
+    return ImportSummary(imported, len(paths) - invalid - imported, invalid)
+
+def main():
+    parser = argparse.ArgumentParser(description='Imports SFP EEPROM dumps as personas')
+    parser.add_argument('directories', nargs='+', help='directories to search for dumps')
+    parser.add_argument('--pattern', default='*.bin', help='file name pattern of dumps')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='number of processes that read dumps, all CPUs by default')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                        help='number of personas written per transaction')
+    args = parser.parse_args()
+
+    repository = get_repository()
+    repository.create_schema()
+
+    start = time.perf_counter()
+    paths = list(find_dump_files(args.directories, args.pattern))
+    summary = import_dumps(repository, paths, args.workers, args.batch_size)
+    elapsed = time.perf_counter() - start
+
+    print(f'Read {len(paths)} dumps in {elapsed:.2f} seconds: {summary.imported} imported, '
+          f'{summary.duplicates} duplicates, {summary.invalid} invalid')
+
+if __name__ == '__main__':
+    main()
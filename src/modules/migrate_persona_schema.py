@@ -0,0 +1,31 @@
+# Script to move personas from the legacy one-column-per-byte page tables
+# into the compact personas table
+#
+# Run from the src folder with: python -m modules.migrate_persona_schema
+#
+# The conversion is done in batches, one transaction per batch, and
+# remembers the last converted row. It can be stopped and run again at any
+# time, including while docking stations keep cloning modules.
+
+import argparse
+import time
+
+from modules.database.repository import get_repository
+
+def main():
+    parser = argparse.ArgumentParser(description='Converts legacy page table rows into personas')
+    parser.add_argument('--batch-size', type=int, default=500,
+                        help='number of personas converted per transaction')
+    args = parser.parse_args()
+
+    repository = get_repository()
+    repository.create_schema()
+
+    start = time.perf_counter()
+    converted = repository.import_legacy_pages(args.batch_size)
+    elapsed = time.perf_counter() - start
+
+    print(f'Converted {converted} personas in {elapsed:.2f} seconds')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+##
+# @file discovery_cache.py
+# @brief Remembers discovered devices so that repeated discovery
+#        responses do not trigger repeated connection attempts.
+#
+# @section file_author Author
+# - Created on 10/19/2026
+##
+
+##
+# Standard Library Imports
+##
+import time
+from enum import Enum
+from dataclasses import dataclass
+from typing import Callable, Dict, Tuple
+
+##
+# Local Library Imports
+##
+from modules.network.utility import DeviceType
+
+class ConnectionState(Enum):
+    '''! Connection states of a discovered device.'''
+    CONNECTING = 0
+    CONNECTED = 1
+    DISCONNECTED = 2
+
+@dataclass
+class DiscoveryEntry:
+    '''! A single device in the discovery cache.'''
+    ip: str
+    device_type: DeviceType
+    last_seen: float
+    state: ConnectionState
+    ## When the entry last moved to CONNECTING. Replies do not change it,
+    # so an attempt expires even while the device keeps replying.
+    attempt_started: float
+
+class DiscoveryCache:
+    '''! Cache of discovered devices keyed by IP address and device type.
+
+    @brief Every DISCOVER round makes every device reply. The cache makes
+    sure only devices that are new, that disconnected, or whose connection
+    attempt expired without succeeding start a new connection setup.
+    '''
+
+    ## Seconds a connection attempt may take before the next reply of the
+    # device starts a new one. This must be longer than the longest
+    # broadcast interval.
+    DEFAULT_TTL_SEC = 60.0
+
+    def __init__(self, ttl_sec: float = DEFAULT_TTL_SEC, clock: Callable[[], float] = time.monotonic):
+        '''! Initializes an empty cache.
+
+        @param ttl_sec Seconds before a connection attempt expires
+        @param clock Function returning the current time in seconds
+        '''
+        self.ttl_sec = ttl_sec
+        self._clock = clock
+        self._entries: Dict[Tuple[str, DeviceType], DiscoveryEntry] = {}
+
+    def observe(self, ip: str, device_type: DeviceType) -> bool:
+        '''! Records a discovery response from a device.
+
+        @param ip The IP address of the device
+        @param device_type The DeviceType of the device
+        @return True if connection setup should be started for the device
+        '''
+        now = self._clock()
+        key = (ip, device_type)
+        entry = self._entries.get(key)
+
+        if entry is None or self._needs_connection(entry, now):
+            self._entries[key] = DiscoveryEntry(ip, device_type, now, ConnectionState.CONNECTING, now)
+            return True
+
+        entry.last_seen = now
+        return False
+
+    def _needs_connection(self, entry: DiscoveryEntry, now: float) -> bool:
+        '''! Checks if a known device should be connected to again.'''
+        if entry.state == ConnectionState.DISCONNECTED:
+            return True
+
+        if entry.state == ConnectionState.CONNECTING:
+            return now - entry.attempt_started > self.ttl_sec
+
+        return False
+
+    def mark_connected(self, ip: str, device_type: DeviceType) -> None:
+        '''! Records that a TCP connection with the device was made.'''
+        self._set_state(ip, device_type, ConnectionState.CONNECTED)
+
+    def mark_disconnected(self, ip: str, device_type: DeviceType) -> None:
+        '''! Records that the TCP connection with the device was lost.
+        The next discovery response from the device reconnects it.
+        '''
+        self._set_state(ip, device_type, ConnectionState.DISCONNECTED)
+
+    def _set_state(self, ip: str, device_type: DeviceType, state: ConnectionState) -> None:
+        key = (ip, device_type)
+        entry = self._entries.get(key)
+
+        if entry is None:
+            now = self._clock()
+            self._entries[key] = DiscoveryEntry(ip, device_type, now, state, now)
+        else:
+            entry.state = state
+
+    def get(self, ip: str, device_type: DeviceType) -> DiscoveryEntry:
+        '''! Gets the cache entry for a device or None.'''
+        return self._entries.get((ip, device_type))
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -10,7 +10,10 @@
 #
 ##
 
+import os
 import time
+import logging
+import ipaddress
 from typing import List
 
 from PyQt5.QtCore import QObject, QThread, QTimer, pyqtSignal, QByteArray
@@ -23,69 +26,342 @@ from modules.network.utility import *
 class BroadcastWorker(QObject):
     '''! Worker object that sends out UDP broadcast packets.
     
-    @brief Uses QTimer to signal a timeout event every __TIMEOUT_MSEC
-    milliseconds. When the timeout event occurs, it signals the do_broadcast()
-    slot.
-
+    @brief Uses QTimer to signal a timeout event that calls the do_broadcast()
+    slot. One UDP socket is bound on every usable network interface so
+    devices on every attached subnet are discovered. Responses are read as
+    soon as a socket signals readyRead.
+
+    The broadcast interval starts at MIN_BROADCAST_MSEC and doubles after
+    every round in which the set of responding devices did not change, up
+    to MAX_BROADCAST_MSEC. Any change in topology (a new device, a device
+    that stopped responding or an interface change) snaps the interval
+    back to MIN_BROADCAST_MSEC.
+
+    Devices may also announce themselves without being asked by sending
+    their DISCOVER_ACK message to ANNOUNCE_PORT.
     '''
     # This signal is emitted when a UDP response is received
     device_response = pyqtSignal(object)
 
-    
+    ## Port used for device discovery
+    DISCOVERY_PORT = 20100
+
+    ## Port devices can send unsolicited announcements to
+    ANNOUNCE_PORT = 20101
+
+    ## Broadcast interval used while the fleet is changing
+    MIN_BROADCAST_MSEC = 1000
+
+    ## Longest broadcast interval once the fleet is stable
+    MAX_BROADCAST_MSEC = 32000
+
+    ## How often the interface table is checked for changes
+    INTERFACE_REFRESH_MSEC = 5000
 
     def on_thread_start(self):
         '''! Called when the thread starts.
 
-        @brief Creates a UDP socket and binds it to the machine's local IP 
-        address on port 20100. Also finds and saves the LAN broadcast address.
+        @brief Creates a UDP socket for each usable network interface and
+        binds it to that interface's IP address on port 20100. Also saves
+        the broadcast address of each interface and opens the announcement
+        socket.
         '''
-        local_ip_str = get_LAN_ip_address()
-        broadcast_ip_str = get_LAN_broadcast_address(local_ip_str)
+        self._port = self.DISCOVERY_PORT
 
-        self._sock = QUdpSocket()
-        self._port = 20100
-        self._bind_address = QHostAddress(local_ip_str)
-        self._broadcast_address = QHostAddress(broadcast_ip_str)
+        # Maps local IP address -> (socket, broadcast address)
+        self._sockets = {}
 
-        self._sock.bind(self._bind_address, self._port)
+        # Devices that responded in the current and previous rounds.
+        # There is no previous round yet, so the first round is fast.
+        self._round_responders = set()
+        self._previous_responders = None
 
         # The amount of time in msec before the timer times out
-        self._TIMEOUT_MSEC = 1000
+        self._TIMEOUT_MSEC = self.MIN_BROADCAST_MSEC
 
         self._timer = QTimer()
+        self._timer.setSingleShot(True)
         self._timer.timeout.connect(self.do_broadcast)
-        self._timer.start(self._TIMEOUT_MSEC)
-        
+
+        self._announce_sock = QUdpSocket()
+        self._announce_sock.readyRead.connect(self._read_pending_datagrams)
+        if not self._announce_sock.bind(QHostAddress(QHostAddress.AnyIPv4), self.ANNOUNCE_PORT,
+                                        QUdpSocket.ShareAddress | QUdpSocket.ReuseAddressHint):
+            logging.error(f'Could not bind announcement socket to port {self.ANNOUNCE_PORT}')
+
+        self._interface_table = get_interface_table()
+        self._interface_table.interfaces_changed.connect(self._bind_interfaces)
+        self._bind_interfaces(self._interface_table.entries())
+
+        self._interface_timer = QTimer()
+        self._interface_timer.timeout.connect(self._interface_table.refresh)
+        self._interface_timer.start(self.INTERFACE_REFRESH_MSEC)
+
+        self.do_broadcast()
+
+    def _bind_interfaces(self, entries: List[InterfaceEntry]):
+        '''! Opens sockets on new interfaces and closes sockets on
+        interfaces that went away.
+
+        @param entries The current list of InterfaceEntry objects
+        '''
+        wanted = {entry.ip_address: entry for entry in entries}
+
+        for ip in list(self._sockets.keys()):
+            sock, broadcast_address = self._sockets[ip]
+            if ip not in wanted or wanted[ip].broadcast_address != broadcast_address.toString():
+                sock.close()
+                self._sockets.pop(ip)
+
+        for ip, entry in wanted.items():
+            if ip in self._sockets:
+                continue
+
+            sock = QUdpSocket()
+            sock.readyRead.connect(self._read_pending_datagrams)
+            if not sock.bind(QHostAddress(ip), self._port):
+                logging.error(f'Could not bind discovery socket to {ip}:{self._port}')
+                continue
+
+            logging.debug(f'Discovery bound to {entry.name} ({ip}), broadcast {entry.broadcast_address}')
+            self._sockets[ip] = (sock, QHostAddress(entry.broadcast_address))
+
+        self.reset_broadcast_interval()
 
     def do_broadcast(self):
-        '''! Sends a broadcast packet on the local network.
+        '''! Sends a broadcast packet on every local network.
 
-        @brief Writes a UDP broadcast on the local network and checks to see if there are
-        any responses to it. If there is a response from another device, it emits the
-        device_response signal with the message contents.
+        @brief Writes a UDP broadcast on each interface. The sockets are
+        non-blocking, so every interface is broadcast on concurrently.
+        Responses are handled by _read_pending_datagrams(). The next
+        broadcast is scheduled with an interval that depends on whether
+        the set of responding devices changed since the last round.
         '''
-        msg = Message(MessageCode.DISCOVER, "DISCOVER")
+        if self._round_responders == self._previous_responders:
+            self._TIMEOUT_MSEC = min(self._TIMEOUT_MSEC * 2, self.MAX_BROADCAST_MSEC)
+        else:
+            self._TIMEOUT_MSEC = self.MIN_BROADCAST_MSEC
 
-        self._sock.writeDatagram(QByteArray(msg.to_bytes()), self._broadcast_address, self._port)
-        while self._sock.hasPendingDatagrams():
-            msg_tuple = self._sock.readDatagram(MESSAGE_BYTES)
+        self._previous_responders = self._round_responders
+        self._round_responders = set()
 
-            binary_contents = msg_tuple[0]
-            sender_ip_addr = msg_tuple[1].toString()
-            sender_port = msg_tuple[2]
+        msg = QByteArray(Message(MessageCode.DISCOVER, "DISCOVER").to_bytes())
 
-            # If the sender's IP address is not our local address
-            if sender_ip_addr != self._bind_address.toString():
-                self.device_response.emit(msg_tuple)
+        for sock, broadcast_address in self._sockets.values():
+            sock.writeDatagram(msg, broadcast_address, self._port)
 
         # Restart the timer to infinitely do broadcast messages
         self._timer.start(self._TIMEOUT_MSEC)
 
+    def _read_pending_datagrams(self):
+        '''! Drains every pending datagram from the socket that became
+        readable.
+
+        @brief If a datagram is from another device, it emits the
+        device_response signal with the message contents. A response from
+        a device that was not seen in the previous round snaps the
+        broadcast interval back to the minimum.
+        '''
+        sock: QUdpSocket = self.sender()
+
+        while sock.hasPendingDatagrams():
+            msg_tuple = sock.readDatagram(MESSAGE_BYTES)
+
+            sender_ip_addr = msg_tuple[1].toString()
+
+            # Skip our own broadcasts
+            if sender_ip_addr in self._sockets:
+                continue
+
+            self._round_responders.add(sender_ip_addr)
+            if not self._previous_responders or sender_ip_addr not in self._previous_responders:
+                self.reset_broadcast_interval()
+
+            self.device_response.emit(msg_tuple)
+
+    def reset_broadcast_interval(self, *args):
+        '''! Returns to fast broadcasting after a topology change.
+
+        @brief Can be connected to any signal that indicates a device
+        was added or removed.
+        '''
+        if self._TIMEOUT_MSEC == self.MIN_BROADCAST_MSEC and self._timer.isActive():
+            return
+
+        self._TIMEOUT_MSEC = self.MIN_BROADCAST_MSEC
+        self._timer.start(self._TIMEOUT_MSEC)
+
     def cleanup(self):
         '''! This thread cleans up the worker object.
-        @brief Stops the timer and closes the socket.
+        @brief Stops the timers and closes the sockets.
         '''
         self._timer.stop()
+        self._interface_timer.stop()
+        self._announce_sock.close()
+
+        for sock, _ in self._sockets.values():
+            sock.close()
+
+        self._sockets.clear()
+
+class SubnetSweepWorker(QObject):
+    '''! Worker object that discovers devices by sending unicast DISCOVER
+    datagrams to every host address in one or more CIDR ranges.
+
+    @brief Broadcasts do not cross routed segments and are filtered by some
+    managed switches, so this worker walks the configured ranges at a fixed
+    rate. A QTimer sends a small batch of datagrams on every tick so the
+    event loop is never blocked. Responses are read on readyRead and
+    emitted through device_response in the same format as BroadcastWorker,
+    so both feed the same discovery pipeline.
+    '''
+    # This signal is emitted when a UDP response is received
+    device_response = pyqtSignal(object)
+
+    ## Emitted when every address in the ranges has been sent a DISCOVER
+    sweep_finished = pyqtSignal()
+
+    ## Environment variable holding a comma separated list of CIDR ranges
+    CIDRS_ENV_VAR = 'CLOUDPLUG_SWEEP_CIDRS'
+
+    ## Environment variable holding the sweep rate in datagrams per second
+    RATE_ENV_VAR = 'CLOUDPLUG_SWEEP_RATE'
+
+    ## Environment variable holding the delay between sweeps in seconds
+    INTERVAL_ENV_VAR = 'CLOUDPLUG_SWEEP_INTERVAL'
+
+    ## Default sweep rate in datagrams per second
+    DEFAULT_RATE = 500
+
+    ## Default delay between the end of a sweep and the next one
+    DEFAULT_INTERVAL_SEC = 60
+
+    ## Interval between batches of datagrams
+    TICK_MSEC = 10
+
+    def __init__(self, cidrs: List[str] = None, rate: int = None, interval_sec: float = None, parent=None):
+        '''! Initializes the sweep worker. Arguments that are not given
+        are read from the environment.
+
+        @param cidrs List of CIDR ranges to sweep, such as "10.1.4.0/22"
+        @param rate Number of DISCOVER datagrams sent per second
+        @param interval_sec Seconds to wait between sweeps
+        '''
+        super().__init__(parent)
+
+        if cidrs is None:
+            cidrs = [c.strip() for c in os.getenv(self.CIDRS_ENV_VAR, '').split(',') if c.strip()]
+
+        if rate is None:
+            rate = self._read_env_number(self.RATE_ENV_VAR, int, self.DEFAULT_RATE)
+
+        if interval_sec is None:
+            interval_sec = self._read_env_number(self.INTERVAL_ENV_VAR, float, self.DEFAULT_INTERVAL_SEC)
+
+        ## Ranges to sweep. A malformed range is skipped so that a typo in
+        # the .env file does not keep the application from starting.
+        self.networks = []
+        for cidr in cidrs:
+            try:
+                self.networks.append(ipaddress.IPv4Network(cidr, strict=False))
+            except ValueError as ex:
+                logging.error(f'Skipping sweep range {cidr!r} from {self.CIDRS_ENV_VAR}: {ex}')
+        self.rate = max(1, rate)
+        self.interval_sec = interval_sec
+
+        # Fractional datagrams carried between ticks so the rate is exact
+        self._send_budget = 0.0
+        self._hosts = iter(())
+
+    @staticmethod
+    def _read_env_number(env_var: str, parse, default):
+        '''! Reads a positive number from the environment. A malformed or
+        non-positive value is logged and the default is used instead.
+
+        @param env_var Name of the environment variable
+        @param parse int or float
+        @param default Value used when the variable is not set or invalid
+        @return The parsed value or the default
+        '''
+        value = os.getenv(env_var)
+        if value is None or not value.strip():
+            return default
+
+        try:
+            number = parse(value)
+        except ValueError as ex:
+            logging.error(f'Ignoring {env_var}={value!r}, using {default}: {ex}')
+            return default
+
+        if not number > 0:
+            logging.error(f'Ignoring {env_var}={value!r}, using {default}: the value must be positive')
+            return default
+
+        return number
+
+    def is_enabled(self) -> bool:
+        '''! Checks if any range was configured.'''
+        return len(self.networks) > 0
+
+    def on_thread_start(self):
+        '''! Called when the thread starts.
+
+        @brief Creates the UDP socket, bound to any local address on an
+        ephemeral port, and starts the first sweep.
+        '''
+        self._sock = QUdpSocket()
+        self._sock.readyRead.connect(self._read_pending_datagrams)
+        self._sock.bind(QHostAddress(QHostAddress.AnyIPv4), 0)
+
+        self._discover_bytes = QByteArray(Message(MessageCode.DISCOVER, "DISCOVER").to_bytes())
+
+        self._tick_timer = QTimer()
+        self._tick_timer.timeout.connect(self._send_batch)
+
+        self._interval_timer = QTimer()
+        self._interval_timer.setSingleShot(True)
+        self._interval_timer.timeout.connect(self.start_sweep)
+
+        self.start_sweep()
+
+    def start_sweep(self):
+        '''! Starts sending DISCOVER datagrams to every host in the ranges.'''
+        local_addresses = set(entry.ip_address for entry in get_interface_table().entries())
+
+        self._hosts = (
+            str(host)
+            for network in self.networks
+            for host in network.hosts()
+            if str(host) not in local_addresses
+        )
+        self._send_budget = 0.0
+        self._tick_timer.start(self.TICK_MSEC)
+
+    def _send_batch(self):
+        '''! Sends the datagrams allowed by the rate for one timer tick.'''
+        self._send_budget += self.rate * self.TICK_MSEC / 1000.0
+
+        while self._send_budget >= 1.0:
+            host = next(self._hosts, None)
+
+            if host is None:
+                self._tick_timer.stop()
+                self.sweep_finished.emit()
+                self._interval_timer.start(int(self.interval_sec * 1000))
+                return
+
+            self._sock.writeDatagram(self._discover_bytes, QHostAddress(host), BroadcastWorker.DISCOVERY_PORT)
+            self._send_budget -= 1.0
+
+    def _read_pending_datagrams(self):
+        '''! Drains every pending response and emits it.'''
+        while self._sock.hasPendingDatagrams():
+            self.device_response.emit(self._sock.readDatagram(MESSAGE_BYTES))
+
+    def cleanup(self):
+        '''! Stops the timers and closes the socket.'''
+        self._tick_timer.stop()
+        self._interval_timer.stop()
         self._sock.close()
 
 class BroadcastThread(QThread):
@@ -165,7 +441,7 @@ class BroadcastThread(QThread):
                 # print(f'{local_ip_str = }\t{sender_ip_addr = }')
 
                 if sender_ip_addr == local_ip_str:
-                    break
+                    continue
                 
                 # Print response to the console
                 # print(f'BroadcastThread:: {binary_contents}\t{sender_ip_addr}\t{sender_port}')
@@ -198,10 +474,10 @@ class TcpServerThread(QThread):
     # Emit messages to the main windows log
     log_signal = pyqtSignal(object)
 
-    diagnostic_init_a0_signal = pyqtSignal(object)
-    diagnostic_init_a2_signal = pyqtSignal(object)
-    real_time_refresh_signal = pyqtSignal(object)
-    remote_io_error_signal = pyqtSignal(object)
+    diagnostic_init_a0_signal = pyqtSignal(str, object)
+    diagnostic_init_a2_signal = pyqtSignal(str, object)
+    real_time_refresh_signal = pyqtSignal(str, object)
+    remote_io_error_signal = pyqtSignal(str, object)
 
     ## Starts an infinite loop to handle TCP connections and message processing.
     # @param self The self object pointer
@@ -221,10 +497,10 @@ class TcpServerThread(QThread):
         self.tcp_server.update_ui_signal.connect(self.emit_update_ui_signal)
         self.tcp_server.log_signal.connect(self.emit_log_signal)
 
-        self.tcp_server.diagnostic_init_a0_signal.connect(lambda cmd: self.diagnostic_init_a0_signal.emit(cmd))
-        self.tcp_server.diagnostic_init_a2_signal.connect(lambda cmd: self.diagnostic_init_a2_signal.emit(cmd))
-        self.tcp_server.real_time_refresh_signal.connect(lambda cmd: self.real_time_refresh_signal.emit(cmd))
-        self.tcp_server.remote_io_error_signal.connect(lambda cmd: self.remote_io_error_signal.emit(cmd))
+        self.tcp_server.diagnostic_init_a0_signal.connect(lambda ip, cmd: self.diagnostic_init_a0_signal.emit(ip, cmd))
+        self.tcp_server.diagnostic_init_a2_signal.connect(lambda ip, cmd: self.diagnostic_init_a2_signal.emit(ip, cmd))
+        self.tcp_server.real_time_refresh_signal.connect(lambda ip, cmd: self.real_time_refresh_signal.emit(ip, cmd))
+        self.tcp_server.remote_io_error_signal.connect(lambda ip, cmd: self.remote_io_error_signal.emit(ip, cmd))
 
         self.tcp_server.open_session()
 
@@ -1,88 +1,410 @@
 ##
 # @file sql_connection.py
 # @brief Wrapper class for the MySQL connector library
-# 
+#
 # @section file_author Author
 # - Created on 08/19/2021 by Connor DeCamp
+# @section mod_history Modification History
+# - Modified on 10/19/2026
 #
 # Simple class that holds the mysql.connector object
 # to access the a MySQL database. Code taken and modified
 # from:
 # https://thepythongeek.medium.com/organizing-db-connections-in-data-ingestion-python-projects-765cca7e809f
+#
+# Connections are handed out by a process-wide SQLConnectionPool so
+# that opening a persona does not pay for a TCP and authentication
+# handshake every time.
+#
+# Statements that run often are declared once as a Statement and run
+# with SQLConnection.query() or SQLConnection.execute(). They are
+# prepared on the server the first time they run on a connection, and
+# the prepared statement is reused for as long as the pooled connection
+# stays open, so later runs skip parsing and planning.
 ##
 
 ##
 # Standard Imports
 ##
 import os
+import time
 import logging
+import threading
+from collections import deque, namedtuple, OrderedDict
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Tuple
 
 ##
 # Third Party Library Imports
 ##
-import mysql.connector
 from dotenv import load_dotenv
 
 
+##
+# Named tuple for a parameterized SQL statement that is prepared on the
+# server. Parameters are written as %s.
+##
+Statement = namedtuple("Statement", "name, sql")
+
+@lru_cache(maxsize=None)
+def get_database_settings() -> dict:
+    '''! Reads the database settings from the .env file.
+
+    @brief The .env file located in the project directory is only parsed
+    the first time this is called.
+
+    @return Dictionary of database login, pool and storage backend settings
+    '''
+    env_path = '../.env'
+    load_dotenv(dotenv_path=env_path)
+
+    return {
+        'host': os.getenv('DB_HOST'),
+        'user': os.getenv('DB_USER'),
+        'password': os.getenv('DB_PASS'),
+        'database': os.getenv('DB_NAME'),
+        'pool_size': int(os.getenv('DB_POOL_SIZE', SQLConnectionPool.DEFAULT_SIZE)),
+        'idle_timeout_sec': float(os.getenv('DB_POOL_IDLE_SEC', SQLConnectionPool.DEFAULT_IDLE_TIMEOUT_SEC)),
+        'backend': os.getenv('STORAGE_BACKEND', 'mysql').lower(),
+        'sqlite_path': os.getenv('SQLITE_PATH', '../sfp_info.sqlite3'),
+    }
+
+def open_mysql_connection():
+    '''! Opens a new connection to the database in the .env file.
+
+    @return A mysql.connector connection object
+    '''
+    # Imported on first use, it is slow to import and only needed
+    # once the database is opened
+    import mysql.connector
+
+    settings = get_database_settings()
+
+    try:
+        #print(f'{db_host = }\t{db_user = }\t{db_pass = }')
+        TIMEOUT_SEC = 5
+        logging.debug(f"Trying to connect to database with timeout: {TIMEOUT_SEC} seconds")
+        connection = mysql.connector.connect(
+            host=settings['host'],
+            user=settings['user'],
+            password=settings['password'],
+            database=settings['database'],
+            connection_timeout=TIMEOUT_SEC,
+            autocommit=True
+        )
+        logging.debug(f"Connected to db name: {settings['database']}")
+
+    except Exception as ex:
+        logging.error(f'Error connecting to SFP database: {ex}')
+        raise Exception(ex)
+
+    return connection
+
+
 class SQLConnection:
     '''! SQL connection wrapper class.
     '''
 
-    def __init__(self):
-        '''@brief Initializes the SQLConnection object with variables from a .env file.
+    ## Most prepared statements kept open on a connection
+    PREPARED_STATEMENT_LIMIT = 64
 
-        ! Reads the .env file located in the project directory to identify database
-        login information.
-        '''
+    def __init__(self, connection=None, pool=None, prepared_statements=None):
+        '''@brief Initializes the SQLConnection object.
 
-        env_path = '../.env'
-        load_dotenv(dotenv_path=env_path)
+        ! If no connection is given, a new one is opened with the login
+        information from the .env file.
 
-        self.connection = None
+        @param connection An already open mysql.connector connection
+        @param pool The SQLConnectionPool the connection belongs to, if any
+        @param prepared_statements The prepared cursors of the connection,
+                                   kept by the pool between checkouts
+        '''
+        self.connection = connection
         self.cursor = None
-        
-        self.get_connection()
+        self._pool = pool
+        self._prepared_statements = prepared_statements if prepared_statements is not None \
+                                    else OrderedDict()
+
+        if self.connection is None:
+            self.get_connection()
 
     def get_connection(self):
-        '''! Gets a connection object to the database 
+        '''! Gets a connection object to the database
         @brief Uses a .env file to connect to a database
         '''
-        
-        db_host = os.getenv('DB_HOST')
-        db_user = os.getenv('DB_USER')
-        db_pass = os.getenv('DB_PASS')
-        db_name = os.getenv('DB_NAME')
-        
         try:
-            #print(f'{db_host = }\t{db_user = }\t{db_pass = }')
-            TIMEOUT_SEC = 5
-            logging.debug(f"Trying to connect to database with timeout: {TIMEOUT_SEC} seconds")
-            self.connection = mysql.connector.connect(
-                host=db_host,
-                user=db_user,
-                password=db_pass,
-                database=db_name,
-                connection_timeout=TIMEOUT_SEC,
-                autocommit=True
-            )
-            logging.debug(f'Connected to db name: {db_name}')
-
+            self.connection = open_mysql_connection()
             self.cursor = self.connection.cursor()
-
-        except Exception as ex:
-            logging.error(f'Error connecting to SFP database: {ex}')
+        except Exception:
             self.connection = None
             self.cursor = None
-            raise Exception(ex)
+            raise
 
     def get_cursor(self):
         return self.connection.cursor()
 
+    def _prepared_cursor(self, statement: Statement) -> Tuple[str, object]:
+        '''! Gets the prepared cursor of a statement, preparing it on
+        first use. The least recently used statement is closed when the
+        limit is reached.
+
+        @return (sql, cursor). The cursor only reuses its prepared
+                statement when it runs this exact sql object, an equal
+                string is prepared again, so always run the returned sql.
+        '''
+        prepared = self._prepared_statements.get(statement.sql)
+
+        if prepared is not None:
+            self._prepared_statements.move_to_end(statement.sql)
+            return prepared
+
+        logging.debug(f'Preparing statement {statement.name}')
+        prepared = (statement.sql, self.connection.cursor(prepared=True))
+        self._prepared_statements[statement.sql] = prepared
+
+        if len(self._prepared_statements) > self.PREPARED_STATEMENT_LIMIT:
+            _, (_, oldest) = self._prepared_statements.popitem(last=False)
+            try:
+                oldest.close()
+            except Exception:
+                pass
+
+        return prepared
+
+    def execute(self, statement: Statement, params: tuple = ()):
+        '''! Runs a statement that does not return rows.
+
+        @param statement The Statement to run
+        @param params The values of the %s parameters
+        @return The cursor, for its rowcount and lastrowid
+        '''
+        sql, cursor = self._prepared_cursor(statement)
+        cursor.execute(sql, params)
+        return cursor
+
+    def query(self, statement: Statement, params: tuple = ()) -> list:
+        '''! Runs a statement and reads every row it returns. The rows
+        are read right away, so the cursor can run another statement.
+
+        @param statement The Statement to run
+        @param params The values of the %s parameters
+        @return List of row tuples
+        '''
+        sql, cursor = self._prepared_cursor(statement)
+        cursor.execute(sql, params)
+        return cursor.fetchall()
+
     def close(self):
-        if self.connection is not None:
-            self.connection.close()
+        '''! Closes the connection, or gives it back to the pool it
+        came from.
+        '''
+        if self.connection is None:
+            return
+
+        connection = self.connection
+        self.connection = None
+        self.cursor = None
 
+        if self._pool is not None:
+            self._pool.release(connection)
+        else:
+            connection.close()
             logging.debug("Closed connection to database")
 
     def __del__(self):
-        self.close()
\ No newline at end of file
+        self.close()
+
+
+class SQLConnectionPool:
+    '''! Thread-safe pool of open database connections.
+
+    @brief At most `size` connections are open at a time. Connections are
+    checked for health when they are checked out, and connections that sat
+    idle longer than `idle_timeout_sec` are closed.
+
+    Usage:
+        with get_connection_pool().connection() as db:
+            cursor = db.get_cursor()
+    '''
+
+    ## Default maximum number of open connections
+    DEFAULT_SIZE = 4
+
+    ## Default seconds a connection may sit idle before it is closed
+    DEFAULT_IDLE_TIMEOUT_SEC = 300.0
+
+    ## Default seconds to wait for a free connection
+    DEFAULT_CHECKOUT_TIMEOUT_SEC = 10.0
+
+    ## Connections returned more recently than this are not pinged on checkout
+    HEALTH_CHECK_IDLE_SEC = 1.0
+
+    def __init__(self, size: int = DEFAULT_SIZE, idle_timeout_sec: float = DEFAULT_IDLE_TIMEOUT_SEC,
+                 connect_function=open_mysql_connection, clock=time.monotonic):
+        '''! Initializes an empty pool. Connections are opened on demand.
+
+        @param size Maximum number of open connections
+        @param idle_timeout_sec Seconds an idle connection is kept open
+        @param connect_function Function that opens a new raw connection
+        @param clock Function returning the current time in seconds
+        '''
+        self.size = max(1, size)
+        self.idle_timeout_sec = idle_timeout_sec
+
+        self._connect = connect_function
+        self._clock = clock
+
+        # Idle connections as (raw connection, time it was released).
+        # The right end holds the most recently used connection.
+        self._idle = deque()
+        self._checked_out = 0
+        self._condition = threading.Condition()
+
+        # Prepared cursors of each open connection, keyed by id()
+        self._prepared_statements = {}
+
+    def acquire(self, timeout: float = DEFAULT_CHECKOUT_TIMEOUT_SEC) -> SQLConnection:
+        '''! Checks out a connection from the pool.
+
+        @param timeout Seconds to wait if every connection is in use
+        @return An SQLConnection that goes back to the pool when closed
+        '''
+        deadline = self._clock() + timeout
+
+        with self._condition:
+            while True:
+                self._evict_idle()
+
+                while self._idle:
+                    raw_connection, released_at = self._idle.pop()
+
+                    if self._is_healthy(raw_connection, released_at):
+                        self._checked_out += 1
+                        return self._wrap(raw_connection)
+
+                    self._discard(raw_connection)
+
+                if self._checked_out < self.size:
+                    # Reserve a slot, the connection is opened below
+                    # without holding the lock
+                    self._checked_out += 1
+                    break
+
+                remaining = deadline - self._clock()
+                if remaining <= 0:
+                    raise Exception(f'Timed out waiting for one of {self.size} database connections')
+
+                self._condition.wait(remaining)
+
+        try:
+            raw_connection = self._connect()
+        except Exception:
+            with self._condition:
+                self._checked_out -= 1
+                self._condition.notify()
+            raise
+
+        with self._condition:
+            return self._wrap(raw_connection)
+
+    def _wrap(self, raw_connection) -> SQLConnection:
+        '''! Wraps a checked out connection together with the statements
+        already prepared on it. Must be called with the lock held.
+        '''
+        prepared_statements = self._prepared_statements.setdefault(id(raw_connection), OrderedDict())
+        return SQLConnection(raw_connection, self, prepared_statements)
+
+    def release(self, raw_connection) -> None:
+        '''! Gives a connection back to the pool.
+
+        @param raw_connection The mysql.connector connection to return
+        '''
+        # A result set that was not read to the end would break the
+        # next query on this connection
+        try:
+            if getattr(raw_connection, 'unread_result', False):
+                raw_connection.consume_results()
+        except Exception:
+            pass
+
+        with self._condition:
+            self._checked_out -= 1
+            self._idle.append((raw_connection, self._clock()))
+            self._condition.notify()
+
+    @contextmanager
+    def connection(self, timeout: float = DEFAULT_CHECKOUT_TIMEOUT_SEC):
+        '''! Context manager that checks a connection out and always
+        gives it back.
+
+        @param timeout Seconds to wait if every connection is in use
+        '''
+        sql_connection = self.acquire(timeout)
+        try:
+            yield sql_connection
+        finally:
+            sql_connection.close()
+
+    def close_all(self) -> None:
+        '''! Closes every idle connection. Connections that are checked
+        out are closed when they are released and found unhealthy later.
+        '''
+        with self._condition:
+            while self._idle:
+                raw_connection, _ = self._idle.pop()
+                self._discard(raw_connection)
+
+    def idle_count(self) -> int:
+        '''! Gets the number of idle connections in the pool.'''
+        with self._condition:
+            return len(self._idle)
+
+    def _evict_idle(self) -> None:
+        '''! Closes connections that were idle for too long. The oldest
+        connections are at the left end of the deque.
+        '''
+        now = self._clock()
+        while self._idle and now - self._idle[0][1] > self.idle_timeout_sec:
+            raw_connection, _ = self._idle.popleft()
+            self._discard(raw_connection)
+
+    def _is_healthy(self, raw_connection, released_at: float) -> bool:
+        '''! Checks that a connection can still be used.'''
+        if self._clock() - released_at < self.HEALTH_CHECK_IDLE_SEC:
+            return True
+
+        try:
+            raw_connection.ping(reconnect=False)
+            return True
+        except Exception as ex:
+            logging.debug(f'Dropping unhealthy database connection: {ex}')
+            return False
+
+    def _discard(self, raw_connection) -> None:
+        '''! Closes a connection, ignoring errors from dead connections.
+        Its prepared statements are freed by the server with it.
+        '''
+        self._prepared_statements.pop(id(raw_connection), None)
+
+        try:
+            raw_connection.close()
+        except Exception:
+            pass
+
+## The process-wide connection pool
+_connection_pool = None
+_connection_pool_lock = threading.Lock()
+
+def get_connection_pool() -> SQLConnectionPool:
+    '''! Gets the process-wide connection pool, creating it on first use
+    with the DB_POOL_SIZE and DB_POOL_IDLE_SEC settings.
+    '''
+    global _connection_pool
+
+    with _connection_pool_lock:
+        if _connection_pool is None:
+            settings = get_database_settings()
+            _connection_pool = SQLConnectionPool(settings['pool_size'], settings['idle_timeout_sec'])
+
+    return _connection_pool
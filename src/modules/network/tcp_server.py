@@ -7,7 +7,7 @@
 #
 ##
 
-from typing import Union
+from typing import List, Union
 import struct, time
 
 from PyQt5.QtCore import QByteArray, QObject, pyqtSignal, pyqtSlot
@@ -25,18 +25,25 @@ class TCPServer(QObject):
     # can handle updating things
     update_ui_signal = pyqtSignal(MessageCode)
 
-    diagnostic_init_a0_signal = pyqtSignal(ReadRegisterMessage)
-    diagnostic_init_a2_signal = pyqtSignal(ReadRegisterMessage)
-    real_time_refresh_signal = pyqtSignal(ReadRegisterMessage)
+    # Diagnostic replies are sent with the IP address of the docking
+    # station, so several docking stations can be monitored at once
+    diagnostic_init_a0_signal = pyqtSignal(str, ReadRegisterMessage)
+    diagnostic_init_a2_signal = pyqtSignal(str, ReadRegisterMessage)
+    real_time_refresh_signal = pyqtSignal(str, ReadRegisterMessage)
 
-    remote_io_error_signal = pyqtSignal(Message)
+    remote_io_error_signal = pyqtSignal(str, Message)
 
     # Emit messages to the main windows log
     log_signal = pyqtSignal(object)
 
+    ## Port the server listens on for device connections
+    PORT = 20100
+
     def __init__(self, parent=None):
         super(TCPServer, self).__init__(parent)
-        self.server = None
+
+        # Maps local IP address -> QTcpServer listening on that address
+        self.servers = {}
         self.connected_dock_dict = {}
         self.connected_cloudplug_dict = {}
 
@@ -44,26 +51,69 @@ class TCPServer(QObject):
 
 
     def open_session(self):
-                
-        self.server = QTcpServer()
-        self.HOST = get_LAN_ip_address()
-        self.PORT = 20100
+        '''! Starts listening on every usable network interface.
+        '''
+        interface_table = get_interface_table()
+        interface_table.interfaces_changed.connect(self._update_listeners)
+        self._update_listeners(interface_table.entries())
 
-        if not self.server.listen(QHostAddress(self.HOST), self.PORT):
-            print(f"Server failed to listen on {self.HOST}:{self.PORT}")
-            return
+    def _update_listeners(self, entries: List[InterfaceEntry]):
+        '''! Listens on new interfaces and stops listening on interfaces
+        that went away.
+
+        @param entries The current list of InterfaceEntry objects
+        '''
+        wanted = set(entry.ip_address for entry in entries)
+
+        for host in list(self.servers.keys()):
+            if host not in wanted:
+                self.servers.pop(host).close()
+                self.log_signal.emit(f'TCP Server stopped listening on {host}:{self.PORT}')
+
+        for host in wanted:
+            if host in self.servers:
+                continue
+
+            server = QTcpServer()
+            if not server.listen(QHostAddress(host), self.PORT):
+                print(f"Server failed to listen on {host}:{self.PORT}")
+                continue
 
-        self.log_signal.emit(f'TCP Server listening on {self.HOST}:{self.PORT}')
+            if self.expected_clients > 0:
+                server.newConnection.connect(self.handle_new_connection)
+
+            self.servers[host] = server
+            self.log_signal.emit(f'TCP Server listening on {host}:{self.PORT}')
+
+    def _has_pending_connections(self) -> bool:
+        '''! Checks every listening server for pending connections.'''
+        return any(server.hasPendingConnections() for server in self.servers.values())
+
+    def _set_new_connection_handler(self, enabled: bool):
+        '''! Connects or disconnects the new connection handler on every
+        listening server.
+
+        @param enabled True to connect the handler, False to disconnect it
+        '''
+        for server in self.servers.values():
+            if enabled:
+                server.newConnection.connect(self.handle_new_connection)
+            else:
+                try:
+                    server.newConnection.disconnect(self.handle_new_connection)
+                except TypeError:
+                    # The handler was not connected to this server
+                    pass
 
     def init_dock_connection(self, sender_ip):
         self.connected_dock_dict[sender_ip] = None
 
-        if self.server.hasPendingConnections():
+        if self._has_pending_connections():
             print("Trying to handle new dock connection")
             self.handle_new_connection()
         else:
             print("No pending connection, setting up to handle new connection")
-            self.server.newConnection.connect(self.handle_new_connection)
+            self._set_new_connection_handler(True)
             self.expected_clients += 1
 
             attempts = 10
@@ -76,12 +126,12 @@ class TCPServer(QObject):
     def init_cloudplug_connection(self, sender_ip):
         self.connected_cloudplug_dict[sender_ip] = None
 
-        if self.server.hasPendingConnections():
+        if self._has_pending_connections():
             print("Trying to handle new cloudplug connection")
             self.handle_new_connection()
         else:
             print("No pending connection, setting up to handle new connection")
-            self.server.newConnection.connect(self.handle_new_connection)
+            self._set_new_connection_handler(True)
             self.expected_clients += 1
 
             attempts = 10
@@ -94,9 +144,17 @@ class TCPServer(QObject):
 
     def handle_new_connection(self):
         '''
-        Handles a pending connection in the connection queue for the TCP Server.
+        Handles the pending connections in the connection queues of every
+        listening TCP Server.
+        '''
+        for server in list(self.servers.values()):
+            while server.hasPendingConnections():
+                self._accept_connection(server.nextPendingConnection())
+
+    def _accept_connection(self, client_connection: QTcpSocket):
+        '''
+        Registers a single accepted client connection.
         '''
-        client_connection = self.server.nextPendingConnection()
         client_ip = client_connection.peerAddress().toString()
 
         #print(f'{client_ip = }')
@@ -116,7 +174,7 @@ class TCPServer(QObject):
             self.expected_clients -= 1
 
             if self.expected_clients == 0:
-                self.server.newConnection.disconnect(self.handle_new_connection)
+                self._set_new_connection_handler(False)
 
        
 
@@ -215,16 +273,16 @@ class TCPServer(QObject):
             self.update_ui_signal.emit(MessageCode.CLONE_SFP_MEMORY_SUCCESS)
         elif command.code == MessageCode.DIAGNOSTIC_INIT_A0_ACK:
             self.log_signal.emit(f'DOCKING STATION at {ip}:{port} successfully read vendor name, PN, diagnostic type')
-            self.diagnostic_init_a0_signal.emit(command)
+            self.diagnostic_init_a0_signal.emit(ip, command)
         elif command.code == MessageCode.DIAGNOSTIC_INIT_A2_ACK:
             self.log_signal.emit(f'DOCKING STATION at {ip}:{port} successfully read diagnostic information')
-            self.diagnostic_init_a2_signal.emit(command)
+            self.diagnostic_init_a2_signal.emit(ip, command)
         elif command.code == MessageCode.REAL_TIME_REFRESH_ACK:
             self.log_signal.emit(f'DOCKING STATION at {ip}:{port} successfully refreshed diagnostic info')
-            self.real_time_refresh_signal.emit(command)
+            self.real_time_refresh_signal.emit(ip, command)
         elif command.code == MessageCode.I2C_ERROR:
             self.log_signal.emit(f'ERROR from DOCKING STATION at {ip}:{port} - said: {command.data_str}')
-            self.remote_io_error_signal.emit(command)
+            self.remote_io_error_signal.emit(ip, command)
 
     def handle_send_command_signal(self, ip_msg_tuple):
         ip = ip_msg_tuple[0]
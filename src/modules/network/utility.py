@@ -1,4 +1,4 @@
-## 
+##
 # @file utility.py
 # @brief Provides simple network utility functions.
 #
@@ -8,6 +8,12 @@
 # - Modified on 10/21/21 by Connor DeCamp
 ##
 
+import os
+import threading
+from collections import namedtuple
+from typing import List, Optional
+
+from PyQt5.QtCore import QObject, pyqtSignal
 from PyQt5.QtNetwork import QNetworkInterface, QAbstractSocket
 from enum import Enum
 
@@ -15,18 +21,152 @@ class DeviceType(Enum):
     DOCKING_STATION = 0
     CLOUDPLUG = 1
 
+##
+# Named tuple for a single IPv4 address entry on a host
+# network interface
+##
+InterfaceEntry = namedtuple(
+    "InterfaceEntry",
+    "name, ip_address, broadcast_address, prefix_length"
+)
+
+## Environment variable holding a comma separated list of interface
+# names or IPv4 addresses to use. If it is empty, every eligible
+# interface is used.
+INTERFACES_ENV_VAR = 'CLOUDPLUG_INTERFACES'
+
+def _get_configured_interfaces() -> List[str]:
+    '''! Reads the list of interfaces the user wants to use.
+
+    @return A list of interface names and/or IPv4 addresses. An empty
+    list means every eligible interface should be used.
+    '''
+    configured = os.getenv(INTERFACES_ENV_VAR, '')
+    return [name.strip() for name in configured.split(',') if name.strip()]
+
+def _read_interface_entries() -> List[InterfaceEntry]:
+    '''! Queries the operating system for the IPv4 interfaces that can
+    be used for device discovery.
+
+    An interface is eligible if it is up, running, can broadcast and
+    is not a loopback interface. If interfaces are configured with
+    the CLOUDPLUG_INTERFACES environment variable, only those are used.
+
+    @return A list of InterfaceEntry objects
+    '''
+    configured = _get_configured_interfaces()
+    required_flags = QNetworkInterface.IsUp | QNetworkInterface.IsRunning | \
+                     QNetworkInterface.CanBroadcast
+
+    entries = []
+    for interface in QNetworkInterface.allInterfaces():
+        flags = interface.flags()
+
+        if flags & QNetworkInterface.IsLoopBack:
+            continue
+
+        if (flags & required_flags) != required_flags:
+            continue
+
+        for entry in interface.addressEntries():
+            ip = entry.ip()
+
+            if ip.protocol() != QAbstractSocket.IPv4Protocol or ip.isLoopback():
+                continue
+
+            ip_str = ip.toString()
+            if configured and interface.name() not in configured and ip_str not in configured:
+                continue
+
+            entries.append(InterfaceEntry(
+                interface.name(),
+                ip_str,
+                entry.broadcast().toString(),
+                entry.prefixLength()
+            ))
+
+    return entries
+
+class NetworkInterfaceTable(QObject):
+    '''! Cached table of the host's usable IPv4 interfaces.
+
+    @brief The operating system is only queried when refresh() is
+    called. Lookups use the cached entries. The interfaces_changed
+    signal is emitted with the new list of entries whenever a refresh
+    finds that interfaces were added, removed or readdressed.
+    '''
+
+    ## Emitted with the new list of InterfaceEntry objects
+    interfaces_changed = pyqtSignal(object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._lock = threading.Lock()
+        self._entries = None
+
+    def entries(self) -> List[InterfaceEntry]:
+        '''! Gets the cached interface entries, reading them on first use.
+
+        @return A list of InterfaceEntry objects
+        '''
+        with self._lock:
+            if self._entries is None:
+                self._entries = _read_interface_entries()
+            return list(self._entries)
+
+    def refresh(self) -> bool:
+        '''! Re-reads the interfaces from the operating system.
+
+        @return True if the interface table changed
+        '''
+        new_entries = _read_interface_entries()
+
+        with self._lock:
+            changed = new_entries != self._entries
+            self._entries = new_entries
+
+        if changed:
+            self.interfaces_changed.emit(list(new_entries))
+
+        return changed
+
+    def find(self, ip_address: str) -> Optional[InterfaceEntry]:
+        '''! Finds the entry for a local IP address.
+
+        @param ip_address The local IPv4 address as a string
+        @return The matching InterfaceEntry or None
+        '''
+        for entry in self.entries():
+            if entry.ip_address == ip_address:
+                return entry
+
+        return None
+
+## The process-wide interface table
+_interface_table = None
+_interface_table_lock = threading.Lock()
+
+def get_interface_table() -> NetworkInterfaceTable:
+    '''! Gets the process-wide network interface table.
+    '''
+    global _interface_table
+
+    with _interface_table_lock:
+        if _interface_table is None:
+            _interface_table = NetworkInterfaceTable()
+
+    return _interface_table
+
 def get_LAN_ip_address() -> str:
-    '''! This method retrieves the host machine's IP 
+    '''! This method retrieves the host machine's IP
     address on the local area network.
+
+    @return The address of the first usable interface or None
     '''
-    # Gets the list of all addresses on the host machine
-    ip_list = QNetworkInterface.allAddresses()
+    entries = get_interface_table().entries()
 
-    # For each address in the list, check if it's an IPv4
-    # address and not a loopback address
-    for address in ip_list:
-        if address.protocol() == QAbstractSocket.IPv4Protocol and not address.isLoopback():
-            return address.toString()
+    if entries:
+        return entries[0].ip_address
 
     return None
 
@@ -34,15 +174,9 @@ def get_LAN_ip_address() -> str:
 def get_LAN_broadcast_address(local_ip_address: str) -> str:
     '''! Gets the local area network broadcast IP address.
     '''
-    # Get all listings of network interfaces on the host machine
-    interface_list = QNetworkInterface.allInterfaces()
+    entry = get_interface_table().find(local_ip_address)
 
-    # For each entry in each interface, we want to see if the ip
-    # matches our local ip address. If it does, we return the
-    # broadcast address of that
-    for interface in interface_list:
-        for entry in interface.addressEntries():
-            if entry.ip().toString() == local_ip_address:
-                return entry.broadcast().toString()
+    if entry is not None:
+        return entry.broadcast_address
 
-    return None
\ No newline at end of file
+    return None
@@ -0,0 +1,100 @@
+##
+# @file test_database_worker.py
+# @brief Unit tests for running database jobs off the GUI thread.
+##
+
+import os
+import sys
+import time
+import threading
+import unittest
+
+# This is here to make the import work when ran from the main folder
+# in VSCode
+myPath = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, myPath + '/../')
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5.QtWidgets import QApplication
+
+from modules.core.database_worker import DatabaseWorker
+
+app = QApplication.instance() or QApplication([])
+
+class TestDatabaseWorker(unittest.TestCase):
+    '''! Defines the unit tests for the DatabaseWorker class.'''
+
+    def setUp(self):
+        self.worker = DatabaseWorker()
+
+    def tearDown(self):
+        self.worker.shutdown()
+
+    def _wait_for(self, condition):
+        deadline = time.monotonic() + 10
+        while not condition() and time.monotonic() < deadline:
+            app.processEvents()
+            time.sleep(0.001)
+
+        self.assertTrue(condition())
+
+    def test_result_is_delivered_on_the_gui_thread(self):
+        results = []
+
+        def job(value):
+            return value * 2, threading.current_thread()
+
+        def on_result(result):
+            results.append((result, threading.current_thread()))
+
+        future = self.worker.submit(job, 21, on_result=on_result)
+        self.assertEqual((42, future.result()[1]), future.result())
+
+        # Nothing is delivered until the event loop runs
+        self.assertEqual([], results)
+        self._wait_for(lambda: results)
+
+        (value, job_thread), callback_thread = results[0]
+        self.assertEqual(42, value)
+        self.assertIsNot(threading.main_thread(), job_thread)
+        self.assertIs(threading.main_thread(), callback_thread)
+
+    def test_errors(self):
+        def job():
+            raise ValueError('no database')
+
+        errors = []
+        self.worker.submit(job, on_error=errors.append)
+        self._wait_for(lambda: errors)
+        self.assertIsInstance(errors[0], ValueError)
+
+        # Without on_error the error is emitted instead
+        messages = []
+        self.worker.job_failed.connect(messages.append)
+        self.worker.submit(job)
+        self._wait_for(lambda: messages)
+        self.assertIn('no database', messages[0])
+
+    def test_shutdown_cancels_jobs_that_did_not_start(self):
+        worker = DatabaseWorker(threads=1)
+        started = threading.Event()
+        release = threading.Event()
+
+        def blocking_job():
+            started.set()
+            release.wait(10)
+            return 'done'
+
+        running = worker.submit(blocking_job)
+        started.wait(10)
+        waiting = worker.submit(lambda: 'never')
+
+        worker.shutdown()
+        release.set()
+
+        self.assertTrue(waiting.cancelled())
+        self.assertEqual('done', running.result(10))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+##
+# @file test_debug_log.py
+# @brief Unit tests for the batched debug log.
+##
+
+import os
+import sys
+import unittest
+
+# This is here to make the import work when ran from the main folder
+# in VSCode
+myPath = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, myPath + '/../')
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5.QtWidgets import QApplication, QPlainTextEdit
+
+from modules.core.debug_log import DebugLog
+
+app = QApplication.instance() or QApplication([])
+
+class TestDebugLog(unittest.TestCase):
+    '''! Defines the unit tests for the DebugLog class.'''
+
+    def setUp(self):
+        self.text_edit = QPlainTextEdit()
+        self.log = DebugLog(self.text_edit)
+
+    def test_messages_are_shown_in_batches(self):
+        self.log.append('first')
+        self.log.append(42)
+        self.assertEqual('', self.text_edit.toPlainText())
+        self.assertTrue(self.log.flush_timer.isActive())
+
+        self.log.flush()
+        lines = self.text_edit.toPlainText().split('\n')
+        self.assertEqual(2, len(lines))
+        self.assertTrue(lines[0].endswith(']: first'))
+        self.assertTrue(lines[1].endswith(']: 42'))
+
+        # Nothing queued, nothing appended
+        self.log.flush()
+        self.assertEqual(2, self.text_edit.blockCount())
+
+    def test_keeps_the_latest_lines(self):
+        for i in range(DebugLog.MAX_BLOCKS + 10):
+            self.log.append(f'message {i}')
+        self.log.flush()
+        self.log.append('last')
+        self.log.flush()
+
+        self.assertEqual(DebugLog.MAX_BLOCKS, self.text_edit.blockCount())
+        self.assertTrue(self.text_edit.document().lastBlock().text().endswith(']: last'))
+        self.assertTrue(self.text_edit.document().firstBlock().text().endswith(']: message 11'))
+
+if __name__ == '__main__':
+    unittest.main()
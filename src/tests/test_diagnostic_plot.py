@@ -0,0 +1,146 @@
+##
+# @file test_diagnostic_plot.py
+# @brief Unit tests for the diagnostic plot widget and its ring buffer.
+##
+
+import os
+import sys
+import unittest
+
+# This is here to make the import work when ran from the main folder
+# in VSCode
+myPath = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, myPath + '/../')
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+import numpy as np
+from PyQt5.QtWidgets import QApplication
+
+from modules.core.diagnostic_plot import DecimationPyramid, DiagnosticData, DiagnosticPlotWidget, \
+                                        RingBuffer
+
+app = QApplication.instance() or QApplication([])
+
+class TestRingBuffer(unittest.TestCase):
+    '''! Defines the unit tests for the RingBuffer class.'''
+
+    def test_keeps_the_latest_samples(self):
+        buffer = RingBuffer(4, 2)
+        self.assertEqual((2, 0), buffer.view().shape)
+
+        for i in range(3):
+            buffer.append([i, 10 * i])
+        self.assertEqual([[0, 1, 2], [0, 10, 20]], buffer.view().tolist())
+
+        for i in range(3, 10):
+            buffer.append([i, 10 * i])
+            self.assertEqual(list(range(max(0, i - 3), i + 1)), buffer.view()[0].tolist())
+
+        self.assertEqual(4, len(buffer))
+
+    def test_view_does_not_copy(self):
+        buffer = RingBuffer(3, 1)
+        for i in range(5):
+            buffer.append([i])
+
+        view = buffer.view()
+        self.assertTrue(np.shares_memory(view, buffer._data))
+        self.assertTrue(view[0].flags['C_CONTIGUOUS'])
+
+class TestDecimationPyramid(unittest.TestCase):
+    '''! Defines the unit tests for the DecimationPyramid class.'''
+
+    def setUp(self):
+        self.pyramid = DecimationPyramid(8, 2, levels=3, factor=2)
+        for t in range(16):
+            self.pyramid.append([t, (-1) ** t * t])
+
+    def test_buckets(self):
+        # Level 1 holds (minimum, maximum) of every two samples, level 2
+        # of every four, each at the time its bucket starts
+        times, values = self.pyramid.levels[1].view()
+        self.assertEqual([0, 0, 2, 2, 4, 4, 6, 6], times.tolist()[:8])
+        self.assertEqual([-1, 0, -3, 2, -5, 4, -7, 6], values.tolist()[:8])
+
+        times, values = self.pyramid.levels[2].view()
+        self.assertEqual([0, 0, 4, 4, 8, 8, 12, 12], times.tolist())
+        self.assertEqual([-3, 2, -7, 6, -11, 10, -15, 14], values.tolist())
+
+    def test_select(self):
+        # The samples hold the range and few enough entries
+        level, entries = self.pyramid.select(10, 15, 10)
+        self.assertEqual(0, level)
+        self.assertEqual(list(range(9, 16)), entries[0].tolist())
+
+        # Too many samples in the range
+        level, entries = self.pyramid.select(9, 15, 4)
+        self.assertEqual(2, level)
+
+        # The samples no longer hold the start of the range
+        level, entries = self.pyramid.select(0, 15, 100)
+        self.assertEqual(1, level)
+        self.assertEqual(16, entries.shape[1])
+
+    def test_select_includes_unfinished_buckets(self):
+        self.pyramid.append([16, 100])
+        self.pyramid.append([17, -100])
+        self.pyramid.append([18, 50])
+
+        level, entries = self.pyramid.select(0, 20, 10)
+        self.assertEqual(2, level)
+        self.assertEqual([16, 16], entries[0, -2:].tolist())
+        self.assertEqual([-100, 100], entries[1, -2:].tolist())
+
+class TestDiagnosticPlotWidget(unittest.TestCase):
+    '''! Defines the unit tests for the DiagnosticPlotWidget class.'''
+
+    def setUp(self):
+        self.widget = DiagnosticPlotWidget(window_seconds=10, capacity=20)
+
+    def tearDown(self):
+        self.widget.close()
+
+    def _add_samples(self, count: int, start: int = 0):
+        for t in range(start, start + count):
+            self.widget.handle_new_data(DiagnosticData(25.0 + t, 3.3, 6.0, 500.0, 400.0), 100.0 + t)
+
+    def test_samples_are_kept_while_hidden(self):
+        self._add_samples(50)
+        self.assertEqual(20, len(self.widget.samples))
+
+        # Drawn once the window is shown, from the sample before the
+        # latest window on
+        self.widget.show()
+        x, y = self.widget.temperature_plot_data.getData()
+        self.assertEqual(list(range(38, 50)), x.tolist())
+        self.assertEqual(74.0, y[-1])
+
+    def test_zooming_out_draws_buckets(self):
+        self.widget.show()
+        self._add_samples(500)
+
+        # Every sample since the start no longer fits, so the plot is
+        # drawn from the minimums and maximums of buckets
+        self.widget.set_window(500)
+        x, y = self.widget.temperature_plot_data.getData()
+        self.assertLess(len(x), 500)
+        self.assertEqual(25.0, y.min())
+        self.assertGreaterEqual(y.max(), 500.0)
+        self.assertNotEqual(0, self.widget._level)
+
+    def test_time_axis_scrolls(self):
+        self.widget.show()
+        view_box = self.widget.vcc_plot.getViewBox()
+
+        self._add_samples(5)
+        self.assertEqual([0, 10], [round(x) for x in view_box.viewRange()[0]])
+
+        self._add_samples(30, 5)
+        self.assertEqual([24, 34], [round(x) for x in view_box.viewRange()[0]])
+
+        self.widget.set_window(60)
+        self.assertEqual([0, 60], [round(x) for x in view_box.viewRange()[0]])
+
+if __name__ == '__main__':
+    unittest.main()
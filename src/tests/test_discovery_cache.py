@@ -0,0 +1,82 @@
+##
+# @file test_discovery_cache.py
+# @brief Unit tests for the DiscoveryCache class.
+##
+
+import os
+import sys
+import unittest
+
+# This is here to make the import work when ran from the main folder
+# in VSCode
+myPath = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, myPath + '/../')
+
+from modules.network.discovery_cache import ConnectionState, DiscoveryCache
+from modules.network.utility import DeviceType
+
+class FakeClock:
+    '''! Clock that only moves when told to.'''
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class TestDiscoveryCache(unittest.TestCase):
+    '''! Defines the unit tests for the DiscoveryCache class.'''
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cache = DiscoveryCache(ttl_sec=10.0, clock=self.clock)
+
+    def test_new_device_triggers_connection(self):
+        self.assertTrue(self.cache.observe('10.0.0.2', DeviceType.DOCKING_STATION))
+        self.assertEqual(ConnectionState.CONNECTING, self.cache.get('10.0.0.2', DeviceType.DOCKING_STATION).state)
+
+    def test_repeated_responses_are_ignored(self):
+        self.cache.observe('10.0.0.2', DeviceType.DOCKING_STATION)
+        self.clock.now = 1.0
+        self.assertFalse(self.cache.observe('10.0.0.2', DeviceType.DOCKING_STATION))
+        self.assertEqual(1.0, self.cache.get('10.0.0.2', DeviceType.DOCKING_STATION).last_seen)
+
+    def test_device_type_is_part_of_key(self):
+        self.cache.observe('10.0.0.2', DeviceType.DOCKING_STATION)
+        self.assertTrue(self.cache.observe('10.0.0.2', DeviceType.CLOUDPLUG))
+        self.assertEqual(2, len(self.cache))
+
+    def test_expired_connection_attempt_is_retried(self):
+        self.cache.observe('10.0.0.2', DeviceType.CLOUDPLUG)
+        self.clock.now = 10.5
+        self.assertTrue(self.cache.observe('10.0.0.2', DeviceType.CLOUDPLUG))
+
+    def test_stuck_attempt_is_retried_while_device_replies(self):
+        self.cache.observe('10.0.0.2', DeviceType.DOCKING_STATION)
+
+        # Replies between broadcasts do not extend the attempt
+        for now in (4.0, 8.0):
+            self.clock.now = now
+            self.assertFalse(self.cache.observe('10.0.0.2', DeviceType.DOCKING_STATION))
+
+        self.clock.now = 10.5
+        self.assertTrue(self.cache.observe('10.0.0.2', DeviceType.DOCKING_STATION))
+        self.assertEqual(10.5, self.cache.get('10.0.0.2', DeviceType.DOCKING_STATION).attempt_started)
+
+        # The new attempt gets the full TTL again
+        self.clock.now = 15.0
+        self.assertFalse(self.cache.observe('10.0.0.2', DeviceType.DOCKING_STATION))
+
+    def test_connected_device_does_not_expire(self):
+        self.cache.observe('10.0.0.2', DeviceType.CLOUDPLUG)
+        self.cache.mark_connected('10.0.0.2', DeviceType.CLOUDPLUG)
+        self.clock.now = 100.0
+        self.assertFalse(self.cache.observe('10.0.0.2', DeviceType.CLOUDPLUG))
+
+    def test_disconnected_device_reconnects(self):
+        self.cache.observe('10.0.0.2', DeviceType.DOCKING_STATION)
+        self.cache.mark_connected('10.0.0.2', DeviceType.DOCKING_STATION)
+        self.cache.mark_disconnected('10.0.0.2', DeviceType.DOCKING_STATION)
+        self.assertTrue(self.cache.observe('10.0.0.2', DeviceType.DOCKING_STATION))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+##
+# @file test_eeprom_dump.py
+# @brief Unit tests for reading EEPROM dumps and importing them.
+##
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+# This is here to make the import work when ran from the main folder
+# in VSCode
+myPath = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, myPath + '/../')
+
+from modules.core.eeprom_dump import parse_dump, read_dump
+from modules.database.sqlite_repository import SQLiteRepository
+from modules.import_eeprom_dumps import find_dump_files, import_dumps
+
+RESOURCES = os.path.join(myPath, '..', 'resources')
+
+class TestEepromDump(unittest.TestCase):
+    '''! Defines the unit tests for reading and importing dumps.'''
+
+    def setUp(self):
+        with open(os.path.join(RESOURCES, 'sfp2.bin'), 'rb') as dump_file:
+            self.base_id = dump_file.read()
+
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def _write(self, name: str, data: bytes) -> str:
+        path = os.path.join(self.directory, name)
+        with open(path, 'wb') as dump_file:
+            dump_file.write(data)
+        return path
+
+    def test_binary_dump_is_padded(self):
+        page_a0, page_a2 = parse_dump(self.base_id)
+
+        self.assertEqual(self.base_id + bytes(192), page_a0)
+        self.assertEqual(bytes(256), page_a2)
+
+    def test_text_dump_matches_binary_dump(self):
+        text_dump = read_dump(os.path.join(RESOURCES, 'sfp_memory_map.bin'))
+        binary_dump = read_dump(os.path.join(RESOURCES, 'sfp2.bin'))
+
+        self.assertIsNone(text_dump.error)
+        self.assertEqual(binary_dump.page_a0, text_dump.page_a0)
+        self.assertEqual(binary_dump.content_hash, text_dump.content_hash)
+
+    def test_invalid_dumps(self):
+        corrupted = bytearray(self.base_id)
+        corrupted[30] ^= 0x01
+
+        for data in (self.base_id[:40], bytes(64), bytes(corrupted), self.base_id * 9):
+            with self.assertRaises(ValueError):
+                parse_dump(data)
+
+        self.assertIsNotNone(read_dump(self._write('empty.bin', b'')).error)
+        self.assertIsNotNone(read_dump(os.path.join(self.directory, 'missing.bin')).error)
+
+    def test_import_dumps(self):
+        with open(os.path.join(RESOURCES, 'sfp3.bin'), 'rb') as dump_file:
+            other = dump_file.read()
+
+        os.mkdir(os.path.join(self.directory, 'vendor'))
+        self._write('a.bin', self.base_id)
+        self._write(os.path.join('vendor', 'b.bin'), other)
+        self._write(os.path.join('vendor', 'copy of a.bin'), self.base_id)
+        self._write('bad.bin', bytes(64))
+        self._write('notes.txt', b'not a dump')
+
+        paths = list(find_dump_files([self.directory]))
+        self.assertEqual(4, len(paths))
+
+        repository = SQLiteRepository(':memory:')
+        messages = []
+
+        summary = import_dumps(repository, paths, workers=2, batch_size=1, report=messages.append)
+        self.assertEqual((2, 1, 1), tuple(summary))
+        self.assertEqual(1, len(messages))
+
+        # Importing again stores nothing new
+        summary = import_dumps(repository, paths, workers=1)
+        self.assertEqual((0, 3, 1), tuple(summary))
+        self.assertEqual(2, len(list(repository.iter_persona_pages_a0())))
+
+        repository.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+##
+# @file test_export_personas.py
+# @brief Unit tests for the persona exporter.
+##
+
+import os
+import sys
+import json
+import shutil
+import tarfile
+import tempfile
+import unittest
+
+# This is here to make the import work when ran from the main folder
+# in VSCode
+myPath = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, myPath + '/../')
+
+from modules.database.repository import PersonaQuery
+from modules.database.sqlite_repository import SQLiteRepository
+from modules.export_personas import export_archive, export_bin, export_jsonl
+from modules.import_eeprom_dumps import find_dump_files, import_dumps
+
+RESOURCES = os.path.join(myPath, '..', 'resources')
+
+class TestExportPersonas(unittest.TestCase):
+    '''! Defines the unit tests for exporting personas.'''
+
+    def setUp(self):
+        self.repository = SQLiteRepository(':memory:')
+        self.directory = tempfile.mkdtemp()
+
+        for name in ('sfp2.bin', 'sfp3.bin'):
+            with open(os.path.join(RESOURCES, name), 'rb') as dump_file:
+                self.repository.add_persona(list(dump_file.read()), [0x5A] * 256)
+
+    def tearDown(self):
+        self.repository.close()
+        shutil.rmtree(self.directory)
+
+    def test_iter_personas_filters(self):
+        personas = list(self.repository.iter_personas(PersonaQuery(vendor_name='OEM')))
+
+        self.assertEqual([2], [persona.id for persona in personas])
+        self.assertEqual([0x5A] * 256, personas[0].page_a2)
+
+    def test_bin_export_imports_again(self):
+        count = export_bin(self.repository.iter_personas(PersonaQuery()), self.directory)
+        self.assertEqual(2, count)
+
+        other_repository = SQLiteRepository(':memory:')
+        summary = import_dumps(other_repository, list(find_dump_files([self.directory])), workers=1)
+        self.assertEqual((2, 0, 0), tuple(summary))
+
+        self.assertEqual(self.repository.get_persona(1), other_repository.get_persona(1))
+        other_repository.close()
+
+    def test_archive_export(self):
+        path = os.path.join(self.directory, 'personas.tar.gz')
+        self.assertEqual(2, export_archive(self.repository.iter_personas(PersonaQuery()), path))
+
+        with tarfile.open(path) as archive:
+            self.assertEqual(['1.bin', '2.bin'], archive.getnames())
+            self.assertEqual(512, len(archive.extractfile('2.bin').read()))
+
+    def test_jsonl_export(self):
+        path = os.path.join(self.directory, 'personas.jsonl')
+        self.assertEqual(2, export_jsonl(self.repository.iter_personas(PersonaQuery()), path))
+
+        with open(path) as jsonl_file:
+            lines = [json.loads(line) for line in jsonl_file]
+
+        self.assertEqual('Raspberry Pi', lines[0]['vendor_name'])
+        self.assertEqual('QFBR-5766LP', lines[0]['part_number'])
+        self.assertEqual('LC (Lucent Connector)', lines[0]['connector'])
+        self.assertEqual(850, lines[0]['wavelength'])
+        self.assertEqual('5a' * 256, lines[1]['page_a2'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+##
+# @file test_memory_page_model.py
+# @brief Unit tests for the hex grid table model.
+##
+
+import os
+import sys
+import unittest
+
+# This is here to make the import work when ran from the main folder
+# in VSCode
+myPath = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, myPath + '/../')
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QApplication
+
+from modules.core.memory_page_model import MemoryPageModel
+
+app = QApplication.instance() or QApplication([])
+
+class TestMemoryPageModel(unittest.TestCase):
+    '''! Defines the unit tests for the MemoryPageModel class.'''
+
+    def setUp(self):
+        self.model = MemoryPageModel()
+        self.page = list(range(256))
+        self.model.set_page(self.page)
+
+        self.changes = []
+        self.model.dataChanged.connect(
+            lambda top_left, bottom_right, roles: self.changes.append((top_left.row(), bottom_right.row()))
+        )
+
+    def _text(self, offset: int) -> str:
+        return self.model.data(self.model.index(offset // 16, offset % 16))
+
+    def test_display_types(self):
+        self.assertEqual((16, 16), (self.model.rowCount(), self.model.columnCount()))
+        self.assertEqual('41', self._text(0x41))
+        self.assertEqual('000000F0', self.model.headerData(15, Qt.Vertical))
+        self.assertEqual('0F', self.model.headerData(15, Qt.Horizontal))
+
+        self.model.set_display_type(MemoryPageModel.DisplayType.DECIMAL)
+        self.assertEqual('65', self._text(0x41))
+
+        self.model.set_display_type(MemoryPageModel.DisplayType.ASCII)
+        self.assertEqual('A', self._text(0x41))
+
+        # Setting the same mode again changes nothing
+        self.model.set_display_type(MemoryPageModel.DisplayType.ASCII)
+        self.assertEqual([(0, 15), (0, 15)], self.changes)
+
+    def test_short_page(self):
+        self.model.set_page([0x12])
+        self.assertEqual('12', self._text(0))
+        self.assertEqual('', self._text(1))
+
+    def test_update_values(self):
+        values = list(self.page)
+        values[0x62] = 0
+        values[0x65] = 0
+        self.model.update_values(values)
+
+        # Only the row holding the changed values is repainted, and the
+        # page buffer the model was given is updated
+        self.assertEqual([(6, 6)], self.changes)
+        self.assertEqual(0, self.page[0x62])
+        self.assertEqual('00', self._text(0x65))
+
+        self.model.update_values(values)
+        self.assertEqual([(6, 6)], self.changes)
+
+if __name__ == '__main__':
+    unittest.main()
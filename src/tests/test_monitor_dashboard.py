@@ -0,0 +1,113 @@
+##
+# @file test_monitor_dashboard.py
+# @brief Unit tests for monitoring several docking stations at once.
+##
+
+import os
+import sys
+import unittest
+
+# This is here to make the import work when ran from the main folder
+# in VSCode
+myPath = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, myPath + '/../')
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5.QtWidgets import QApplication
+
+from modules.core.monitor_dashboard import INIT_A0_REGISTERS, INIT_A2_REGISTERS, MonitorDashboard
+from modules.network.message import MessageCode, ReadRegisterMessage
+
+app = QApplication.instance() or QApplication([])
+
+def _init_a0_reply(vendor_name: str) -> ReadRegisterMessage:
+    # Internally calibrated with digital diagnostics
+    registers = [ord(c) for c in vendor_name.ljust(16)] + [ord(' ')] * 16 + [0x68]
+    return ReadRegisterMessage(MessageCode.DIAGNOSTIC_INIT_A0, "", 0x50, registers)
+
+def _init_a2_reply(temperature: int) -> ReadRegisterMessage:
+    registers = [0] * len(INIT_A2_REGISTERS)
+    # Temperature alarm high at 100 C, warning high at 90 C
+    registers[0] = 100
+    registers[4] = 90
+    # The real-time temperature, register 96
+    registers[92] = temperature
+    return ReadRegisterMessage(MessageCode.DIAGNOSTIC_INIT_A2, "", 0x51, registers)
+
+def _real_time_reply(temperature: int) -> ReadRegisterMessage:
+    registers = [0] * 14
+    registers[0] = temperature
+    return ReadRegisterMessage(MessageCode.REAL_TIME_REFRESH, "", 0x51, registers)
+
+class TestMonitorDashboard(unittest.TestCase):
+    '''! Defines the unit tests for the MonitorDashboard class.'''
+
+    def setUp(self):
+        self.dashboard = MonitorDashboard()
+        self.commands = []
+        self.dashboard.send_command.connect(self.commands.append)
+
+        self.first = self.dashboard.open_session('10.0.0.1')
+        self.second = self.dashboard.open_session('10.0.0.2')
+
+    def tearDown(self):
+        self.dashboard.close_all()
+
+    def test_open_session_reads_the_sfp(self):
+        self.assertEqual(4, len(self.commands))
+        ip, msg = self.commands[0]
+        self.assertEqual('10.0.0.1', ip)
+        self.assertEqual(MessageCode.DIAGNOSTIC_INIT_A0, msg.code)
+        self.assertEqual(INIT_A0_REGISTERS, msg.register_numbers)
+
+        # The refresh timer of a session reads its own docking station
+        self.second.dialog.timed_command.emit()
+        ip, msg = self.commands[-1]
+        self.assertEqual('10.0.0.2', ip)
+        self.assertEqual(MessageCode.REAL_TIME_REFRESH, msg.code)
+
+    def test_sessions_are_independent(self):
+        self.dashboard.handle_init_diagnostic_a0('10.0.0.1', _init_a0_reply('FIRST'))
+        self.dashboard.handle_init_diagnostic_a0('10.0.0.2', _init_a0_reply('SECOND'))
+        self.dashboard.handle_init_diagnostic_a2('10.0.0.1', _init_a2_reply(20))
+        self.dashboard.handle_init_diagnostic_a2('10.0.0.2', _init_a2_reply(50))
+
+        self.assertEqual('FIRST', self.first.dialog.lineEdit.text().strip())
+        self.assertEqual('SECOND', self.second.dialog.lineEdit.text().strip())
+        self.assertEqual(20, self.first.sfp.page_a2[96])
+        self.assertEqual(50, self.second.sfp.page_a2[96])
+
+        # Replies of docking stations without a session are dropped
+        self.dashboard.handle_real_time_refresh('10.0.0.3', _real_time_reply(70))
+
+    def test_repaints_once_per_frame(self):
+        self.dashboard.handle_init_diagnostic_a0('10.0.0.1', _init_a0_reply('FIRST'))
+        self.dashboard.handle_init_diagnostic_a2('10.0.0.1', _init_a2_reply(20))
+        self.dashboard.repaint()
+        self.assertEqual('20.000', self.first.dialog.temperatureLineEdit.text())
+
+        # Several replies between two frames are all kept, but only the
+        # latest is shown, once the frame is drawn
+        for temperature in (30, 40, 95):
+            self.dashboard.handle_real_time_refresh('10.0.0.1', _real_time_reply(temperature))
+
+        self.assertEqual('20.000', self.first.dialog.temperatureLineEdit.text())
+        self.assertEqual(4, len(self.first.dialog.diagnostic_plot_window.samples))
+        self.assertTrue(self.first.dirty)
+        self.assertFalse(self.second.dirty)
+
+        self.dashboard.repaint()
+        self.assertEqual('95.000', self.first.dialog.temperatureLineEdit.text())
+        self.assertFalse(self.first.dirty)
+
+    def test_remote_io_error_closes_the_session(self):
+        self.dashboard.handle_remote_io_error('10.0.0.1', None)
+        self.assertEqual(['10.0.0.2'], list(self.dashboard.sessions))
+        self.assertTrue(self.dashboard.frame_timer.isActive())
+
+        self.dashboard.close_session('10.0.0.2')
+        self.assertFalse(self.dashboard.frame_timer.isActive())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+##
+# @file test_monitor_dialog.py
+# @brief Unit tests for the real-time values of the diagnostic monitoring window.
+##
+
+import os
+import sys
+import unittest
+
+# This is here to make the import work when ran from the main folder
+# in VSCode
+myPath = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, myPath + '/../')
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+import numpy as np
+from PyQt5.QtWidgets import QApplication
+
+from modules.core.monitor_dialog import BAND_STYLE_SHEETS, DiagnosticMonitorDialog, classify_bands
+
+app = QApplication.instance() or QApplication([])
+
+class TestClassifyBands(unittest.TestCase):
+    '''! Defines the unit tests for the classify_bands function.'''
+
+    def test_bands(self):
+        thresholds = np.array([[100, 90, 10, 0]] * 5, dtype=float)
+        values = np.array([100, 95, 50, 10, 0], dtype=float)
+
+        self.assertEqual([0, 1, 2, 3, 4], classify_bands(values, thresholds).tolist())
+
+class TestDiagnosticMonitorDialog(unittest.TestCase):
+    '''! Defines the unit tests for the DiagnosticMonitorDialog class.'''
+
+    def setUp(self):
+        self.dialog = DiagnosticMonitorDialog()
+
+        sfp = self.dialog.associated_sfp
+        # Internally calibrated with digital diagnostics
+        sfp.page_a0[92] = 0x68
+        sfp.force_calibration_check()
+
+        # Temperature alarm high at 100 C, warning high at 90 C, warning
+        # low at 10 C and alarm low at 0 C
+        sfp.page_a2[0] = 100
+        sfp.page_a2[4] = 90
+        sfp.page_a2[6] = 10
+
+        self.dialog.update_alarm_warning_tab()
+
+        self.style_sheets = []
+        set_style_sheet = self.dialog.temperatureLineEdit.setStyleSheet
+        def record_style_sheet(style_sheet):
+            self.style_sheets.append(style_sheet)
+            set_style_sheet(style_sheet)
+        self.dialog.temperatureLineEdit.setStyleSheet = record_style_sheet
+
+    def tearDown(self):
+        self.dialog.close()
+
+    def _show_temperature(self, temperature: int):
+        self.dialog.associated_sfp.page_a2[96] = temperature
+        self.dialog.update_real_time_tab()
+
+    def test_thresholds_are_shown(self):
+        self.assertEqual('100.000', self.dialog.tempHighAlarmLineEdit.text())
+        self.assertEqual('10.000', self.dialog.tempLowWarnLineEdit.text())
+        self.assertEqual([100, 90, 10, 0], self.dialog._thresholds[0].tolist())
+
+    def test_style_sheet_only_changes_with_the_band(self):
+        self._show_temperature(20)
+        self._show_temperature(30)
+        self.assertEqual('30.000', self.dialog.temperatureLineEdit.text())
+        self.assertEqual([BAND_STYLE_SHEETS[2]], self.style_sheets)
+
+        self._show_temperature(95)
+        self._show_temperature(96)
+        self._show_temperature(100)
+        self.assertEqual([BAND_STYLE_SHEETS[i] for i in (2, 1, 0)], self.style_sheets)
+
+        # New thresholds restyle every value
+        self.dialog.update_alarm_warning_tab()
+        self._show_temperature(100)
+        self.assertEqual(BAND_STYLE_SHEETS[0], self.style_sheets[-1])
+        self.assertEqual(4, len(self.style_sheets))
+
+    def test_tec_current_uses_its_own_thresholds(self):
+        sfp = self.dialog.associated_sfp
+        # TEC current low warning, laser temperature low warning differs
+        sfp.page_a2[54:56] = [0x00, 0x20]
+        sfp.page_a2[46:48] = [0x05, 0x00]
+        self.dialog.update_alarm_warning_tab()
+
+        self.assertEqual(round(float(sfp.get_optional_tec_current_low_warning()), 3),
+                         self.dialog._thresholds[6][2])
+        self.assertEqual(self.dialog.tecCurrentLowWarnLineEdit.text(),
+                         f'{self.dialog._thresholds[6][2]:.3f}')
+
+    def test_unsupported_values_lose_their_band(self):
+        self._show_temperature(20)
+        self.assertNotEqual('', self.dialog.laserTempLineEdit.styleSheet())
+
+        # No longer internally calibrated
+        sfp = self.dialog.associated_sfp
+        sfp.page_a0[92] = 0x58
+        sfp.force_calibration_check()
+        self._show_temperature(20)
+
+        for line_edit in (self.dialog.laserTempLineEdit, self.dialog.tecCurrentLineEdit):
+            self.assertEqual('Not supported', line_edit.text())
+            self.assertEqual('', line_edit.styleSheet())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+##
+# @file test_open_repository.py
+# @brief Unit tests for opening the process-wide repository.
+##
+
+import os
+import sys
+import unittest
+from unittest import mock
+
+# This is here to make the import work when ran from the main folder
+# in VSCode
+myPath = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, myPath + '/../')
+
+from modules.database import repository
+
+MYSQL_SETTINGS = {'backend': 'mysql', 'sqlite_path': ''}
+
+class TestOpenRepository(unittest.TestCase):
+    '''! Defines the unit tests for open_repository().'''
+
+    def test_mysql_schema_is_updated_on_open(self):
+        with mock.patch.object(repository, 'get_database_settings', return_value=MYSQL_SETTINGS), \
+                mock.patch('modules.database.mysql_repository.MySQLRepository') as mysql_repository:
+            opened = repository.open_repository()
+
+        self.assertIs(mysql_repository.return_value, opened)
+        opened.create_schema.assert_called_once_with()
+
+    def test_schema_error_names_the_migration_command(self):
+        with mock.patch.object(repository, 'get_database_settings', return_value=MYSQL_SETTINGS), \
+                mock.patch('modules.database.mysql_repository.MySQLRepository') as mysql_repository:
+            mysql_repository.return_value.create_schema.side_effect = Exception('ALTER command denied')
+
+            with self.assertRaisesRegex(Exception, 'python -m modules.migrate_persona_schema'):
+                repository.open_repository()
+
+if __name__ == '__main__':
+    unittest.main()
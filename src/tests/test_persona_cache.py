@@ -0,0 +1,72 @@
+##
+# @file test_persona_cache.py
+# @brief Unit tests for the LRU persona cache.
+##
+
+import os
+import sys
+import unittest
+
+# This is here to make the import work when ran from the main folder
+# in VSCode
+myPath = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, myPath + '/../')
+
+from modules.database.persona_cache import PersonaCache
+from modules.database.sqlite_repository import SQLiteRepository
+
+PAGE = bytes(256)
+
+class TestPersonaCache(unittest.TestCase):
+    '''! Defines the unit tests for the PersonaCache class.'''
+
+    def test_least_recently_used_is_dropped(self):
+        cache = PersonaCache(max_entries=2)
+        cache.put(1, PAGE, PAGE)
+        cache.put(2, PAGE, PAGE)
+
+        cache.get(1)
+        cache.put(3, PAGE, PAGE)
+
+        self.assertIsNotNone(cache.get(1))
+        self.assertIsNone(cache.get(2))
+        self.assertIsNotNone(cache.get(3))
+
+    def test_size_limit(self):
+        cache = PersonaCache(max_bytes=3 * 512)
+        for persona_id in range(5):
+            cache.put(persona_id, PAGE, PAGE)
+
+        self.assertEqual(3, len(cache))
+        self.assertIsNone(cache.get(1))
+        self.assertIsNotNone(cache.get(4))
+
+    def test_invalidate(self):
+        cache = PersonaCache()
+        cache.put(1, PAGE, PAGE)
+        cache.invalidate([1])
+
+        self.assertIsNone(cache.get(1))
+        self.assertEqual(0, len(cache))
+
+    def test_repository_reads_through_cache(self):
+        repository = SQLiteRepository(':memory:')
+        persona_id = repository.add_persona([1] * 256, [2] * 256)
+
+        first = repository.get_persona(persona_id)
+        self.assertEqual(1, repository.persona_cache.misses)
+
+        first.page_a0[0] = 99
+        second = repository.get_persona(persona_id)
+        self.assertEqual(1, repository.persona_cache.hits)
+        self.assertEqual([1] * 256, second.page_a0)
+        self.assertEqual([2] * 256, repository.get_page(persona_id, 0xA2))
+
+        other_id = repository.add_persona([3] * 256, [4] * 256)
+        personas = repository.get_personas([persona_id, other_id, 1234])
+        self.assertEqual({persona_id, other_id}, set(personas))
+
+        repository.close()
+
+if __name__ == '__main__':
+    unittest.main()
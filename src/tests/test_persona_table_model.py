@@ -0,0 +1,188 @@
+##
+# @file test_persona_table_model.py
+# @brief Unit tests for the lazily loaded persona table model.
+##
+
+import os
+import sys
+import time
+import unittest
+
+# This is here to make the import work when ran from the main folder
+# in VSCode
+myPath = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, myPath + '/../')
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QApplication
+
+from modules.core.database_worker import DatabaseWorker
+from modules.core.persona_table_model import PersonaTableModel
+from modules.database.sqlite_repository import SQLiteRepository
+
+app = QApplication.instance() or QApplication([])
+
+class TestPersonaTableModel(unittest.TestCase):
+    '''! Defines the unit tests for the PersonaTableModel class.'''
+
+    def setUp(self):
+        self.repository = SQLiteRepository(':memory:')
+
+        for wavelength in range(600):
+            self._add_persona(wavelength)
+
+        self.model = PersonaTableModel(self.repository)
+
+    def _add_persona(self, wavelength: int, serial_number: bytes = b'') -> int:
+        page_a0 = [0] * 256
+        page_a0[2] = 0x07
+        page_a0[20:36] = b'VENDOR'.ljust(16)
+        page_a0[60:62] = [wavelength >> 8, wavelength & 0xFF]
+        page_a0[68:84] = serial_number.ljust(16)
+        return self.repository.add_persona(page_a0, [])
+
+    def tearDown(self):
+        self.repository.close()
+
+    def test_fetches_one_page_at_a_time(self):
+        self.assertEqual(0, self.model.rowCount())
+
+        self.model.refresh()
+        self.assertEqual(PersonaTableModel.FETCH_SIZE, self.model.rowCount())
+        self.assertTrue(self.model.canFetchMore())
+
+        while self.model.canFetchMore():
+            self.model.fetchMore()
+
+        self.assertEqual(600, self.model.rowCount())
+        self.assertEqual(list(range(1, 601)), [self.model.persona_id(row) for row in range(600)])
+        self.assertIsNone(self.model.legacy_id(0))
+
+    def test_display_values(self):
+        self.model.refresh()
+
+        self.assertEqual('1', self.model.data(self.model.index(0, 0)))
+        self.assertEqual('VENDOR', self.model.data(self.model.index(0, 1)))
+        self.assertEqual('LC (Lucent Connector)', self.model.data(self.model.index(0, 4)))
+        self.assertEqual('Wavelength (nm)', self.model.headerData(5, Qt.Horizontal))
+
+    def test_sort_is_done_by_the_database(self):
+        self.model.sort(5, Qt.DescendingOrder)
+
+        self.assertEqual(PersonaTableModel.FETCH_SIZE, self.model.rowCount())
+        self.assertEqual('599', self.model.data(self.model.index(0, 5)))
+        self.assertEqual(600, self.model.persona_id(0))
+
+    def test_new_personas_are_merged(self):
+        self.model.sort(5, Qt.DescendingOrder)
+
+        # Sorts before the loaded rows, so it is merged in at the top
+        top = self._add_persona(1000)
+        # Sorts after the loaded rows, so it is left for fetchMore()
+        bottom = self._add_persona(0, b'SECOND')
+
+        found = []
+        self.model.new_rows_found.connect(found.append)
+
+        self.model.fetch_new_rows()
+        self.assertEqual(PersonaTableModel.FETCH_SIZE + 1, self.model.rowCount())
+        self.assertEqual(top, self.model.persona_id(0))
+
+        self.model.fetch_new_rows()
+        self.assertEqual([2, 0], found)
+
+        while self.model.canFetchMore():
+            self.model.fetchMore()
+
+        ids = [self.model.persona_id(row) for row in range(self.model.rowCount())]
+        self.assertEqual(602, len(set(ids)))
+        self.assertEqual(602, len(ids))
+        # Ties in wavelength are sorted by ID in the same direction
+        self.assertEqual([bottom, 1], ids[-2:])
+
+    def _wait_until_loaded(self, model: PersonaTableModel):
+        deadline = time.monotonic() + 10
+        while model.is_loading() and time.monotonic() < deadline:
+            app.processEvents()
+            time.sleep(0.001)
+
+        self.assertFalse(model.is_loading())
+
+    def test_queries_run_on_the_worker(self):
+        worker = DatabaseWorker()
+        model = PersonaTableModel(self.repository, worker=worker)
+
+        loading = []
+        model.loading_changed.connect(loading.append)
+
+        # Nothing is added until the event loop delivers the rows
+        model.refresh()
+        self.assertEqual(0, model.rowCount())
+        self.assertFalse(model.canFetchMore())
+
+        self._wait_until_loaded(model)
+        self.assertEqual(PersonaTableModel.FETCH_SIZE, model.rowCount())
+
+        # Sorting again drops the rows of the first query
+        model.refresh()
+        model.sort(5, Qt.DescendingOrder)
+        self._wait_until_loaded(model)
+        self.assertEqual(PersonaTableModel.FETCH_SIZE, model.rowCount())
+        self.assertEqual(600, model.persona_id(0))
+
+        model.fetchMore()
+        model.fetchMore()
+        self._wait_until_loaded(model)
+        self.assertEqual(2 * PersonaTableModel.FETCH_SIZE, model.rowCount())
+
+        # The dropped query stops loading as soon as it is dropped
+        self.assertEqual([True, False] * 4, loading)
+        worker.shutdown()
+
+    def test_new_personas_wait_for_the_first_page(self):
+        worker = DatabaseWorker()
+        model = PersonaTableModel(self.repository, worker=worker)
+
+        found = []
+        model.new_rows_found.connect(found.append)
+
+        # A clone finishing while the first page is read must not merge
+        # the whole table
+        model.refresh()
+        model.fetch_new_rows()
+        self._wait_until_loaded(model)
+
+        self.assertEqual(PersonaTableModel.FETCH_SIZE, model.rowCount())
+        self.assertEqual([0], found)
+        self.assertTrue(model.canFetchMore())
+
+        # Requested again before the page of a new refresh arrives. The
+        # new persona is read with the first page, so none is new.
+        new_id = self._add_persona(1000)
+        model.refresh()
+        model.fetch_new_rows()
+        self._wait_until_loaded(model)
+
+        self.assertEqual(PersonaTableModel.FETCH_SIZE, model.rowCount())
+        self.assertEqual(new_id, model._last_seen_id)
+        self.assertEqual([0, 0], found)
+        worker.shutdown()
+
+    def test_failed_query_is_reported(self):
+        self.repository.close()
+        self.repository = SQLiteRepository(':memory:')
+        self.repository._connection().execute("DROP TABLE personas")
+
+        errors = []
+        self.model = PersonaTableModel(self.repository)
+        self.model.load_failed.connect(errors.append)
+
+        self.model.refresh()
+        self.assertEqual(1, len(errors))
+        self.assertFalse(self.model.is_loading())
+        self.assertEqual(0, self.model.rowCount())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,176 @@
+##
+# @file test_sql_connection_pool.py
+# @brief Unit tests for the SQLConnectionPool class.
+##
+
+import os
+import sys
+import unittest
+
+# This is here to make the import work when ran from the main folder
+# in VSCode
+myPath = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, myPath + '/../')
+
+from modules.network.sql_connection import SQLConnection, SQLConnectionPool, Statement
+
+class FakePreparedCursor:
+    '''! Stands in for a mysql.connector prepared cursor.'''
+    def __init__(self):
+        self.executed = []
+        self.prepares = 0
+        self.closed = False
+        self._sql = None
+
+    def execute(self, sql, params=()):
+        # Like mysql.connector, the statement is prepared again unless
+        # the same string object is run
+        if sql is not self._sql:
+            self._sql = sql
+            self.prepares += 1
+        self.executed.append((sql, params))
+
+    def fetchall(self):
+        return [self.executed[-1][1]]
+
+    def close(self):
+        self.closed = True
+
+class FakeConnection:
+    '''! Stands in for a mysql.connector connection.'''
+    def __init__(self):
+        self.healthy = True
+        self.closed = False
+        self.pings = 0
+        self.prepared_cursors = []
+
+    def ping(self, reconnect=False):
+        self.pings += 1
+        if not self.healthy:
+            raise Exception('Lost connection')
+
+    def cursor(self, prepared=False):
+        if prepared:
+            cursor = FakePreparedCursor()
+            self.prepared_cursors.append(cursor)
+            return cursor
+        return None
+
+    def close(self):
+        self.closed = True
+
+class FakeClock:
+    '''! Clock that only moves when told to.'''
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class TestSQLConnectionPool(unittest.TestCase):
+    '''! Defines the unit tests for the SQLConnectionPool class.'''
+
+    def setUp(self):
+        self.opened = []
+        self.clock = FakeClock()
+        self.pool = SQLConnectionPool(2, 60.0, self._connect, self.clock)
+
+    def _connect(self):
+        connection = FakeConnection()
+        self.opened.append(connection)
+        return connection
+
+    def test_connection_is_reused(self):
+        with self.pool.connection() as db:
+            first = db.connection
+
+        with self.pool.connection() as db:
+            self.assertIs(first, db.connection)
+
+        self.assertEqual(1, len(self.opened))
+        self.assertEqual(1, self.pool.idle_count())
+
+    def test_checkout_waits_until_timeout_when_exhausted(self):
+        a = self.pool.acquire()
+        b = self.pool.acquire()
+
+        with self.assertRaises(Exception):
+            self.pool.acquire(timeout=0)
+
+        a.close()
+        c = self.pool.acquire(timeout=0)
+        self.assertEqual(2, len(self.opened))
+
+        b.close()
+        c.close()
+
+    def test_unhealthy_connection_is_replaced(self):
+        with self.pool.connection() as db:
+            first = db.connection
+
+        first.healthy = False
+        self.clock.now = 5.0
+
+        with self.pool.connection() as db:
+            self.assertIsNot(first, db.connection)
+
+        self.assertTrue(first.closed)
+
+    def test_recently_used_connection_is_not_pinged(self):
+        with self.pool.connection() as db:
+            first = db.connection
+
+        with self.pool.connection():
+            pass
+
+        self.assertEqual(0, first.pings)
+
+    def test_idle_connection_is_evicted(self):
+        with self.pool.connection() as db:
+            first = db.connection
+
+        self.clock.now = 61.0
+
+        with self.pool.connection() as db:
+            self.assertIsNot(first, db.connection)
+
+        self.assertTrue(first.closed)
+
+    def test_prepared_statements_are_reused_across_checkouts(self):
+        statement = Statement('get_persona', 'SELECT page_a0 FROM personas WHERE id=%s')
+
+        with self.pool.connection() as db:
+            self.assertEqual([(1,)], db.query(statement, (1,)))
+
+        with self.pool.connection() as db:
+            self.assertEqual([(2,)], db.query(statement, (2,)))
+
+        connection = self.opened[0]
+        self.assertEqual(1, len(connection.prepared_cursors))
+        self.assertEqual(2, len(connection.prepared_cursors[0].executed))
+
+    def test_equal_dynamic_sql_is_prepared_once(self):
+        with self.pool.connection() as db:
+            for i in range(3):
+                # A new, equal string each time, like a built search query
+                sql = ''.join(['SELECT id FROM personas ', 'WHERE id > %s'])
+                db.query(Statement('search_personas', sql), (i,))
+
+        cursors = self.opened[0].prepared_cursors
+        self.assertEqual(1, len(cursors))
+        self.assertEqual(1, cursors[0].prepares)
+        self.assertEqual(3, len(cursors[0].executed))
+
+    def test_prepared_statements_are_limited(self):
+        with self.pool.connection() as db:
+            for i in range(SQLConnection.PREPARED_STATEMENT_LIMIT + 1):
+                db.execute(Statement(f'statement_{i}', f'SELECT {i}'))
+
+            # The least recently used statement is closed when one
+            # statement too many is prepared
+            cursors = self.opened[0].prepared_cursors
+            self.assertTrue(cursors[0].closed)
+            self.assertFalse(cursors[1].closed)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,202 @@
+##
+# @file test_sqlite_repository.py
+# @brief Unit tests for the SQLite storage repository.
+##
+
+import os
+import sys
+import sqlite3
+import tempfile
+import unittest
+
+# This is here to make the import work when ran from the main folder
+# in VSCode
+myPath = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, myPath + '/../')
+
+from modules.database.repository import PersonaQuery, StressScenario, TelemetrySample, transceiver_bit
+from modules.database.sqlite_repository import SQLiteRepository
+
+class TestSQLiteRepository(unittest.TestCase):
+    '''! Defines the unit tests for the SQLiteRepository class.'''
+
+    def setUp(self):
+        self.repository = SQLiteRepository(':memory:')
+        self.page_a0 = [i % 256 for i in range(256)]
+        self.page_a2 = [(255 - i) % 256 for i in range(256)]
+
+    def tearDown(self):
+        self.repository.close()
+
+    def test_add_and_get_persona(self):
+        persona_id = self.repository.add_persona(self.page_a0, self.page_a2)
+        persona = self.repository.get_persona(persona_id)
+
+        self.assertEqual(persona_id, persona.id)
+        self.assertEqual(self.page_a0, persona.page_a0)
+        self.assertEqual(self.page_a2, persona.page_a2)
+        self.assertEqual(self.page_a2, self.repository.get_page(persona_id, 0xA2))
+
+    def test_missing_persona(self):
+        self.assertIsNone(self.repository.get_persona(1234))
+        self.assertIsNone(self.repository.get_page(1234, 0xA0))
+
+    def test_short_pages_are_padded(self):
+        persona_id = self.repository.add_persona([3, 4, 7], [])
+        persona = self.repository.get_persona(persona_id)
+
+        self.assertEqual([3, 4, 7] + [0] * 253, persona.page_a0)
+        self.assertEqual([0] * 256, persona.page_a2)
+
+    def test_iter_persona_pages_a0(self):
+        first = self.repository.add_persona(self.page_a0, self.page_a2)
+        second = self.repository.add_persona(self.page_a2, self.page_a0)
+
+        rows = list(self.repository.iter_persona_pages_a0())
+        self.assertEqual([(first, self.page_a0), (second, self.page_a2)], rows)
+
+    def test_identical_personas_are_stored_once(self):
+        first = self.repository.add_persona(self.page_a0, self.page_a2)
+
+        # A second clone of the module only differs in its real-time values
+        page_a2 = list(self.page_a2)
+        page_a2[96:128] = [0] * 32
+        self.assertEqual(first, self.repository.add_persona(self.page_a0, page_a2))
+
+        page_a2[95] = 0
+        second = self.repository.add_persona(self.page_a0, page_a2)
+        self.assertNotEqual(first, second)
+
+        pages = [(bytes(self.page_a0), bytes(self.page_a2)), (bytes(self.page_a2), bytes(self.page_a0))]
+        self.assertEqual(1, self.repository.add_personas(pages + pages))
+        self.assertEqual(0, self.repository.add_personas(pages))
+        self.assertEqual(3, len(list(self.repository.iter_persona_pages_a0())))
+
+    def test_duplicates_are_merged_on_upgrade(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'personas.db')
+
+            # A database from before the content hash was unique
+            connection = sqlite3.connect(path)
+            connection.executescript(
+                "CREATE TABLE personas (id INTEGER PRIMARY KEY AUTOINCREMENT, page_a0 BLOB NOT NULL, "
+                "page_a2 BLOB NOT NULL, content_hash BLOB);"
+                "CREATE INDEX personas_content_hash ON personas (content_hash);"
+                "CREATE TABLE stress_scenarios (stress_id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "sfp_id INTEGER NOT NULL REFERENCES personas(id) ON DELETE CASCADE, "
+                "scenario_name TEXT, scenario_values BLOB NOT NULL);"
+            )
+            page_a0 = bytes(self.page_a0)
+            connection.executemany(
+                "INSERT INTO personas (page_a0, page_a2) VALUES (?, ?)",
+                [(page_a0, bytes(256)), (page_a0, bytes(255) + b'\x01'), (page_a0, bytes(256))]
+            )
+            connection.execute("INSERT INTO stress_scenarios (sfp_id, scenario_values) VALUES (3, x'0102')")
+            connection.commit()
+            connection.close()
+
+            repository = SQLiteRepository(path)
+            try:
+                self.assertEqual([1, 2], [row[0] for row in repository.iter_persona_pages_a0()])
+                self.assertEqual(1, repository.list_stress_scenarios(1)[0].sfp_id)
+                self.assertEqual(1, repository.add_persona(list(page_a0), []))
+            finally:
+                repository.close()
+
+    def test_persona_index_columns(self):
+        page_a0 = [0] * 256
+        page_a0[20:36] = b'FINISAR CORP.   '
+        page_a0[40:56] = b'FTLF8519P2BNL   '
+        page_a0[60:62] = [0x03, 0x52]
+        persona_id = self.repository.add_persona(page_a0, self.page_a2)
+
+        row = self.repository._connection().execute(
+            "SELECT vendor_name, part_number, serial_number, wavelength FROM personas WHERE id=?",
+            (persona_id,)
+        ).fetchone()
+        self.assertEqual(('FINISAR CORP.', 'FTLF8519P2BNL', '', 850), row)
+
+    def _add_module(self, vendor_name: bytes, part_number: bytes, wavelength: int,
+                    connector: int = 0x07, transceiver_byte_3: int = 0,
+                    serial_number: bytes = b'') -> int:
+        page_a0 = [0] * 256
+        page_a0[0] = 0x03
+        page_a0[2] = connector
+        page_a0[3] = transceiver_byte_3
+        page_a0[20:36] = vendor_name.ljust(16)
+        page_a0[40:56] = part_number.ljust(16)
+        page_a0[60:62] = [wavelength >> 8, wavelength & 0xFF]
+        page_a0[68:84] = serial_number.ljust(16)
+        return self.repository.add_persona(page_a0, self.page_a2)
+
+    def test_search_personas(self):
+        finisar_sr = self._add_module(b'FINISAR CORP.', b'FTLX8571D3BCL', 850, transceiver_byte_3=0x10)
+        finisar_lr = self._add_module(b'FINISAR CORP.', b'FTLX1471D3BCL', 1310, transceiver_byte_3=0xA0)
+        cisco = self._add_module(b'CISCO', b'SFP-10G_SR', 850, connector=0x22)
+
+        def search(**criteria):
+            return [summary.id for summary in self.repository.search_personas(PersonaQuery(**criteria))]
+
+        self.assertEqual([finisar_sr, finisar_lr], search(vendor_name='FINISAR CORP.'))
+        self.assertEqual([finisar_sr, finisar_lr], search(vendor_name='finisar corp.'))
+        self.assertEqual([], search(vendor_name='FINISAR'))
+        self.assertEqual([finisar_sr, finisar_lr], search(vendor_name='FIN', prefix=True))
+        self.assertEqual([finisar_lr], search(part_number='FTLX14', prefix=True))
+        self.assertEqual([cisco], search(part_number='SFP-10G_', prefix=True))
+        self.assertEqual([], search(part_number='SFP-10G%', prefix=True))
+        self.assertEqual([finisar_sr, cisco], search(min_wavelength=800, max_wavelength=900))
+        self.assertEqual([finisar_lr], search(min_wavelength=1000))
+        self.assertEqual([cisco], search(connector=0x22))
+        self.assertEqual([finisar_sr, finisar_lr, cisco], search(identifier=0x03))
+        self.assertEqual([finisar_sr], search(transceiver_mask=transceiver_bit(3, 4)))
+        self.assertEqual([finisar_lr], search(transceiver_mask=transceiver_bit(3, 7)))
+
+        summary = self.repository.search_personas(PersonaQuery(connector=0x22))[0]
+        # A local database has no legacy page tables
+        self.assertEqual(('CISCO', 'SFP-10G_SR', '', 0x03, 0x22, 850, None), tuple(summary[1:]))
+
+        with self.assertRaises(ValueError):
+            self.repository.search_personas(PersonaQuery(), order_by='legacy_id')
+
+    def test_search_personas_paging(self):
+        ids = [self._add_module(b'VENDOR', b'PART', 850, serial_number=str(i).encode()) for i in range(5)]
+
+        self.assertEqual(ids[:2], [p.id for p in self.repository.search_personas(PersonaQuery(), limit=2)])
+        self.assertEqual(ids[2:4], [p.id for p in self.repository.search_personas(PersonaQuery(), 2, 2)])
+
+    def test_search_uses_indexes(self):
+        connection = self.repository._connection()
+
+        for sql in ("SELECT id FROM personas WHERE vendor_name LIKE 'FIN%' ESCAPE '!'",
+                    "SELECT id FROM personas WHERE wavelength >= 800 AND wavelength <= 900"):
+            plan = ' '.join(row[-1] for row in connection.execute('EXPLAIN QUERY PLAN ' + sql))
+            self.assertIn('USING', plan)
+            self.assertIn('INDEX', plan)
+
+    def test_stress_scenarios(self):
+        persona_id = self.repository.add_persona(self.page_a0, self.page_a2)
+        waveform = bytes(range(256)) * 40
+        stress_id = self.repository.add_stress_scenario(persona_id, 'hot', 0, 1000, waveform)
+
+        scenarios = self.repository.list_stress_scenarios(persona_id)
+        self.assertEqual([StressScenario(stress_id, persona_id, 'hot', 0, 1000, 5120)], scenarios)
+
+        chunks = list(self.repository.iter_stress_waveform(stress_id, chunk_samples=1000))
+        self.assertEqual([2000, 2000, 2000, 2000, 2000, 240], [len(chunk) for chunk in chunks])
+        self.assertEqual(waveform, b''.join(chunks))
+        self.assertEqual([], list(self.repository.iter_stress_waveform(stress_id + 1)))
+
+        for bad_waveform in (b'', b'\x19'):
+            with self.assertRaises(ValueError):
+                self.repository.add_stress_scenario(persona_id, 'bad', 0, 1000, bad_waveform)
+
+    def test_telemetry_range_query(self):
+        samples = [TelemetrySample('dock-1', float(t), 25.0 + t, 3.3, 6.0, 0.5, 0.4) for t in range(10)]
+        self.repository.add_telemetry_samples(samples)
+
+        result = self.repository.get_telemetry_samples('dock-1', 2.0, 5.0)
+        self.assertEqual(samples[2:5], result)
+        self.assertEqual([], self.repository.get_telemetry_samples('dock-2', 0.0, 10.0))
+
+if __name__ == '__main__':
+    unittest.main()
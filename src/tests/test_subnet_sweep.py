@@ -0,0 +1,51 @@
+##
+# @file test_subnet_sweep.py
+# @brief Unit tests for the SubnetSweepWorker class.
+##
+
+import os
+import sys
+import unittest
+from unittest import mock
+
+# This is here to make the import work when ran from the main folder
+# in VSCode
+myPath = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, myPath + '/../')
+
+from modules.network.network_threads import SubnetSweepWorker
+
+class TestSubnetSweepWorker(unittest.TestCase):
+    '''! Defines the unit tests for the SubnetSweepWorker class.'''
+
+    def test_malformed_ranges_are_skipped(self):
+        with self.assertLogs(level='ERROR'):
+            worker = SubnetSweepWorker(cidrs=['10.1.4.0/30', '10.1.4.0/33', 'lab'], rate=10, interval_sec=1)
+
+        self.assertEqual(['10.1.4.0/30'], [str(network) for network in worker.networks])
+        self.assertTrue(worker.is_enabled())
+
+    def test_no_valid_ranges_disables_the_sweep(self):
+        with self.assertLogs(level='ERROR'):
+            worker = SubnetSweepWorker(cidrs=['300.0.0.0/24'], rate=10, interval_sec=1)
+
+        self.assertFalse(worker.is_enabled())
+
+    def test_malformed_rate_and_interval_use_the_defaults(self):
+        environment = {SubnetSweepWorker.RATE_ENV_VAR: 'fast', SubnetSweepWorker.INTERVAL_ENV_VAR: '1m'}
+        with mock.patch.dict(os.environ, environment), self.assertLogs(level='ERROR'):
+            worker = SubnetSweepWorker(cidrs=['10.1.4.0/30'])
+
+        self.assertEqual(SubnetSweepWorker.DEFAULT_RATE, worker.rate)
+        self.assertEqual(SubnetSweepWorker.DEFAULT_INTERVAL_SEC, worker.interval_sec)
+
+    def test_non_positive_interval_uses_the_default(self):
+        environment = {SubnetSweepWorker.RATE_ENV_VAR: '20', SubnetSweepWorker.INTERVAL_ENV_VAR: '0'}
+        with mock.patch.dict(os.environ, environment), self.assertLogs(level='ERROR'):
+            worker = SubnetSweepWorker(cidrs=['10.1.4.0/30'])
+
+        self.assertEqual(20, worker.rate)
+        self.assertEqual(SubnetSweepWorker.DEFAULT_INTERVAL_SEC, worker.interval_sec)
+
+if __name__ == '__main__':
+    unittest.main()
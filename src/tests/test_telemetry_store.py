@@ -0,0 +1,103 @@
+##
+# @file test_telemetry_store.py
+# @brief Unit tests for the write-behind telemetry store and its rollups.
+##
+
+import os
+import sys
+import unittest
+
+# This is here to make the import work when ran from the main folder
+# in VSCode
+myPath = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, myPath + '/../')
+
+from modules.database.repository import TelemetryRollup, TelemetrySample
+from modules.database.sqlite_repository import SQLiteRepository
+from modules.database.telemetry_store import TelemetryStore
+
+def _sample(timestamp: float, temperature: float, module_id: str = 'dock-1') -> TelemetrySample:
+    return TelemetrySample(module_id, timestamp, temperature, 3.3, 6.0, 500.0, 400.0)
+
+class TestTelemetryStore(unittest.TestCase):
+    '''! Defines the unit tests for the TelemetryStore class.'''
+
+    def setUp(self):
+        self.repository = SQLiteRepository(':memory:')
+        self.store = TelemetryStore(self.repository, flush_interval=60)
+
+    def tearDown(self):
+        self.store.close()
+        self.repository.close()
+
+    def test_samples_are_written_on_close(self):
+        samples = [_sample(1000.0 + t / 2, 20.0 + t) for t in range(10)]
+        for sample in samples:
+            self.store.record(sample)
+
+        self.store.close()
+        self.assertEqual(samples, self.repository.get_telemetry_samples('dock-1', 0, 2000))
+
+        with self.assertRaises(Exception):
+            self.store.record(samples[0])
+
+    def test_rollups(self):
+        # Two seconds of samples, then the same minute written later on
+        for t in range(4):
+            self.store._add(_sample(120.0 + t / 2, 20.0 + t))
+        self.assertTrue(self.store.flush())
+
+        self.store._add(_sample(150.0, 10.0))
+        self.assertTrue(self.store.flush())
+
+        seconds = self.repository.get_telemetry_rollups('dock-1', 1, 0, 200)
+        self.assertEqual([120.0, 121.0, 150.0], [rollup.start for rollup in seconds])
+        self.assertEqual((2, 20.0, 21.0, 20.5), (seconds[0].count, seconds[0].temperature_min,
+                                                seconds[0].temperature_max, seconds[0].temperature_mean))
+
+        minute = self.repository.get_telemetry_rollups('dock-1', 60, 0, 200)
+        self.assertEqual(1, len(minute))
+        self.assertEqual(TelemetryRollup('dock-1', 60, 120.0, 5, 10.0, 23.0, 19.2, 3.3, 3.3, 3.3,
+                                         6.0, 6.0, 6.0, 500.0, 500.0, 500.0, 400.0, 400.0, 400.0),
+                         minute[0])
+
+        hour = self.repository.get_telemetry_rollups('dock-1', 3600, 0, 7200)
+        self.assertEqual([5], [rollup.count for rollup in hour])
+
+    def test_history_resolution(self):
+        for t in range(0, 7200, 10):
+            self.store._add(_sample(float(t), 25.0))
+        self.store.flush()
+
+        self.assertEqual(100, len(self.store.get_history('dock-1', 0, 1000, max_points=1000)))
+        self.assertEqual(17, len(self.store.get_history('dock-1', 0, 1000, max_points=100)))
+        self.assertEqual(2, len(self.store.get_history('dock-1', 0, 7200, max_points=10)))
+
+    def test_failed_write_is_retried(self):
+        self.repository.close()
+        broken = SQLiteRepository(':memory:')
+        broken._connection().execute("DROP TABLE telemetry_samples")
+        store = TelemetryStore(broken)
+
+        store._add(_sample(1.0, 20.0))
+        self.assertFalse(store.flush())
+
+        broken.create_schema()
+        self.assertTrue(store.flush())
+        self.assertEqual(1, len(broken.get_telemetry_samples('dock-1', 0, 10)))
+        self.assertEqual(1, len(broken.get_telemetry_rollups('dock-1', 1, 0, 10)))
+
+    def test_failed_writes_back_off(self):
+        store = TelemetryStore(self.repository, flush_interval=1.0)
+
+        delays = []
+        for _ in range(8):
+            store._update_flush_delay(False)
+            delays.append(store._flush_delay)
+        self.assertEqual([2.0, 4.0, 8.0, 16.0, 32.0, 60.0, 60.0, 60.0], delays)
+
+        store._update_flush_delay(True)
+        self.assertEqual(1.0, store._flush_delay)
+
+if __name__ == '__main__':
+    unittest.main()